@@ -0,0 +1,37 @@
+"""Gunicorn settings for EPMPulse.
+
+The API is I/O bound (state file writes, Slack calls on the canvas worker),
+so a few processes with several threads each serve far more concurrent
+requests than the same number of sync workers, at a fraction of the memory.
+Gunicorn picks this file up automatically from the working directory; every
+value can be overridden with the environment variables below or on the
+command line.
+"""
+
+import multiprocessing
+import os
+
+
+bind = "{}:{}".format(
+    os.environ.get("EPMPULSE_HOST", "0.0.0.0"),
+    os.environ.get("EPMPULSE_PORT", "18800"),
+)
+
+# Threaded workers: each thread handles one request, blocking I/O releases the GIL
+worker_class = os.environ.get("EPMPULSE_WORKER_CLASS", "gthread")
+workers = int(os.environ.get(
+    "EPMPULSE_WORKERS", min(multiprocessing.cpu_count(), 4)
+))
+threads = int(os.environ.get("EPMPULSE_THREADS", "8"))
+
+# Workers inherit this, so each takes its share of the per-token Slack budget
+os.environ["EPMPULSE_WORKERS"] = str(workers)
+
+timeout = 30
+keepalive = 5
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.environ.get("EPMPULSE_LOG_LEVEL", "info").lower()
+
+wsgi_app = "src.app:create_app()"
@@ -0,0 +1,60 @@
+# EPMPulse canvas build profiler
+"""Time and profile a full canvas rebuild for a synthetic dashboard."""
+
+import cProfile
+import pstats
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.slack.blocks import build_canvas_state
+
+
+def build_sample_state(apps: int, domains: int) -> dict:
+    """Build state data with the given number of apps and domains per app.
+
+    Args:
+        apps: Number of applications
+        domains: Number of domains per application
+
+    Returns:
+        State dictionary as produced by State.to_dict()
+    """
+    updated = '2024-01-01T00:00:00Z'
+    return {
+        'last_updated': updated,
+        'apps': {
+            f'App{a}': {
+                'display_name': f'App {a}',
+                'domains': {
+                    f'Domain{d}': {'status': 'OK', 'job_id': str(d), 'updated': updated}
+                    for d in range(domains)
+                }
+            }
+            for a in range(apps)
+        }
+    }
+
+
+def main():
+    """Main entry point."""
+    apps = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    domains = int(sys.argv[2]) if len(sys.argv) > 2 else 6
+    state = build_sample_state(apps, domains)
+
+    runs = 2000
+    seconds = timeit.timeit(lambda: build_canvas_state(state), number=runs)
+    print(f"{apps} apps x {domains} domains: {seconds / runs * 1e6:.1f} us per rebuild")
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    for _ in range(runs):
+        build_canvas_state(state)
+    profiler.disable()
+    pstats.Stats(profiler).sort_stats('cumulative').print_stats(10)
+
+
+if __name__ == '__main__':
+    main()
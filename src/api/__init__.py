@@ -3,5 +3,6 @@
 
 from .validators import StatusUpdateRequest, BatchStatusUpdateRequest
 from .errors import error_response, register_error_handlers
+from .routes import api_v1
 
-__all__ = ["StatusUpdateRequest", "BatchStatusUpdateRequest", "error_response", "register_error_handlers"]
+__all__ = ["api_v1", "StatusUpdateRequest", "BatchStatusUpdateRequest", "error_response", "register_error_handlers"]
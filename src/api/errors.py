@@ -1,8 +1,18 @@
 """Error handlers and response formatters for EPMPulse API."""
 
-from flask import jsonify
+import functools
+
+from flask import Response, jsonify
 from typing import Dict, Any
 
+from .json_provider import dumps_bytes
+
+
+@functools.lru_cache(maxsize=256)
+def _error_body(code: str, message: str) -> bytes:
+    """Serialize a detail-less error envelope once per (code, message)."""
+    return dumps_bytes({'success': False, 'error': {'code': code, 'message': message}})
+
 
 def error_response(code: str, message: str, details: Dict[str, Any] = None, status_code: int = None) -> tuple:
     """Create standard error response.
@@ -22,17 +32,23 @@ def error_response(code: str, message: str, details: Dict[str, Any] = None, stat
     elif status_code is None:
         status_code = 400
     
+    # Envelopes without details are content-invariant; reuse their bytes
+    if not details:
+        return Response(
+            _error_body(code, message),
+            status=status_code,
+            mimetype='application/json'
+        ), status_code
+    
     response = {
         'success': False,
         'error': {
             'code': code,
-            'message': message
+            'message': message,
+            'details': details
         }
     }
     
-    if details:
-        response['error']['details'] = details
-    
     return jsonify(response), status_code
 
 
@@ -91,6 +107,37 @@ ERROR_CODES = {
 }
 
 
+# Pre-serialize the default envelope for every known error code
+for _code, _info in ERROR_CODES.items():
+    _error_body(_code, _info['message'])
+
+
+# HTTP errors whose envelope never varies: (http status, error code, message)
+_STATIC_ERROR_HANDLERS = (
+    (401, 'MISSING_AUTH', 'Missing or invalid Authorization header'),
+    (403, 'INVALID_KEY', 'Invalid API key'),
+    (404, 'NOT_FOUND', 'Resource not found'),
+    (429, 'RATE_LIMITED', 'Rate limit exceeded'),
+    (500, 'STATE_ERROR', 'Internal server error'),
+    (502, 'SLACK_ERROR', 'Slack API call failed'),
+)
+
+
+def _make_static_handler(code: str, message: str):
+    """Build an error handler that serves a pre-serialized envelope.
+    
+    A new Response wraps the shared bytes on each call because after-request
+    hooks (e.g. rate-limit headers) mutate the response object.
+    """
+    body = _error_body(code, message)
+    status_code = ERROR_CODES[code]['status']
+    
+    def handler(error):
+        return Response(body, status=status_code, mimetype='application/json')
+    
+    return handler
+
+
 def register_error_handlers(app):
     """Register custom error handlers with Flask app.
     
@@ -106,44 +153,5 @@ def register_error_handlers(app):
             {'description': str(error.description)}
         )
     
-    @app.errorhandler(401)
-    def unauthorized(error):
-        return error_response(
-            'MISSING_AUTH',
-            'Missing or invalid Authorization header'
-        )
-    
-    @app.errorhandler(403)
-    def forbidden(error):
-        return error_response(
-            'INVALID_KEY',
-            'Invalid API key'
-        )
-    
-    @app.errorhandler(404)
-    def not_found(error):
-        return error_response(
-            'NOT_FOUND',
-            'Resource not found'
-        )
-    
-    @app.errorhandler(429)
-    def rate_limited(error):
-        return error_response(
-            'RATE_LIMITED',
-            'Rate limit exceeded'
-        )
-    
-    @app.errorhandler(500)
-    def internal_error(error):
-        return error_response(
-            'STATE_ERROR',
-            'Internal server error'
-        )
-    
-    @app.errorhandler(502)
-    def bad_gateway(error):
-        return error_response(
-            'SLACK_ERROR',
-            'Slack API call failed'
-        )
+    for http_status, code, message in _STATIC_ERROR_HANDLERS:
+        app.register_error_handler(http_status, _make_static_handler(code, message))
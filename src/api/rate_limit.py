@@ -0,0 +1,187 @@
+"""Rate limiter storage and strategy configuration for EPMPulse.
+
+With several gunicorn workers an in-memory limiter enforces the configured
+limit once per process. A shared Redis backend (``EPMPULSE_REDIS_URL``)
+makes enforcement global; if Redis cannot be reached at startup the API
+degrades to per-process memory storage instead of refusing to start;
+if it fails later, Flask-Limiter's in-memory fallback takes over until
+the storage check passes again.
+
+Limits are enforced with GCRA (generic cell rate algorithm), registered
+as the ``gcra`` strategy for Flask-Limiter. Each client is tracked by one
+theoretical arrival time (TAT) instead of per-window counters, so there is
+no double burst at window boundaries and storage is O(1) per key.
+"""
+
+import logging
+import math
+import threading
+import time
+from typing import Dict, Optional
+
+from limits import RateLimitItem
+from limits.errors import ConfigurationError
+from limits.storage import RedisStorage, Storage, storage_from_string
+from limits.strategies import STRATEGIES, RateLimiter
+from limits.util import WindowStats
+
+
+logger = logging.getLogger("epmpulse.api")
+
+MEMORY_STORAGE_URI = "memory://"
+
+
+def resolve_storage_uri(storage_uri: str) -> str:
+    """Return a usable limiter storage URI, falling back to memory.
+
+    Args:
+        storage_uri: Configured storage URI (e.g. redis://localhost:6379/0)
+
+    Returns:
+        The configured URI if its backend responds, otherwise memory://
+    """
+    if not storage_uri or storage_uri == MEMORY_STORAGE_URI:
+        return MEMORY_STORAGE_URI
+
+    try:
+        if storage_from_string(storage_uri).check():
+            return storage_uri
+        reason = "storage check failed"
+    except ConfigurationError as e:
+        # Unknown scheme or missing client library (e.g. redis not installed)
+        reason = str(e)
+    except Exception as e:
+        reason = str(e)
+
+    # Log only the scheme; the URI may carry credentials
+    logger.warning(
+        "Rate limit storage %s:// unavailable (%s); using in-memory storage",
+        storage_uri.split("://", 1)[0], reason
+    )
+    return MEMORY_STORAGE_URI
+
+
+# Atomic GCRA admission: read TAT, advance it by the cost, store it only if
+# the request fits within the burst tolerance. Returns {admitted, TAT} so
+# the caller can build rate-limit headers without a second round-trip.
+# Times are float seconds; TAT is returned as a string since Redis
+# truncates Lua numbers to integers.
+GCRA_HIT_LUA = """
+local now = tonumber(ARGV[1])
+local increment = tonumber(ARGV[2])
+local period = tonumber(ARGV[3])
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if not tat or tat < now then
+    tat = now
+end
+local new_tat = tat + increment
+if new_tat - now > period then
+    return {0, tostring(tat)}
+end
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil((new_tat - now) * 1000))
+return {1, tostring(new_tat)}
+"""
+
+
+class GCRARateLimiter(RateLimiter):
+    """GCRA strategy: one TAT per key, emission interval = period / amount.
+
+    A client may send ``amount`` requests at once, then one request per
+    emission interval. On Redis the admission check is a single Lua script;
+    other storages keep TATs in process memory under a lock.
+
+    Flask-Limiter asks for window stats right after each hit to fill the
+    X-RateLimit headers; the TAT returned by the script is kept per thread
+    and consumed by that call, so a request costs one Redis round-trip.
+    """
+
+    MAX_LOCAL_KEYS = 10000  # expired TATs are pruned past this size
+
+    def __init__(self, storage: Storage):
+        super().__init__(storage)
+        self._lock = threading.Lock()
+        self._tats: Dict[str, float] = {}
+        self._hit_script = None
+        self._last_hit = threading.local()
+        if isinstance(storage, RedisStorage):
+            self._hit_script = storage.get_connection().register_script(GCRA_HIT_LUA)
+
+    @staticmethod
+    def _params(item: RateLimitItem, cost: int):
+        """Return (period, emission interval, TAT increment) in seconds."""
+        period = float(item.get_expiry())
+        interval = period / item.amount
+        return period, interval, interval * max(cost, 1)
+
+    def _key(self, item: RateLimitItem, identifiers) -> str:
+        key = item.key_for(*identifiers)
+        if self._hit_script is not None:
+            return self.storage.prefixed_key(key)
+        return key
+
+    def _get_tat(self, key: str) -> Optional[float]:
+        if self._hit_script is not None:
+            last = self._last_hit.__dict__.pop("entry", None)
+            if last is not None and last[0] == key:
+                return last[1]
+            value = self.storage.get_connection(True).get(key)
+            return float(value) if value is not None else None
+        return self._tats.get(key)
+
+    def _prune(self, now: float) -> None:
+        """Drop TATs already in the past (caller holds the lock)."""
+        if len(self._tats) > self.MAX_LOCAL_KEYS:
+            self._tats = {k: v for k, v in self._tats.items() if v > now}
+
+    def hit(self, item: RateLimitItem, *identifiers: str, cost: int = 1) -> bool:
+        """Consume ``cost`` from the limit if it fits the burst tolerance."""
+        period, _, increment = self._params(item, cost)
+        key = self._key(item, identifiers)
+        now = time.time()
+
+        if self._hit_script is not None:
+            admitted, tat = self._hit_script(keys=[key], args=[now, increment, period])
+            self._last_hit.entry = (key, float(tat))
+            return bool(admitted)
+
+        with self._lock:
+            new_tat = max(self._tats.get(key, now), now) + increment
+            if new_tat - now > period:
+                return False
+            self._tats[key] = new_tat
+            self._prune(now)
+        return True
+
+    def test(self, item: RateLimitItem, *identifiers: str, cost: int = 1) -> bool:
+        """Check whether ``cost`` would be admitted, without consuming it."""
+        period, _, increment = self._params(item, cost)
+        now = time.time()
+        tat = self._get_tat(self._key(item, identifiers)) or now
+        return max(tat, now) + increment - now <= period
+
+    def get_window_stats(self, item: RateLimitItem, *identifiers: str) -> WindowStats:
+        """Report requests still admissible now and when the next one fits.
+
+        While requests remain, the reset time is when the client's budget is
+        fully replenished; once exhausted it is when the next request will be
+        admitted, so Retry-After is no longer than necessary.
+        """
+        period, interval, _ = self._params(item, 1)
+        now = time.time()
+        tat = max(self._get_tat(self._key(item, identifiers)) or now, now)
+        remaining = min(item.amount, max(0, math.floor((period - (tat - now)) / interval)))
+        if remaining:
+            return WindowStats(tat, remaining)
+        return WindowStats(tat - period + interval, 0)
+
+    def clear(self, item: RateLimitItem, *identifiers: str) -> None:
+        """Forget the TAT for this key."""
+        key = self._key(item, identifiers)
+        if self._hit_script is not None:
+            self.storage.get_connection().delete(key)
+            return
+        with self._lock:
+            self._tats.pop(key, None)
+
+
+STRATEGIES.setdefault("gcra", GCRARateLimiter)
@@ -1,52 +1,110 @@
 """Flask routes for EPMPulse API."""
 
-from flask import Blueprint, jsonify, request, current_app
-from typing import Dict, Any, Optional
+import functools
+import hashlib
+import os
+import time
+
+from flask import Blueprint, Response, g, jsonify, request, current_app
+from typing import Callable, Dict, Any, Optional, Tuple
 from datetime import datetime
 from pydantic import ValidationError
 from functools import wraps
 
-from ..config import get_config
+from ..config import StateConfig, get_config
 from ..state.manager import StateManager, StateError
 from ..slack.client import SlackClient
 from ..slack.canvas import CanvasManager
-from ..utils.decorators import require_api_key
-from .validators import StatusUpdateRequest, BatchStatusUpdateRequest
+from ..slack.debouncer import CanvasDebouncer, PendingUpdates
+from ..slack.worker import CanvasWorker
+from ..utils.decorators import check_api_key
+from ..utils.logging_config import get_rate_limited_logger
+from .validators import VALID_APPS, parse_status_update, parse_batch_update
 from .errors import error_response, ERROR_CODES
+from .json_provider import dumps_bytes
+
+# Identical canvas warnings are emitted at most once per second
+canvas_logger = get_rate_limited_logger("epmpulse.canvas", interval=1.0)
 
 # Create API blueprint
 api_v1 = Blueprint('api_v1', __name__, url_prefix='/api/v1')
 
+# Endpoints reachable without an API key
+PUBLIC_ENDPOINTS = frozenset({'api_v1.health_check'})
+
+
+@api_v1.before_request
+def _authenticate():
+    """Authenticate every API request once, before routing to the view."""
+    if request.endpoint in PUBLIC_ENDPOINTS:
+        return None
+    
+    error = check_api_key()
+    if error is not None:
+        return error
+    g.authed = True
+    return None
+
 
 # Global limiter reference (set by app factory)
 _limiter = None
 
 
+# Per-route limits recorded at import, bound once a limiter exists
+_route_limits: Dict[Callable, Tuple[str, Callable]] = {}
+_limited_views: Dict[Callable, Callable] = {}
+
+
 def set_limiter(limiter_instance):
-    """Set the global limiter instance from app factory."""
+    """Set the global limiter instance from app factory.
+    
+    Binds every limit declared with @rate_limit to the new limiter.
+    """
     global _limiter
     _limiter = limiter_instance
+    _limited_views.clear()
+    if _limiter is not None:
+        for view, (limit_string, f) in _route_limits.items():
+            _limited_views[view] = _limiter.limit(limit_string)(f)
 
 
 def rate_limit(limit_string: str):
     """Rate limit decorator that works with Flask-Limiter.
     
-    Returns a proper Flask-Limiter limit decorator if limiter is initialized,
-    otherwise returns a no-op passthrough decorator.
+    Route modules are imported before the app factory creates the limiter,
+    so the view dispatches at call time to the Flask-Limiter wrapper bound
+    in set_limiter(). Without a limiter the original view runs unchanged.
     """
     def decorator(f):
-        if _limiter is not None:
-            return _limiter.limit(limit_string)(f)
-        return f
+        @functools.wraps(f)
+        def view(*args, **kwargs):
+            return _limited_views.get(view, f)(*args, **kwargs)
+        _route_limits[view] = (limit_string, f)
+        return view
     return decorator
 
 
-# Global state manager
-_state_manager = StateManager()
+# Global state manager (initialized on first use)
+_state_manager: Optional[StateManager] = None
 
 # Slack integration (initialized on first use)
 _slack_client: Optional[SlackClient] = None
 _canvas_manager: Optional[CanvasManager] = None
+_canvas_debouncer: Optional[CanvasDebouncer] = None
+_canvas_worker: Optional[CanvasWorker] = None
+
+
+def _get_state_manager() -> StateManager:
+    """Get or initialize state manager."""
+    global _state_manager
+    if _state_manager is None:
+        state_config = StateConfig.from_env()
+        _state_manager = StateManager(
+            state_file=state_config.state_file,
+            write_behind=state_config.write_behind_ms / 1000 or None,
+            multi_process=state_config.multi_process
+        )
+    return _state_manager
 
 
 def _get_slack_client() -> SlackClient:
@@ -61,21 +119,137 @@ def _get_canvas_manager() -> CanvasManager:
     """Get or initialize Canvas manager."""
     global _canvas_manager
     if _canvas_manager is None:
-        _canvas_manager = CanvasManager(_get_slack_client())
+        _canvas_manager = CanvasManager(_get_slack_client(), _get_state_manager())
     return _canvas_manager
 
 
-def _format_domain_response(domain):
-    """Format Domain object for API response."""
-    return {
-        'app': None,  # Will be filled by caller
-        'domain': None,  # Will be filled by caller
-        'status': domain.status,
-        'job_id': domain.job_id,
-        'message': domain.message,
-        'updated': domain.updated,
-        'duration_sec': domain.duration_sec
-    }
+def _process_canvas_updates(updates: PendingUpdates) -> None:
+    """Push coalesced domain updates to the Slack canvas (worker thread)."""
+    canvas_mgr = _get_canvas_manager()
+    for (app_name, domain_name), status in updates.items():
+        canvas_mgr.update_canvas_for_domain(app_name, domain_name, status)
+
+
+def _get_canvas_worker() -> CanvasWorker:
+    """Get or initialize (and start) the background canvas worker."""
+    global _canvas_worker
+    if _canvas_worker is None:
+        _canvas_worker = CanvasWorker(_process_canvas_updates)
+        _canvas_worker.start()
+    return _canvas_worker
+
+
+def _get_canvas_debouncer() -> CanvasDebouncer:
+    """Get or initialize the canvas update debouncer."""
+    global _canvas_debouncer
+    if _canvas_debouncer is None:
+        _canvas_debouncer = CanvasDebouncer(_get_canvas_worker().submit)
+    return _canvas_debouncer
+
+
+def start_canvas_updates() -> None:
+    """Start the canvas debouncer and worker thread (called from app factory)."""
+    _get_canvas_worker().start()
+    _get_canvas_debouncer().start()
+
+
+def _reset_process_state() -> None:
+    """Drop per-process singletons in a freshly forked child.
+    
+    Under a preloading server (gunicorn --preload) the master may have
+    created these before forking. Their threads do not survive the fork and
+    their file handles and HTTP sessions must not be shared, so each worker
+    rebuilds them lazily on first use.
+    """
+    global _state_manager, _slack_client, _canvas_manager
+    global _canvas_debouncer, _canvas_worker, _slack_health
+    _state_manager = None
+    _slack_client = None
+    _canvas_manager = None
+    _canvas_debouncer = None
+    _canvas_worker = None
+    _slack_health = None
+
+
+os.register_at_fork(after_in_child=_reset_process_state)
+
+
+def stop_canvas_updates(flush: bool = True, timeout: Optional[float] = None) -> None:
+    """Stop canvas updates, delivering pending ones first by default.
+    
+    Args:
+        flush: If True, hand pending debounced updates to the worker first
+        timeout: Seconds to wait for the worker thread to drain
+    """
+    if _canvas_debouncer is not None:
+        _canvas_debouncer.stop(flush=flush)
+    if _canvas_worker is not None:
+        _canvas_worker.stop(timeout=timeout)
+
+
+# Slack connectivity is probed at most once per interval
+SLACK_HEALTH_CHECK_INTERVAL = 30.0  # seconds
+_HEALTHY_SLACK_CHECKS = frozenset({'ok', 'not_configured'})
+_slack_health: Optional[tuple] = None  # (checked_at monotonic, result)
+
+
+def _check_slack_api() -> str:
+    """Return the Slack health check result, cached for a short interval."""
+    global _slack_health
+    now = time.monotonic()
+    if _slack_health is not None and now - _slack_health[0] < SLACK_HEALTH_CHECK_INTERVAL:
+        return _slack_health[1]
+    
+    try:
+        client = _get_slack_client()
+        if not client.is_configured():
+            result = 'not_configured'
+        elif client.test_connection():
+            result = 'ok'
+        else:
+            result = 'error: connection test failed'
+    except Exception as e:
+        result = f'error: {str(e)}'
+    
+    _slack_health = (now, result)
+    return result
+
+
+@functools.lru_cache(maxsize=8)
+def _status_body(
+    state_mgr: StateManager,
+    version: tuple,
+    app_name: Optional[str] = None
+) -> Optional[Tuple[bytes, str]]:
+    """Serialized GET /status (or /status/<app>) body for a state version.
+    
+    Args:
+        state_mgr: State manager to read from
+        version: StateManager.version() token the body is cached under
+        app_name: App to serialize, or None for all apps
+        
+    Returns:
+        Tuple of (JSON bytes, ETag value), or None if the app is not in the state
+    """
+    if app_name is None:
+        result = state_mgr.get_all()
+    else:
+        result = state_mgr.get_app(app_name)
+        if result is None:
+            return None
+    body = dumps_bytes({'success': True, 'data': result})
+    # Content hash, so every worker derives the same tag for the same state
+    return body, hashlib.blake2b(body, digest_size=12).hexdigest()
+
+
+def _conditional_response(body: bytes, etag: str) -> Response:
+    """Return 304 if the client already has this body, else the body."""
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype='application/json')
+    response.set_etag(etag, weak=True)
+    return response
 
 
 @api_v1.route('/health', methods=['GET'])
@@ -89,24 +263,18 @@ def health_check():
     
     # Check state file
     try:
-        state = _state_manager.get()
+        state = _get_state_manager().read()
         checks['last_update'] = state.last_updated
     except StateError as e:
         checks['state_file'] = f'error: {str(e)}'
     
-    # Check Slack connection
-    try:
-        client = _get_slack_client()
-        if not client.is_configured():
-            checks['slack_api'] = 'not_configured'
-        else:
-            # Simple test call
-            client.test_connection()
-            checks['slack_api'] = 'ok'
-    except Exception as e:
-        checks['slack_api'] = f'error: {str(e)}'
+    # Check Slack connection (cached so probes don't hammer Slack)
+    checks['slack_api'] = _check_slack_api()
     
-    all_healthy = all(v == 'ok' for v in checks.values() if v not in ['not_configured', checks['last_update']])
+    all_healthy = (
+        checks['state_file'] == 'ok'
+        and checks['slack_api'] in _HEALTHY_SLACK_CHECKS
+    )
     
     return jsonify({
         'success': True,
@@ -118,18 +286,18 @@ def health_check():
 
 
 @api_v1.route('/status', methods=['POST'])
-@require_api_key
 @rate_limit("60 per minute")
 def update_status():
     """Update a single app/domain status."""
     # Validate request
     try:
-        data = request.get_json()
-        if data is None:
+        # Malformed or missing bodies come back as None instead of raising
+        data = request.get_json(silent=True, cache=False)
+        if not isinstance(data, dict):
             return error_response('INVALID_REQUEST', 'Invalid JSON payload')
         
-        # Validate with Pydantic
-        validated = StatusUpdateRequest(**data)
+        # Fast path for well-formed payloads, Pydantic otherwise
+        validated = parse_status_update(data)
     except ValidationError as e:
         # Extract validation error messages
         errors = e.errors()
@@ -145,12 +313,10 @@ def update_status():
         
         # Default to invalid request for other validation errors
         return error_response('INVALID_REQUEST', f'Validation error: {str(errors)}')
-    except Exception as e:
-        return error_response('INVALID_REQUEST', str(e))
     
     # Update state
     try:
-        domain = _state_manager.update(
+        domain = _get_state_manager().update(
             app_name=validated.app,
             domain_name=validated.domain,
             status=validated.status,
@@ -165,22 +331,21 @@ def update_status():
             'status': domain.status,
             'job_id': domain.job_id,
             'updated': domain.updated,
-            'canvas_updated': False
+            'canvas_updated': False,
+            'canvas_queued': False
         }
         
-        # Update Slack canvas
-        canvas_updated = False
+        # Queue Slack canvas update; the debouncer flushes it off the request path
         try:
-            canvas_mgr = _get_canvas_manager()
-            canvas_updated = canvas_mgr.update_canvas_for_domain(
+            _get_canvas_debouncer().enqueue(
                 validated.app,
                 validated.domain,
                 validated.status
             )
-            response_data['canvas_updated'] = canvas_updated
+            response_data['canvas_queued'] = True
         except Exception as e:
             # Log warning but don't fail the request
-            print(f"Warning: Canvas update failed: {e}")
+            canvas_logger.warning("Canvas update failed: %s", e)
         
         return jsonify({
             'success': True,
@@ -194,18 +359,18 @@ def update_status():
 
 
 @api_v1.route('/status/batch', methods=['POST'])
-@require_api_key
 @rate_limit("20 per minute")
 def batch_update_status():
     """Update multiple app/domain statuses."""
     # Validate request
     try:
-        data = request.get_json()
-        if data is None:
+        # Malformed or missing bodies come back as None instead of raising
+        data = request.get_json(silent=True, cache=False)
+        if not isinstance(data, dict):
             return error_response('INVALID_REQUEST', 'Invalid JSON payload')
         
-        # Validate with Pydantic
-        validated = BatchStatusUpdateRequest(**data)
+        # Validate with Pydantic (cached adapter)
+        validated = parse_batch_update(data)
     except ValidationError as e:
         # Extract validation error messages
         errors = e.errors()
@@ -218,41 +383,29 @@ def batch_update_status():
                 return error_response('INVALID_REQUEST', f'Invalid updates: {msg}')
         
         return error_response('INVALID_REQUEST', f'Validation error: {str(errors)}')
-    except Exception as e:
-        return error_response('INVALID_REQUEST', str(e))
     
     # Batch update
     try:
-        result = _state_manager.batch_update([
-            {
-                'app': update.app,
-                'domain': update.domain,
-                'status': update.status,
-                'job_id': update.job_id,
-                'message': update.message
-            }
-            for update in validated.updates
-        ])
+        result = _get_state_manager().batch_update(validated.updates)
         
-        canvas_updated = False
+        canvas_queued = False
         try:
-            canvas_mgr = _get_canvas_manager()
-            for update in validated.updates:
-                canvas_mgr.update_canvas_for_domain(
-                    update.app,
-                    update.domain,
-                    update.status
-                )
-            canvas_updated = True
+            # One lock acquisition for the whole batch
+            _get_canvas_debouncer().enqueue_many(
+                (update.app, update.domain, update.status)
+                for update in validated.updates
+            )
+            canvas_queued = True
         except Exception as e:
-            print(f"Warning: Canvas update failed: {e}")
+            canvas_logger.warning("Canvas update failed: %s", e)
         
         return jsonify({
             'success': True,
             'data': {
                 'updated_count': result['updated_count'],
                 'updates': result['updates'],
-                'canvas_updated': canvas_updated
+                'canvas_updated': False,
+                'canvas_queued': canvas_queued
             }
         }), 200
         
@@ -263,52 +416,53 @@ def batch_update_status():
 
 
 @api_v1.route('/status', methods=['GET'])
-@require_api_key
 @rate_limit("100 per minute")
 def get_all_statuses():
     """Get all current statuses."""
     # Get state
     try:
-        result = _state_manager.get_all()
-        return jsonify({
-            'success': True,
-            'data': result
-        }), 200
+        state_mgr = _get_state_manager()
+        body, etag = _status_body(state_mgr, state_mgr.version())
+        return _conditional_response(body, etag)
     except StateError as e:
         return error_response('STATE_ERROR', str(e))
 
 
-@api_v1.route('/status/<app_name>', methods=['GET'])
-@require_api_key
+# Unknown apps fail URL matching (404) before the view runs
+_APP_NAME_CONVERTER = f"any({', '.join(sorted(VALID_APPS))})"
+
+
+@api_v1.route(f'/status/<{_APP_NAME_CONVERTER}:app_name>', methods=['GET'])
 @rate_limit("100 per minute")
 def get_app_status(app_name: str):
     """Get status for a specific app."""
-    # Validate app name
-    if app_name not in {'Planning', 'FCCS', 'ARCS'}:
-        return error_response('INVALID_APP', 'App must be one of: Planning, FCCS, ARCS')
-    
     # Get app status
     try:
-        result = _state_manager.get_app(app_name)
-        if result is None:
+        state_mgr = _get_state_manager()
+        cached = _status_body(state_mgr, state_mgr.version(), app_name)
+        if cached is None:
             return error_response('NOT_FOUND', f'App "{app_name}" not found')
         
-        return jsonify({
-            'success': True,
-            'data': result
-        }), 200
+        return _conditional_response(*cached)
     except StateError as e:
         return error_response('STATE_ERROR', str(e))
 
 
+# A sync request fails rather than waiting out the Slack rate limit
+CANVAS_SYNC_TIMEOUT = 5.0  # seconds
+
+
 @api_v1.route('/canvas/sync', methods=['POST'])
-@require_api_key
 @rate_limit("10 per minute")
 def sync_canvas():
-    """Force canvas synchronization."""
+    """Force canvas synchronization.
+    
+    Unchanged documents are not re-sent unless ?force=true is given.
+    """
     try:
         canvas_mgr = _get_canvas_manager()
-        canvas_id = canvas_mgr.sync_canvas()
+        force = request.args.get('force', '').lower() in ('1', 'true', 'yes')
+        canvas_id = canvas_mgr.sync_canvas(force=force, timeout=CANVAS_SYNC_TIMEOUT)
         
         return jsonify({
             'success': True,
@@ -319,18 +473,3 @@ def sync_canvas():
         }), 200
     except Exception as e:
         return error_response('SLACK_ERROR', str(e))
-
-
-# Convenience methods for direct import
-def create_app():
-    """Create Flask application with all routes registered."""
-    from flask import Flask
-    
-    app = Flask(__name__)
-    app.register_blueprint(api_v1)
-    
-    # Register error handlers
-    from .errors import register_error_handlers
-    register_error_handlers(app)
-    
-    return app
@@ -1,13 +1,31 @@
 """Pydantic validators for EPMPulse API requests."""
 
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List
+import functools
+
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+from typing import Optional, List, Dict, Any
 from datetime import datetime
 import re
 
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 
-VALID_STATUSES = {"Blank", "Loading", "OK", "Warning"}
-VALID_APPS = {"Planning", "FCCS", "ARCS"}
+VALID_STATUSES = frozenset({"Blank", "Loading", "OK", "Warning"})
+VALID_APPS = frozenset({"Planning", "FCCS", "ARCS"})
+MAX_MESSAGE_LENGTH = 200
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_iso(v: str) -> None:
+    """Check an ISO 8601 timestamp, memoized since jobs repeat timestamps.
+    
+    Raises:
+        ValueError: If the string is not ISO 8601 (failures are not cached)
+    """
+    datetime.fromisoformat(v.replace('Z', '+00:00'))
 
 
 class StatusUpdateRequest(BaseModel):
@@ -39,7 +57,7 @@ class StatusUpdateRequest(BaseModel):
     @classmethod
     def validate_message(cls, v: Optional[str]) -> Optional[str]:
         """Validate message length."""
-        if v and len(v) > 200:
+        if v and len(v) > MAX_MESSAGE_LENGTH:
             raise ValueError("Message must be 200 characters or less")
         return v
     
@@ -49,7 +67,7 @@ class StatusUpdateRequest(BaseModel):
         """Validate timestamp format."""
         if v:
             try:
-                datetime.fromisoformat(v.replace('Z', '+00:00'))
+                _parse_iso(v)
             except ValueError:
                 raise ValueError("Timestamp must be ISO 8601 format")
         return v
@@ -82,3 +100,152 @@ class ErrorResponse(BaseModel):
     """Standard error response model."""
     success: bool = False
     error: dict
+
+
+
+# Adapters are built once at import so schema compilation is not repeated
+_STATUS_ADAPTER = TypeAdapter(StatusUpdateRequest)
+_BATCH_ADAPTER = TypeAdapter(BatchStatusUpdateRequest)
+
+
+def _fast_status_update(data: Dict[str, Any]) -> Optional[StatusUpdateRequest]:
+    """Build a StatusUpdateRequest without running Pydantic validation.
+    
+    Only payloads whose fields are all trivially valid take this path;
+    anything else (including any timestamp, which needs parsing) returns
+    None so the caller falls back to full validation.
+    
+    Args:
+        data: Decoded JSON payload
+        
+    Returns:
+        StatusUpdateRequest or None if the payload needs full validation
+    """
+    app = data.get('app')
+    status = data.get('status')
+    domain = data.get('domain', 'default')
+    job_id = data.get('job_id')
+    message = data.get('message')
+    
+    if (
+        app in VALID_APPS
+        and status in VALID_STATUSES
+        and type(domain) is str
+        and (job_id is None or type(job_id) is str)
+        and (message is None or (type(message) is str and len(message) <= MAX_MESSAGE_LENGTH))
+        and data.get('timestamp') is None
+    ):
+        return StatusUpdateRequest.model_construct(
+            app=app,
+            domain=domain,
+            status=status,
+            job_id=job_id,
+            message=message,
+            timestamp=None
+        )
+    return None
+
+
+def parse_status_update(data: Dict[str, Any]) -> StatusUpdateRequest:
+    """Validate a single status update payload.
+    
+    Args:
+        data: Decoded JSON payload
+        
+    Returns:
+        Validated StatusUpdateRequest
+        
+    Raises:
+        ValidationError: If the payload is invalid
+    """
+    return _fast_status_update(data) or _STATUS_ADAPTER.validate_python(data)
+
+
+# JSON schema accepting a strict subset of what BatchStatusUpdateRequest
+# accepts, so a schema pass can skip per-item model validation entirely
+_NULLABLE_STRING = {"type": ["string", "null"]}
+BATCH_SCHEMA = {
+    "type": "object",
+    "required": ["updates"],
+    "properties": {
+        "updates": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["app", "status"],
+                "properties": {
+                    "app": {"enum": sorted(VALID_APPS)},
+                    "status": {"enum": sorted(VALID_STATUSES)},
+                    "domain": {"type": "string"},
+                    "job_id": _NULLABLE_STRING,
+                    "message": {
+                        "type": ["string", "null"],
+                        "maxLength": MAX_MESSAGE_LENGTH
+                    },
+                    "timestamp": _NULLABLE_STRING,
+                },
+            },
+        },
+        "job_id": _NULLABLE_STRING,
+        "timestamp": _NULLABLE_STRING,
+    },
+}
+
+_validate_batch_schema = (
+    fastjsonschema.compile(BATCH_SCHEMA) if fastjsonschema is not None else None
+)
+
+
+def _fast_batch_update(data: Dict[str, Any]) -> Optional[BatchStatusUpdateRequest]:
+    """Build a BatchStatusUpdateRequest from a schema-valid payload.
+    
+    Args:
+        data: Decoded JSON payload
+        
+    Returns:
+        BatchStatusUpdateRequest or None if the payload needs full validation
+    """
+    if _validate_batch_schema is None:
+        return None
+    try:
+        _validate_batch_schema(data)
+        updates = []
+        for item in data['updates']:
+            timestamp = item.get('timestamp')
+            if timestamp:
+                _parse_iso(timestamp)
+            updates.append(StatusUpdateRequest.model_construct(
+                app=item['app'],
+                domain=item.get('domain', 'default'),
+                status=item['status'],
+                job_id=item.get('job_id'),
+                message=item.get('message'),
+                timestamp=timestamp
+            ))
+    except (fastjsonschema.JsonSchemaException, ValueError):
+        # Let Pydantic produce the detailed error
+        return None
+    
+    return BatchStatusUpdateRequest.model_construct(
+        updates=updates,
+        job_id=data.get('job_id'),
+        timestamp=data.get('timestamp')
+    )
+
+
+def parse_batch_update(data: Dict[str, Any]) -> BatchStatusUpdateRequest:
+    """Validate a batch status update payload.
+    
+    Uses the compiled JSON schema when fastjsonschema is installed and
+    falls back to Pydantic for payloads it rejects.
+    
+    Args:
+        data: Decoded JSON payload
+        
+    Returns:
+        Validated BatchStatusUpdateRequest
+        
+    Raises:
+        ValidationError: If the payload is invalid
+    """
+    return _fast_batch_update(data) or _BATCH_ADAPTER.validate_python(data)
@@ -1,13 +1,22 @@
 """Flask application factory for EPMPulse."""
 
-from flask import Flask
+import os
+
+from flask import Flask, Response
 from typing import Optional
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 
 from .config import get_api_key, get_config
-from .api.routes import api_v1, set_limiter
+from .api.routes import api_v1, set_limiter, start_canvas_updates
 from .api.errors import register_error_handlers
+from .api.json_provider import OrjsonProvider
+from .api.rate_limit import MEMORY_STORAGE_URI, resolve_storage_uri
+from .utils.logging_config import setup_logging
+
+
+# Root health body never changes; serialize it once
+_HEALTHY_BODY = b'{"status":"healthy"}'
 
 
 def create_app(test_config: Optional[dict] = None) -> Flask:
@@ -22,13 +31,22 @@ def create_app(test_config: Optional[dict] = None) -> Flask:
     Raises:
         ValueError: If configuration validation fails (e.g., placeholder canvas IDs)
     """
+    # Log records are written by a background listener, off the request path
+    setup_logging(use_queue=True)
+    
     app = Flask(__name__, instance_relative_config=True)
     
+    # Route jsonify/get_json through orjson
+    app.json = OrjsonProvider(app)
+    
     # Default configuration
     app.config.from_mapping(
         SECRET_KEY='dev',
         STATE_FILE='data/apps_status.json',
         MAX_CONTENT_LENGTH=16 * 1024,  # 16KB max request size
+        # Shared Redis storage makes limits global across workers/replicas
+        RATELIMIT_STORAGE_URI=os.environ.get('EPMPULSE_REDIS_URL', MEMORY_STORAGE_URI),
+        RATELIMIT_STRATEGY='gcra',
     )
     
     # Load test config if provided
@@ -40,14 +58,16 @@ def create_app(test_config: Optional[dict] = None) -> Flask:
     
     # Initialize Flask-Limiter (disabled in testing mode unless explicitly enabled)
     if not test_config or test_config.get('RATELIMIT_ENABLED', True):
-        storage_uri = test_config.get('RATELIMIT_STORAGE_URI', "memory://") if test_config else "memory://"
         _limiter = Limiter(
             app=app,
             key_func=get_remote_address,
             default_limits=["100 per minute"],  # Default: 100 reqs/min for all routes
-            storage_uri=storage_uri,
-            strategy="fixed-window",
+            storage_uri=resolve_storage_uri(app.config['RATELIMIT_STORAGE_URI']),
+            strategy=app.config['RATELIMIT_STRATEGY'],
             headers_enabled=True,
+            # Redis failing after startup switches to per-process GCRA until
+            # the storage check passes again, instead of failing requests
+            in_memory_fallback_enabled=True,
         )
         # Pass limiter to routes module for specific decorators
         set_limiter(_limiter)
@@ -61,10 +81,13 @@ def create_app(test_config: Optional[dict] = None) -> Flask:
     # Register error handlers
     register_error_handlers(app)
     
+    # Canvas updates are coalesced and sent by a background worker thread
+    start_canvas_updates()
+    
     # Health check at root (Flask-specific)
     @app.route('/health')
     def root_health():
-        return {'status': 'healthy'}, 200
+        return Response(_HEALTHY_BODY, status=200, mimetype='application/json')
     
     return app
 
@@ -4,15 +4,21 @@ Loads configuration from environment variables and optional YAML file.
 All secrets come from environment variables only.
 """
 
+import functools
+import json
 import os
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 
 try:
-    import yaml
+    import orjson
 except ImportError:
-    yaml = None
+    orjson = None
+
+# orjson parses bytes directly; stdlib json accepts bytes as well
+_json_loads = getattr(orjson, "loads", json.loads)
 
 
 def get_api_key() -> str:
@@ -32,29 +38,66 @@ def get_api_key() -> str:
     return api_key
 
 
-def get_config() -> Dict[str, Any]:
-    """Load configuration from apps.json.
+# "placeholder" anywhere (any case); checked before the "${...}" template
+# form so a "${PLACEHOLDER_...}" value names the env var to set
+_PLACEHOLDER_RE = re.compile(r"placeholder", re.IGNORECASE)
+_TEMPLATE_RE = re.compile(r"\$\{.*\}", re.DOTALL)
+
+APPS_CONFIG_FILE = Path(__file__).parent.parent / "config" / "apps.json"
+
+
+@functools.lru_cache(maxsize=4)
+def _load_json_file(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a JSON file once per (path, modification time)."""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+def load_json_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
+    """Load a JSON config file, reusing the parsed result until it changes.
+    
+    The cache is keyed on the file's mtime, so edits are picked up without
+    a restart. The returned dict is shared between callers; treat it as
+    read-only.
     
+    Args:
+        config_path: Path to config file (default: config/apps.json)
+        
     Returns:
-        Configuration dictionary
+        Parsed configuration dictionary
         
     Raises:
-        ValueError: If canvas ID contains placeholder
+        OSError: If the file cannot be read
+        ValueError: If the file is not valid JSON
     """
-    config_file = Path(__file__).parent.parent / "config" / "apps.json"
-    if config_file.exists():
-        try:
-            import json
-            with open(config_file, 'r') as f:
-                config = json.load(f)
-            
-            # Validate canvas IDs don't contain placeholders
-            validate_canvas_ids(config)
-            
-            return config
-        except Exception:
-            pass
-    return {}
+    path = Path(config_path) if config_path is not None else APPS_CONFIG_FILE
+    return _load_json_file(str(path), path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_validated_config(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse and validate apps.json once per modification time."""
+    config = _load_json_file(path, mtime_ns)
+    
+    # Validate canvas IDs don't contain placeholders
+    validate_canvas_ids(config)
+    
+    return config
+
+
+def get_config() -> Dict[str, Any]:
+    """Load configuration from apps.json.
+    
+    Parsing and validation are cached until the file's mtime changes.
+    
+    Returns:
+        Configuration dictionary (empty if missing or invalid)
+    """
+    try:
+        mtime_ns = APPS_CONFIG_FILE.stat().st_mtime_ns
+        return _load_validated_config(str(APPS_CONFIG_FILE), mtime_ns)
+    except Exception:
+        return {}
 
 
 def validate_canvas_ids(config: Dict[str, Any]) -> None:
@@ -69,13 +112,13 @@ def validate_canvas_ids(config: Dict[str, Any]) -> None:
     channels = config.get('channels', {})
     for channel_id, channel_config in channels.items():
         canvas_id = channel_config.get('canvas_id', '')
-        if 'placeholder' in canvas_id.lower():
+        if _PLACEHOLDER_RE.search(canvas_id):
             raise ValueError(
                 f"Canvas ID for channel {channel_id} contains placeholder. "
                 f"Set {channel_config.get('canvas_env', 'SLACK_MAIN_CANVAS_ID')} environment variable."
             )
-        # Also check for ${...} pattern that wasn't substituted
-        if canvas_id.startswith('${') and canvas_id.endswith('}'):
+        # ${...} pattern that wasn't substituted
+        if _TEMPLATE_RE.fullmatch(canvas_id):
             raise ValueError(
                 f"Canvas ID for channel {channel_id} is an unsubstituted template: {canvas_id}. "
                 f"Set the corresponding environment variable."
@@ -95,7 +138,7 @@ def get_app_config(app_name: str) -> Optional[Dict[str, Any]]:
     return config.get('apps', {}).get(app_name)
 
 
-@dataclass
+@dataclass(slots=True)
 class SlackConfig:
     """Slack integration configuration."""
 
@@ -108,7 +151,12 @@ class SlackConfig:
     # Rate limiting
     min_update_interval_sec: int = 2
     max_retries: int = 3
-    retry_backoff_sec: list = field(default_factory=lambda: [1, 2, 4])
+    retry_backoff_sec: Tuple[int, ...] = (1, 2, 4)
+
+    @property
+    def total_backoff(self) -> int:
+        """Total seconds spent sleeping if every retry is used."""
+        return sum(self.retry_backoff_sec)
 
     @classmethod
     def from_env(cls) -> "SlackConfig":
@@ -122,7 +170,7 @@ class SlackConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class APIConfig:
     """API server configuration."""
 
@@ -146,7 +194,7 @@ class APIConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class StateConfig:
     """State management configuration."""
 
@@ -160,23 +208,43 @@ class StateConfig:
     # Stale job detection
     stale_loading_timeout_hours: int = 2
 
+    # Write-behind interval for state writes (0 = write through)
+    write_behind_ms: int = 0
+
+    # Other processes (e.g. several gunicorn workers) update the state file;
+    # each update then holds the fcntl lock file from read to rename
+    multi_process: bool = True
+
     @classmethod
     def from_env(cls) -> "StateConfig":
-        """Load state configuration from environment variables."""
+        """Load state configuration from environment variables.
+        
+        Raises:
+            ValueError: If write-behind is enabled while several processes
+                may write the state file
+        """
         base_dir = os.environ.get("EPMPULSE_DATA_DIR", "data")
         data_path = Path(base_dir)
 
-        return cls(
+        config = cls(
             state_file=data_path / "apps_status.json",
             lock_file=data_path / "apps_status.lock",
             backup_dir=data_path / "backups",
             apps_config_file=Path(
                 os.environ.get("EPMPULSE_APPS_CONFIG", "config/apps.json")
             ),
+            write_behind_ms=int(os.environ.get("EPMPULSE_STATE_WRITE_BEHIND_MS", "0")),
+            multi_process=os.environ.get("EPMPULSE_STATE_MULTI_PROCESS", "true").lower() == "true",
         )
+        if config.write_behind_ms and config.multi_process:
+            raise ValueError(
+                "EPMPULSE_STATE_WRITE_BEHIND_MS requires EPMPULSE_STATE_MULTI_PROCESS=false "
+                "(deferred writes are only safe with a single worker)"
+            )
+        return config
 
 
-@dataclass
+@dataclass(slots=True)
 class LoggingConfig:
     """Logging configuration."""
 
@@ -194,7 +262,7 @@ class LoggingConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Main configuration container."""
 
@@ -223,6 +291,8 @@ class Config:
         config_path = Path(path)
 
         if config_path.exists():
+            import yaml  # only needed when a YAML file is actually loaded
+            
             with open(config_path, "r") as f:
                 yaml_config = yaml.safe_load(f) or {}
         else:
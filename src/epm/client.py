@@ -4,30 +4,103 @@ Supports multi-server EPM environments (Planning, FCCS, ARCS)
 with unified OAuth token management.
 """
 
+import concurrent.futures
+import importlib.util
+import json
 import logging
+import os
+import re
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from enum import IntEnum
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Dict, Any, List
+from urllib.parse import urlsplit
 
-import requests
-from requests.auth import HTTPBasicAuth
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ..config import load_json_config
+
+# requests/httpx are imported on first client use, so importing this module
+# for EPMJobStatus alone stays cheap
+if TYPE_CHECKING:
+    import requests
 
 
 logger = logging.getLogger("epmpulse.epm")
 
+# Parse response bodies straight from bytes (orjson when available)
+_json_loads = getattr(orjson, "loads", json.loads)
+
+# "${ENV_VAR}" placeholders in config values
+_ENV_RE = re.compile(r"^\$\{([A-Za-z_][A-Za-z0-9_]*)\}$")
+
+
+def _resolve_env(value: Any) -> Any:
+    """Substitute a "${ENV_VAR}" config value from the environment.
+    
+    Args:
+        value: Raw config value
+        
+    Returns:
+        The environment value if set, otherwise the value unchanged
+    """
+    match = _ENV_RE.match(value) if isinstance(value, str) else None
+    return os.environ.get(match.group(1), value) if match else value
+
 
-@dataclass
+class _JobState(IntEnum):
+    """Numeric job status codes documented for the EPM jobs REST API."""
+    
+    IN_PROGRESS = -1
+    SUCCESS = 0
+    ERROR = 1
+    CANCEL_PENDING = 2
+    CANCELLED = 3
+    INVALID_PARAMETER = 4
+
+
+# Codes for jobs that ended without succeeding
+_FAILED_STATES = frozenset({_JobState.ERROR, _JobState.CANCELLED, _JobState.INVALID_PARAMETER})
+
+
+def _app_server_map(config: Dict[str, Any]) -> Dict[str, str]:
+    """Build the app name -> server ID mapping from apps.json content."""
+    return {
+        name: app_config.get("server", name.lower())
+        for name, app_config in config.get("apps", {}).items()
+    }
+
+
+@dataclass(slots=True, frozen=True)
 class EPMJobStatus:
-    """EPM job status response."""
+    """EPM job status response (read-only)."""
     
     job_id: str
     job_name: str
-    status: int
-    descriptive_status: str  # "Pending", "Processing", "Completed", "Error"
+    status: int  # EPM status code, see _JobState
+    descriptive_status: str  # "Pending", "Processing", "Completed", "Error" (display only)
     details: Optional[str] = None
     links: List[Dict[str, str]] = None
     
+    # Derived once from the status code; plain attribute reads on the poll path
+    is_complete: bool = field(init=False, repr=False, compare=False)  # succeeded
+    is_error: bool = field(init=False, repr=False, compare=False)  # failed, cancelled or rejected
+    is_running: bool = field(init=False, repr=False, compare=False)  # in progress or cancel pending
+    
+    def __post_init__(self):
+        # Frozen dataclass: derived fields are set through object.__setattr__
+        object.__setattr__(self, "is_complete", self.status == _JobState.SUCCESS)
+        object.__setattr__(self, "is_error", self.status in _FAILED_STATES)
+        object.__setattr__(
+            self, "is_running",
+            self.status == _JobState.IN_PROGRESS or self.status == _JobState.CANCEL_PENDING
+        )
+    
     @classmethod
     def from_response(cls, data: dict) -> "EPMJobStatus":
         """Create from EPM API response."""
@@ -39,21 +112,6 @@ class EPMJobStatus:
             details=data.get("details"),
             links=data.get("links", [])
         )
-    
-    @property
-    def is_complete(self) -> bool:
-        """Check if job completed successfully."""
-        return self.descriptive_status == "Completed"
-    
-    @property
-    def is_error(self) -> bool:
-        """Check if job failed."""
-        return self.descriptive_status == "Error"
-    
-    @property
-    def is_running(self) -> bool:
-        """Check if job is still running."""
-        return self.descriptive_status in ["Pending", "Processing"]
 
 
 class EPMOAuthClient:
@@ -63,13 +121,19 @@ class EPMOAuthClient:
     single OAuth token for the domain.
     """
     
+    TOKEN_EXPIRY_BUFFER = 60  # seconds before expiry a token is no longer used
+    TOKEN_REFRESH_AHEAD = 300  # seconds before expiry a background refresh starts
+    ASYNC_MAX_PER_HOST = 8  # concurrent async queries per EPM host
+    SHUTDOWN_CHECK_INTERVAL = 0.5  # seconds between shutdown checks in an async poll wait
+    
     def __init__(
         self,
         token_url: str,
         client_id: str,
         client_secret: str,
         scope: str = "urn:opc:epm",
-        servers: Optional[Dict[str, dict]] = None
+        servers: Optional[Dict[str, dict]] = None,
+        app_servers: Optional[Dict[str, str]] = None
     ):
         """Initialize EPM OAuth client.
         
@@ -79,19 +143,64 @@ class EPMOAuthClient:
             client_secret: OAuth client secret
             scope: OAuth scope (default: urn:opc:epm)
             servers: Dict of server configs {server_id: {name, base_url}}
+            app_servers: Dict mapping app name -> server ID (loaded from
+                config/apps.json on first lookup if not given)
         """
         self.token_url = token_url
         self.client_id = client_id
         self.client_secret = client_secret
         self.scope = scope
         self.servers = servers or {}
-        
-        # Token cache
+        # jobRuns URL prefix per server, built once instead of per request
+        self._job_urls: Dict[str, str] = {
+            server_id: server["base_url"].rstrip("/") + "/epm/rest/v1/jobRuns/"
+            for server_id, server in self.servers.items()
+        }
+        self._app_to_server: Optional[Dict[str, str]] = app_servers
+        
+        # Token cache: deadlines are time.monotonic() values so wall-clock
+        # jumps cannot expire or extend a token; the lock keeps parallel
+        # polls from refreshing at once
         self._access_token: Optional[str] = None
-        self._token_expires_at: float = 0.0
+        self._token_deadline: float = 0.0
+        self._token_refresh_at: float = 0.0
+        self._token_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._refresh_future: Optional[concurrent.futures.Future] = None
+        
+        # Request session for connection pooling; keep-alive connections are
+        # sized for parallel polling and transient 429/5xx are retried with
+        # backoff (the final response still reaches raise_for_status)
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
         
-        # Request session for connection pooling
         self._session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 502, 503, 504),
+            allowed_methods=("GET", "POST"),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=retry)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        # Sent with every API call; Authorization is added per token refresh
+        self._session.headers["Content-Type"] = "application/json"
+        self._auth_headers: Dict[str, str] = {}
+        
+        # Per-server status queries during multi-server polling run in parallel
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(4, len(self.servers)),
+            thread_name_prefix="epmpulse-epm"
+        )
+        
+        # Async client for the asyncio polling path, created on first use
+        self._aclient = None
+        
+        # Set by shutdown() to end polling loops without waiting out a poll interval
+        self._shutdown = threading.Event()
         
         logger.info(f"EPM client initialized with {len(self.servers)} servers")
     
@@ -105,30 +214,16 @@ class EPMOAuthClient:
         Returns:
             Configured EPMOAuthClient
         """
-        import json
-        import os
-        
-        if config_path is None:
-            config_path = Path(__file__).parent.parent / "config" / "apps.json"
-        
-        with open(config_path) as f:
-            config = json.load(f)
+        config = load_json_config(config_path)
         
         epm_config = config.get("epm", {})
         auth_config = epm_config.get("auth", {})
         servers_config = epm_config.get("servers", {})
         
-        # Resolve environment variables in config
-        def resolve_env(value: str) -> str:
-            if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-                env_var = value[2:-1]
-                return os.environ.get(env_var, value)
-            return value
-        
         return cls(
             token_url=auth_config.get("token_url", ""),
-            client_id=resolve_env(auth_config.get("client_id", "")),
-            client_secret=resolve_env(auth_config.get("client_secret", "")),
+            client_id=_resolve_env(auth_config.get("client_id", "")),
+            client_secret=_resolve_env(auth_config.get("client_secret", "")),
             scope=auth_config.get("scope", "urn:opc:epm"),
             servers={
                 k: {
@@ -136,23 +231,71 @@ class EPMOAuthClient:
                     "base_url": v.get("base_url", "")
                 }
                 for k, v in servers_config.items()
-            }
+            } if servers_config else None,
+            app_servers=_app_server_map(config)
         )
     
     def _get_token(self) -> str:
         """Get OAuth access token (cached until expiry).
         
+        Close to expiry the cached token is still returned while a new one
+        is fetched in the background, so callers only block on a token
+        request when there is no usable token at all.
+        
         Returns:
             Access token string
             
         Raises:
             requests.HTTPError: If token request fails
         """
+        token = self._access_token
+        now = time.monotonic()
+        
         # Return cached token if still valid (with 60s buffer)
-        if self._access_token and time.time() < (self._token_expires_at - 60):
+        if token and now < (self._token_deadline - self.TOKEN_EXPIRY_BUFFER):
+            if now >= self._token_refresh_at:
+                self._schedule_token_refresh()
             logger.debug("Using cached OAuth token")
-            return self._access_token
+            return token
+        
+        with self._token_lock:
+            # Another thread may have refreshed while we waited
+            if self._access_token and time.monotonic() < (self._token_deadline - self.TOKEN_EXPIRY_BUFFER):
+                return self._access_token
+            return self._fetch_new_token()
+    
+    def _schedule_token_refresh(self) -> None:
+        """Start a background token refresh unless one is in flight.
         
+        After close() the pool takes no new work; the cached token is still
+        valid, and once it is not _get_token() refreshes in the caller.
+        """
+        with self._refresh_lock:
+            if self._refresh_future is not None and not self._refresh_future.done():
+                return
+            try:
+                self._refresh_future = self._executor.submit(self._refresh_token_in_background)
+            except RuntimeError:
+                logger.debug("Client closed, skipping background OAuth token refresh")
+    
+    def _refresh_token_in_background(self) -> None:
+        """Refresh the token on the pool; failures fall back to a blocking refresh."""
+        try:
+            with self._token_lock:
+                if time.monotonic() >= self._token_refresh_at:
+                    self._fetch_new_token()
+        except Exception as e:
+            logger.warning(f"Background OAuth token refresh failed: {e}")
+    
+    def _fetch_new_token(self) -> str:
+        """Request a new OAuth token and cache it.
+        
+        Returns:
+            Access token string
+            
+        Raises:
+            requests.HTTPError: If token request fails
+        """
         logger.info("Requesting new OAuth token")
         
         response = self._session.post(
@@ -163,14 +306,27 @@ class EPMOAuthClient:
                 "client_secret": self.client_secret,
                 "scope": self.scope
             },
+            # Drop the session's API headers: form body, no stale bearer token
+            headers={"Authorization": None, "Content-Type": None},
             timeout=30
         )
         response.raise_for_status()
         
-        token_data = response.json()
+        token_data = _json_loads(response.content)
         self._access_token = token_data["access_token"]
+        # Build the auth headers once per token instead of once per request
+        self._session.headers["Authorization"] = f"Bearer {self._access_token}"
+        self._auth_headers = {
+            "Authorization": f"Bearer {self._access_token}",
+            "Content-Type": "application/json"
+        }
         expires_in = token_data.get("expires_in", 3600)
-        self._token_expires_at = time.time() + expires_in
+        now = time.monotonic()
+        self._token_deadline = now + expires_in
+        # Short-lived tokens refresh at half their lifetime at the latest
+        self._token_refresh_at = self._token_deadline - min(
+            self.TOKEN_REFRESH_AHEAD, expires_in / 2
+        )
         
         logger.info(f"OAuth token obtained, expires in {expires_in}s")
         
@@ -181,7 +337,7 @@ class EPMOAuthClient:
         method: str,
         url: str,
         **kwargs
-    ) -> requests.Response:
+    ) -> "requests.Response":
         """Make authenticated request to EPM API.
         
         Args:
@@ -192,16 +348,12 @@ class EPMOAuthClient:
         Returns:
             Response object
         """
-        token = self._get_token()
-        
-        headers = kwargs.pop("headers", {})
-        headers["Authorization"] = f"Bearer {token}"
-        headers["Content-Type"] = "application/json"
+        # Ensures a valid token; its header is already on the session
+        self._get_token()
         
         return self._session.request(
             method=method,
             url=url,
-            headers=headers,
             timeout=kwargs.pop("timeout", 30),
             **kwargs
         )
@@ -224,18 +376,79 @@ class EPMOAuthClient:
             ValueError: If server_id not configured
             requests.HTTPError: If request fails
         """
-        if server_id not in self.servers:
+        prefix = self._job_urls.get(server_id)
+        if prefix is None:
             raise ValueError(f"Unknown server: {server_id}")
-        
-        server = self.servers[server_id]
-        url = f"{server['base_url']}/epm/rest/v1/jobRuns/{job_id}"
+        url = prefix + str(job_id)
         
         logger.debug(f"Querying job {job_id} on {server_id}")
         
         response = self._make_request("GET", url)
         response.raise_for_status()
         
-        return EPMJobStatus.from_response(response.json())
+        return EPMJobStatus.from_response(_json_loads(response.content))
+    
+    def _get_aclient(self):
+        """Get or create the shared httpx.AsyncClient.
+        
+        Uses HTTP/2 when the h2 package is installed, so concurrent queries
+        to the same EPM host share one multiplexed connection.
+        
+        Raises:
+            RuntimeError: If httpx is not installed
+        """
+        if self._aclient is None:
+            try:
+                import httpx
+            except ImportError:
+                raise RuntimeError("httpx is required for async EPM requests")
+            
+            self._aclient = httpx.AsyncClient(
+                http2=importlib.util.find_spec("h2") is not None,
+                timeout=30,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+            )
+        return self._aclient
+    
+    async def _aget_token(self) -> str:
+        """Get OAuth token without blocking the event loop on refresh."""
+        if self._access_token and time.monotonic() < self._token_refresh_at:
+            return self._access_token
+        import asyncio
+        
+        return await asyncio.to_thread(self._get_token)
+    
+    async def aget_job_status(
+        self,
+        server_id: str,
+        job_id: str
+    ) -> EPMJobStatus:
+        """Get job status from specific EPM server (async).
+        
+        Args:
+            server_id: Server identifier (e.g., "planning", "fccs", "arcs")
+            job_id: EPM job ID from jobRuns endpoint
+            
+        Returns:
+            EPMJobStatus object
+            
+        Raises:
+            ValueError: If server_id not configured
+            httpx.HTTPStatusError: If request fails
+        """
+        prefix = self._job_urls.get(server_id)
+        if prefix is None:
+            raise ValueError(f"Unknown server: {server_id}")
+        url = prefix + str(job_id)
+        
+        logger.debug(f"Querying job {job_id} on {server_id} (async)")
+        
+        aclient = self._get_aclient()
+        await self._aget_token()
+        response = await aclient.get(url, headers=self._auth_headers)
+        response.raise_for_status()
+        
+        return EPMJobStatus.from_response(_json_loads(response.content))
     
     def get_job_result(
         self,
@@ -251,18 +464,17 @@ class EPMOAuthClient:
         Returns:
             Raw job result data
         """
-        if server_id not in self.servers:
+        prefix = self._job_urls.get(server_id)
+        if prefix is None:
             raise ValueError(f"Unknown server: {server_id}")
-        
-        server = self.servers[server_id]
-        url = f"{server['base_url']}/epm/rest/v1/jobRuns/{job_id}/result"
+        url = prefix + str(job_id) + "/result"
         
         logger.debug(f"Querying job result {job_id} on {server_id}")
         
         response = self._make_request("GET", url)
         response.raise_for_status()
         
-        return response.json()
+        return _json_loads(response.content)
     
     def poll_multi_server_job(
         self,
@@ -282,27 +494,33 @@ class EPMOAuthClient:
         Returns:
             Dict of final statuses per server
         """
-        import concurrent.futures
-        
-        start_time = time.time()
+        start_time = time.monotonic()
         timeout_seconds = timeout_minutes * 60
         results = {}
+        finished = set()
         
         logger.info(f"Starting multi-server poll for {len(server_jobs)} servers")
         
-        while time.time() - start_time < timeout_seconds:
+        while time.monotonic() - start_time < timeout_seconds:
             all_complete = True
             
-            # Check each server's job
-            for server_id, job_id in server_jobs.items():
-                if server_id in results:
-                    continue  # Already completed
-                
+            # Query every unfinished server at once; a poll costs the
+            # slowest round-trip rather than the sum of them
+            futures = {
+                self._executor.submit(self.get_job_status, server_id, job_id): server_id
+                for server_id, job_id in server_jobs.items()
+                if server_id not in finished
+            }
+            
+            for future in concurrent.futures.as_completed(futures):
+                server_id = futures[future]
                 try:
-                    status = self.get_job_status(server_id, job_id)
+                    status = future.result()
                     results[server_id] = status
                     
-                    if not status.is_complete and not status.is_error:
+                    if status.is_complete or status.is_error:
+                        finished.add(server_id)
+                    else:
                         all_complete = False
                         
                 except Exception as e:
@@ -314,7 +532,94 @@ class EPMOAuthClient:
                 return results
             
             logger.debug(f"Waiting {poll_interval_seconds}s before next poll")
-            time.sleep(poll_interval_seconds)
+            # Returns early (True) once shutdown() is called
+            if self._shutdown.wait(poll_interval_seconds):
+                logger.info("Multi-server poll stopped by shutdown")
+                return results
+        
+        logger.warning(f"Multi-server poll timed out after {timeout_minutes} minutes")
+        return results
+    
+    async def apoll_multi_server_job(
+        self,
+        server_jobs: Dict[str, str],
+        timeout_minutes: int = 60,
+        poll_interval_seconds: int = 30
+    ) -> Dict[str, EPMJobStatus]:
+        """Poll job status across multiple servers (async).
+        
+        Same semantics as poll_multi_server_job, with each round's queries
+        issued concurrently on the shared async client. At most
+        ASYNC_MAX_PER_HOST queries are in flight per EPM host.
+        
+        Args:
+            server_jobs: Dict mapping server_id -> job_id
+            timeout_minutes: Maximum polling time
+            poll_interval_seconds: Seconds between polls
+            
+        Returns:
+            Dict of final statuses per server
+        """
+        import asyncio
+        
+        start_time = time.monotonic()
+        timeout_seconds = timeout_minutes * 60
+        results = {}
+        finished = set()
+        
+        # One semaphore per host, shared by every server on it
+        host_limits: Dict[str, "asyncio.Semaphore"] = {}
+        for server_id in server_jobs:
+            host = urlsplit(self.servers.get(server_id, {}).get("base_url", "")).netloc
+            host_limits.setdefault(host, asyncio.Semaphore(self.ASYNC_MAX_PER_HOST))
+        
+        async def query(server_id: str, job_id: str) -> EPMJobStatus:
+            host = urlsplit(self.servers.get(server_id, {}).get("base_url", "")).netloc
+            async with host_limits[host]:
+                return await self.aget_job_status(server_id, job_id)
+        
+        logger.info(f"Starting async multi-server poll for {len(server_jobs)} servers")
+        
+        while time.monotonic() - start_time < timeout_seconds:
+            all_complete = True
+            
+            pending = [
+                (server_id, job_id)
+                for server_id, job_id in server_jobs.items()
+                if server_id not in finished
+            ]
+            statuses = await asyncio.gather(
+                *(query(server_id, job_id) for server_id, job_id in pending),
+                return_exceptions=True
+            )
+            
+            for (server_id, _), status in zip(pending, statuses):
+                if isinstance(status, Exception):
+                    logger.warning(f"Failed to query {server_id}: {status}")
+                    all_complete = False
+                    continue
+                
+                results[server_id] = status
+                if status.is_complete or status.is_error:
+                    finished.add(server_id)
+                else:
+                    all_complete = False
+            
+            if all_complete:
+                logger.info("All server jobs completed")
+                return results
+            
+            logger.debug(f"Waiting {poll_interval_seconds}s before next poll")
+            # Sleep in short slices so shutdown() ends the wait early
+            resume_at = time.monotonic() + poll_interval_seconds
+            while not self._shutdown.is_set():
+                remaining = resume_at - time.monotonic()
+                if remaining <= 0:
+                    break
+                await asyncio.sleep(min(remaining, self.SHUTDOWN_CHECK_INTERVAL))
+            if self._shutdown.is_set():
+                logger.info("Multi-server poll stopped by shutdown")
+                return results
         
         logger.warning(f"Multi-server poll timed out after {timeout_minutes} minutes")
         return results
@@ -337,24 +642,40 @@ class EPMOAuthClient:
         
         Args:
             app_name: Application name (Planning, FCCS, ARCS)
-            config_path: Path to config file
+            config_path: Path to config file (default: config/apps.json)
             
         Returns:
             Server ID (e.g., "planning", "fccs", "arcs")
         """
-        import json
-        
-        if config_path is None:
-            config_path = Path(__file__).parent.parent / "config" / "apps.json"
+        if config_path is not None:
+            return _app_server_map(load_json_config(config_path)).get(app_name, app_name.lower())
         
-        with open(config_path) as f:
-            config = json.load(f)
+        if self._app_to_server is None:
+            self._app_to_server = _app_server_map(load_json_config())
+        return self._app_to_server.get(app_name, app_name.lower())
+    
+    def shutdown(self) -> None:
+        """Stop any running multi-server poll at its next wait.
         
-        app_config = config.get("apps", {}).get(app_name, {})
-        return app_config.get("server", app_name.lower())
+        Safe to call from signal handlers and atexit hooks.
+        """
+        self._shutdown.set()
+    
+    def close(self) -> None:
+        """Shut down the polling thread pool and HTTP session."""
+        self.shutdown()
+        self._executor.shutdown(wait=True)
+        self._session.close()
+    
+    async def aclose(self) -> None:
+        """Close the async HTTP client, if one was created."""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
     
     def invalidate_token(self):
         """Force token refresh on next request."""
         self._access_token = None
-        self._token_expires_at = 0
+        self._token_deadline = 0
+        self._token_refresh_at = 0
         logger.info("OAuth token invalidated")
@@ -3,6 +3,8 @@
 
 from .client import SlackClient
 from .canvas import CanvasManager
-from .blocks import build_canvas_state, build_app_block, STATUS_ICONS
+from .debouncer import CanvasDebouncer
+from .worker import CanvasWorker
+from .blocks import build_canvas_state, build_app_block, STATUS_ICONS, STATUS_TEXT
 
-__all__ = ["SlackClient", "CanvasManager", "build_canvas_state", "build_app_block", "STATUS_ICONS"]
+__all__ = ["SlackClient", "CanvasManager", "CanvasDebouncer", "CanvasWorker", "build_canvas_state", "build_app_block", "STATUS_ICONS", "STATUS_TEXT"]
@@ -1,9 +1,39 @@
 """Canvas block generators for EPMPulse Slack integration."""
 
+import functools
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
 
+UTC = timezone.utc
+
+# Per-app block building only runs in parallel where threads can execute
+# Python code concurrently (free-threaded CPython 3.13+); with the GIL a
+# pool would just add hand-off overhead to pure-Python work
+_GIL_DISABLED = not getattr(sys, '_is_gil_enabled', lambda: True)()
+PARALLEL_MIN_APPS = 4
+_BUILD_POOL_WORKERS = 4
+
+_build_pool: Optional[ThreadPoolExecutor] = None
+_build_pool_lock = threading.Lock()
+
+
+def _get_build_pool() -> ThreadPoolExecutor:
+    """Get or create the shared block-building pool."""
+    global _build_pool
+    if _build_pool is None:
+        with _build_pool_lock:
+            if _build_pool is None:
+                _build_pool = ThreadPoolExecutor(
+                    max_workers=_BUILD_POOL_WORKERS,
+                    thread_name_prefix="epmpulse-blocks"
+                )
+    return _build_pool
+
 # Status to icon mapping
 STATUS_ICONS = {
     'Blank': '⚪',
@@ -12,20 +42,121 @@ STATUS_ICONS = {
     'Warning': '🔴',
 }
 
+# Final field text per status, so block builders do one lookup per domain
+STATUS_TEXT = {status: f'{icon} {status}' for status, icon in STATUS_ICONS.items()}
 
-def build_header_block(app_name: str, display_name: str) -> Dict[str, Any]:
-    """Build header block for an application section.
+
+# Leaf template for mrkdwn text objects; copying a small dict and setting
+# one key is cheaper than building the literal
+_MRKDWN = {'type': 'mrkdwn'}
+
+
+def status_text(status: str) -> str:
+    """Get the icon-prefixed display text for a status.
+    
+    Args:
+        status: Status value
+        
+    Returns:
+        Text such as '🟢 OK' (unknown statuses get the blank icon)
+    """
+    text = STATUS_TEXT.get(status)
+    return text if text is not None else f'⚪ {status}'
+
+
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, accepting a trailing 'Z' for UTC.
+    
+    Raises:
+        ValueError: If the timestamp is not valid ISO 8601
+    """
+    if value.endswith('Z'):
+        return datetime.fromisoformat(value[:-1]).replace(tzinfo=UTC)
+    return datetime.fromisoformat(value)
+
+
+@functools.lru_cache(maxsize=4096)
+def _iso_to_epoch(updated_iso: str) -> float:
+    """Parse an ISO 8601 timestamp to epoch seconds (cached per string).
+    
+    Raises:
+        ValueError: If the timestamp is not valid ISO 8601
+    """
+    return _parse_iso(updated_iso).timestamp()
+
+
+@functools.lru_cache(maxsize=64)
+def _footer_text(last_updated: Optional[str]) -> str:
+    """Render footer text once per last_updated value."""
+    text = '🔄 Auto-refresh on job events'
+    if last_updated:
+        try:
+            updated_dt = _parse_iso(last_updated)
+            text = f'Last updated: {updated_dt.strftime("%H:%M GMT")} | {text}'
+        except (ValueError, TypeError):
+            pass
+    return text
+
+
+@functools.lru_cache(maxsize=16)
+def _footer_block(text: str) -> Dict[str, Any]:
+    """Build the footer block once per rendered text.
+    
+    The text only shows hours and minutes, so every timestamp within the
+    same minute shares one block.
+    """
+    return {
+        'type': 'context',
+        'elements': [
+            {
+                'type': 'mrkdwn',
+                'text': text
+            }
+        ]
+    }
+
+
+def _format_relative(updated_iso: str, now_epoch: float) -> str:
+    """Format a timestamp as '<n>s/m/h ago' relative to now_epoch.
+    
+    Args:
+        updated_iso: ISO 8601 timestamp
+        now_epoch: Current time as epoch seconds
+        
+    Returns:
+        Relative time text
+        
+    Raises:
+        ValueError: If the timestamp is not valid ISO 8601
+    """
+    seconds = int(now_epoch - _iso_to_epoch(updated_iso))
+    if seconds < 60:
+        return f'{seconds}s ago'
+    if seconds < 3600:
+        return f'{seconds // 60}m ago'
+    return f'{seconds // 3600}h ago'
+
+
+@functools.lru_cache(maxsize=256)
+def section_block_id(app_name: str, domain_name: str) -> str:
+    """Return the canvas block_id of one domain's status section.
     
     Args:
         app_name: Application name
-        display_name: Display name for the application
+        domain_name: Domain name
         
     Returns:
-        Header block dictionary with block_id for section updates
+        Block id such as ``planning_actual_section``
     """
+    return f"{app_name.lower()}_{domain_name.lower()}_section"
+
+
+@functools.lru_cache(maxsize=64)
+def _header_template(app_lower: str, display_name: str) -> Dict[str, Any]:
+    """Render an app header block once per (app, display name)."""
     return {
         'type': 'section',
-        'block_id': f"{app_name.lower()}_header",
+        'block_id': f"{app_lower}_header",
         'text': {
             'type': 'mrkdwn',
             'text': f'*▸ {display_name}*'
@@ -33,7 +164,28 @@ def build_header_block(app_name: str, display_name: str) -> Dict[str, Any]:
     }
 
 
-def build_status_field_block(domain_name: str, status: str, job_id: Optional[str] = None, updated: Optional[str] = None) -> Dict[str, Any]:
+def build_header_block(app_name: str, display_name: str) -> Dict[str, Any]:
+    """Build header block for an application section.
+    
+    Args:
+        app_name: Application name
+        display_name: Display name for the application
+        
+    Returns:
+        Header block dictionary with block_id for section updates
+        (a shallow copy of a cached template; nested dicts are shared)
+    """
+    return _header_template(app_name.lower(), display_name).copy()
+
+
+def build_status_field_block(
+    domain_name: str,
+    status: str,
+    job_id: Optional[str] = None,
+    updated: Optional[str] = None,
+    now_epoch: Optional[float] = None,
+    block_id: Optional[str] = None
+) -> Dict[str, Any]:
     """Build a status field block for domain status.
     
     Args:
@@ -41,74 +193,66 @@ def build_status_field_block(domain_name: str, status: str, job_id: Optional[str
         status: Current status (Blank, Loading, OK, Warning)
         job_id: Optional job ID
         updated: Optional last updated timestamp
+        now_epoch: Reference time for relative timestamps (default: now);
+            pass one value when building many blocks
+        block_id: Optional block_id for section-based updates
         
     Returns:
         Section block with fields dictionary
     """
-    status_icon = STATUS_ICONS.get(status, '⚪')
-    status_text = f'{status_icon} {status}'
-    
     # Build context text
-    context_parts = [f'_{domain_name}_']
+    context = f'_{domain_name}_'
     
     if job_id:
-        context_parts.append(f'Job: {job_id}')
+        context = f'{context}\nJob: {job_id}'
     
     if updated:
         try:
-            # Parse timestamp and calculate relative time
-            updated_dt = datetime.fromisoformat(updated.replace('Z', '+00:00'))
-            now = datetime.now(updated_dt.tzinfo or datetime.now().astimezone().tzinfo)
-            delta = now - updated_dt
-            seconds = int(delta.total_seconds())
-            
-            if seconds < 60:
-                context_parts.append(f'{seconds}s ago')
-            elif seconds < 3600:
-                context_parts.append(f'{seconds // 60}m ago')
-            else:
-                context_parts.append(f'{seconds // 3600}h ago')
+            if now_epoch is None:
+                now_epoch = time.time()
+            context = f'{context}\n{_format_relative(updated, now_epoch)}'
         except (ValueError, TypeError):
-            context_parts.append(f'updated')
+            context = f'{context}\nupdated'
     
-    return {
-        'type': 'section',
-        'fields': [
-            {
-                'type': 'mrkdwn',
-                'text': status_text
-            },
-            {
-                'type': 'mrkdwn',
-                'text': '\n'.join(context_parts)
-            }
-        ]
+    status_field = _MRKDWN.copy()
+    status_field['text'] = status_text(status)
+    context_field = _MRKDWN.copy()
+    context_field['text'] = context
+    
+    if block_id is None:
+        return {'type': 'section', 'fields': [status_field, context_field]}
+    return {'type': 'section', 'block_id': block_id, 'fields': [status_field, context_field]}
+
+
+# Content-invariant blocks, shared by every canvas build (treat as read-only)
+_DIVIDER_BLOCK = {'type': 'divider'}
+
+_DASHBOARD_HEADER_BLOCK = {
+    'type': 'header',
+    'text': {
+        'type': 'plain_text',
+        'text': '📊 EPM Status Dashboard',
+        'emoji': True
     }
+}
 
 
 def build_divider_block() -> Dict[str, Any]:
     """Build a divider block.
     
     Returns:
-        Divider block dictionary
+        Shared divider block dictionary (do not mutate)
     """
-    return {'type': 'divider'}
+    return _DIVIDER_BLOCK
 
 
 def build_dashboard_header_block() -> Dict[str, Any]:
     """Build the dashboard header.
     
     Returns:
-        Header block dictionary
+        Shared header block dictionary (do not mutate)
     """
-    return {
-        'type': 'header',
-        'text': {
-            'type': 'plain_text',
-            'text': '📊 EPM Status Dashboard',
-            'emoji': True
-        }
-    }
+    return _DASHBOARD_HEADER_BLOCK
 
 
 def build_footer_block(last_updated: Optional[str] = None) -> Dict[str, Any]:
@@ -118,60 +262,17 @@ def build_footer_block(last_updated: Optional[str] = None) -> Dict[str, Any]:
         last_updated: Optional last update timestamp
         
     Returns:
-        Context block dictionary
-    """
-    text = '🔄 Auto-refresh on job events'
-    if last_updated:
-        try:
-            updated_dt = datetime.fromisoformat(last_updated.replace('Z', '+00:00'))
-            text = f'Last updated: {updated_dt.strftime("%H:%M GMT")} | {text}'
-        except (ValueError, TypeError):
-            pass
-    
-    return {
-        'type': 'context',
-        'elements': [
-            {
-                'type': 'mrkdwn',
-                'text': text
-            }
-        ]
-    }
-
-
-def build_domain_section(app_name: str, domain_name: str, domain_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Build complete section for a domain.
-    
-    Args:
-        app_name: Application name
-        domain_name: Domain name
-        domain_data: Domain status data
-        
-    Returns:
-        Complete section block dictionary with block_id for section updates
+        Shared context block dictionary (do not mutate)
     """
-    status = domain_data.get('status', 'Blank')
-    job_id = domain_data.get('job_id')
-    updated = domain_data.get('updated')
-    
-    block = build_status_field_block(
-        domain_name=domain_name,
-        status=status,
-        job_id=job_id,
-        updated=updated
-    )
-    
-    # Add block_id for section-based updates
-    block['block_id'] = f"{app_name.lower()}_{domain_name.lower()}_section"
-    
-    return block
+    return _footer_block(_footer_text(last_updated))
 
 
 def build_single_domain_blocks(
     app_name: str,
     display_name: str,
     domain_name: str,
-    domain_data: Dict[str, Any]
+    domain_data: Dict[str, Any],
+    now_epoch: Optional[float] = None
 ) -> list:
     """Build blocks for a single domain update with proper block_ids.
     
@@ -180,20 +281,23 @@ def build_single_domain_blocks(
         display_name: Display name for the app
         domain_name: Domain name
         domain_data: Domain status data
+        now_epoch: Reference time for relative timestamps (default: now)
         
     Returns:
         List of block dictionaries with block_ids for section updates
     """
-    blocks = []
-    
-    # Header with block_id
-    blocks.append(build_header_block(app_name, display_name))
-    
-    # Single domain section with unique block_id
-    domain_block = build_domain_section(app_name, domain_name, domain_data)
-    blocks.append(domain_block)
-    
-    return blocks
+    # Header and single domain section, each with a unique block_id
+    return [
+        build_header_block(app_name, display_name),
+        build_status_field_block(
+            domain_name=domain_name,
+            status=domain_data.get('status', 'Blank'),
+            job_id=domain_data.get('job_id'),
+            updated=domain_data.get('updated'),
+            now_epoch=now_epoch,
+            block_id=section_block_id(app_name, domain_name)
+        )
+    ]
 
 
 def build_app_block(
@@ -217,6 +321,7 @@ def build_app_block(
     blocks.append(build_header_block(app_name, display_name))
     
     # Status fields (2 per row) with unique block_ids
+    app_lower = app_name.lower()
     domain_list = list(domains.items())
     for i in range(0, len(domain_list), 2):
         domain_pairs = domain_list[i:i+2]
@@ -229,30 +334,27 @@ def build_app_block(
             job_id = domain_data.get('job_id')
             updated = domain_data.get('updated')
             
-            status_icon = STATUS_ICONS.get(status, '⚪')
-            status_text = f'{status_icon} {status}'
-            
-            context_parts = [f'_{domain_name}_']
+            context = f'_{domain_name}_'
             if job_id:
-                context_parts.append(f'Job: {job_id}')
+                context = f'{context}\nJob: {job_id}'
             if updated:
-                context_parts.append(f'{updated}')
+                context = f'{context}\n{updated}'
             
-            fields.append({
-                'type': 'mrkdwn',
-                'text': '\n'.join(context_parts)
-            })
-            fields.append({
-                'type': 'mrkdwn',
-                'text': status_text
-            })
+            context_field = _MRKDWN.copy()
+            context_field['text'] = context
+            status_field = _MRKDWN.copy()
+            status_field['text'] = status_text(status)
+            fields.append(context_field)
+            fields.append(status_field)
             
             # Collect domain names for block_id
             block_id_parts.append(domain_name.lower())
         
-        # Create unique block_id for this section
-        domains_str = '_'.join(sorted(block_id_parts))
-        block_id = f"{app_name.lower()}_{domains_str}_section"
+        # Create unique block_id for this section; names stay in sorted
+        # order so ids match sections already on existing canvases
+        if len(block_id_parts) == 2 and block_id_parts[1] < block_id_parts[0]:
+            block_id_parts.reverse()
+        block_id = f"{app_lower}_{'_'.join(block_id_parts)}_section"
         
         blocks.append({
             'type': 'section',
@@ -272,23 +374,41 @@ def build_canvas_state(state_data: Dict[str, Any]) -> list:
     Returns:
         List of all canvas blocks
     """
-    blocks = []
+    footer = build_footer_block(state_data.get('last_updated'))
     
     # Header
-    blocks.append(build_dashboard_header_block())
-    blocks.append(build_footer_block(state_data.get('last_updated')))
-    blocks.append(build_divider_block())
+    blocks = [_DASHBOARD_HEADER_BLOCK, footer, _DIVIDER_BLOCK]
     
-    # Application sections
+    # Application sections (loop-invariant lookups bound to locals)
     apps = state_data.get('apps', {})
-    for app_name, app_data in apps.items():
-        display_name = app_data.get('display_name', app_name)
-        domains = app_data.get('domains', {})
-        
-        blocks.extend(build_app_block(app_name, display_name, domains))
-        blocks.append(build_divider_block())
+    build_app = build_app_block
+    extend = blocks.extend
+    append = blocks.append
+    
+    if _GIL_DISABLED and len(apps) >= PARALLEL_MIN_APPS:
+        pool = _get_build_pool()
+        futures = [
+            pool.submit(
+                build_app,
+                app_name,
+                app_data.get('display_name', app_name),
+                app_data.get('domains', {})
+            )
+            for app_name, app_data in apps.items()
+        ]
+        for future in futures:
+            extend(future.result())
+            append(_DIVIDER_BLOCK)
+    else:
+        for app_name, app_data in apps.items():
+            extend(build_app(
+                app_name,
+                app_data.get('display_name', app_name),
+                app_data.get('domains', {})
+            ))
+            append(_DIVIDER_BLOCK)
     
-    # Footer
-    blocks.append(build_footer_block(state_data.get('last_updated')))
+    # Footer (same text as the header footer)
+    append(footer)
     
     return blocks
@@ -1,12 +1,28 @@
 """Canvas update manager with debouncing for EPMPulse."""
 
+import hashlib
+import json
+import logging
+import os
 import time
 import threading
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterable, List, Set, Tuple
 from datetime import datetime
 
-from .client import SlackClient
-from .blocks import build_app_block, build_canvas_state, build_single_domain_blocks
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ..state.manager import StateManager
+from .client import SlackClient, SlackThrottledError
+from .blocks import (
+    build_app_block, build_canvas_state, build_header_block, build_single_domain_blocks,
+    section_block_id, STATUS_ICONS, status_text
+)
+
+
+logger = logging.getLogger("epmpulse.slack")
 
 
 class CanvasManager:
@@ -14,31 +30,38 @@ class CanvasManager:
     
     DEBOUNCE_INTERVAL = 2.0  # seconds
     DEFAULT_CANVAS_ID = 'Fcanvas_placeholder'
-    PROCESSOR_INTERVAL = 0.5  # Check for pending updates every 0.5 seconds
     
-    def __init__(self, slack_client: Optional[SlackClient] = None):
+    def __init__(
+        self,
+        slack_client: Optional[SlackClient] = None,
+        state_manager: Optional[StateManager] = None
+    ):
         """Initialize Canvas manager.
         
         Args:
             slack_client: SlackClient instance (creates new if None)
+            state_manager: StateManager to read state from (creates one on
+                first read if None); share the API's instance so its write
+                counter invalidates the state cache
         """
         self.slack_client = slack_client or SlackClient()
-        self._last_update_time = 0.0
-        self._pending_update = None  # Store blocks instead of just boolean
-        self._update_lock = threading.Lock()
-        self._timer: Optional[threading.Timer] = None
-        self._processor_thread: Optional[threading.Thread] = None
-        self._stop_processor = threading.Event()
+        self._last_update_time = float('-inf')  # time.monotonic() of the last send
+        self._dirty: Set[Tuple[str, str]] = set()  # (app, domain) awaiting the timer
+        self._update_lock = threading.Lock()  # debounce state only, never held over I/O
+        self._send_lock = threading.Lock()  # serializes Slack calls across threads
+        self._cv = threading.Condition(self._update_lock)
+        self._deadline: Optional[float] = None  # when dirty domains are flushed
+        self._flusher: Optional[threading.Thread] = None
         self._canvas_id = self._get_canvas_id()
-        
-        # Start the background processor thread
-        self._start_processor()
+        self._section_update_fn, self._sections_update_fn = self._resolve_section_updates()
+        self._state_mgr = state_manager
+        self._last_blocks_digest: Optional[bytes] = None
+        self._state_cache: Tuple[Optional[tuple], Any] = (None, None)
+        self._blocks_cache: Tuple[Any, Optional[list]] = (None, None)  # (state, blocks)
     
     def _get_canvas_id(self) -> str:
         """Get canvas ID from config or use placeholder."""
-        import os
-        canvas_id = os.environ.get('SLACK_CANVAS_ID', self.DEFAULT_CANVAS_ID)
-        return canvas_id if canvas_id != self.DEFAULT_CANVAS_ID else self.DEFAULT_CANVAS_ID
+        return os.environ.get('SLACK_CANVAS_ID', self.DEFAULT_CANVAS_ID)
     
     def _should_update_now(self) -> bool:
         """Check if update should execute now (debouncing check).
@@ -46,28 +69,75 @@ class CanvasManager:
         Returns:
             True if should update now, False if should defer
         """
-        current_time = time.time()
-        return (current_time - self._last_update_time) >= self.DEBOUNCE_INTERVAL
+        return (time.monotonic() - self._last_update_time) >= self.DEBOUNCE_INTERVAL
     
-    def _update_canvas(self, blocks: list, is_full_sync: bool = False) -> bool:
+    @staticmethod
+    def _blocks_digest(blocks: list, is_full_sync: bool) -> bytes:
+        """Hash a canvas payload; the update kind is part of the key."""
+        if orjson is not None:
+            payload = orjson.dumps(blocks, option=orjson.OPT_SORT_KEYS)
+        else:
+            payload = json.dumps(blocks, sort_keys=True, separators=(',', ':')).encode()
+        digest = hashlib.blake2b(payload, digest_size=16)
+        digest.update(b'F' if is_full_sync else b'S')
+        return digest.digest()
+    
+    def _update_canvas(
+        self,
+        blocks: list,
+        is_full_sync: bool = False,
+        force: bool = False,
+        timeout: Optional[float] = None
+    ) -> bool:
         """Actually perform the canvas update.
         
+        A payload identical to the last one sent successfully is skipped,
+        since Slack would render the same canvas. Sends from the canvas
+        worker, the debounce timer and sync requests are serialized so
+        calls never race each other or the digest.
+        
         Args:
             blocks: Canvas blocks to set
             is_full_sync: If True, performs full document replace. If False,
                          attempts section-based update for rate limit efficiency.
+            force: Send even if the payload is unchanged
+            timeout: If set, give up after waiting this long for the send
+                lock or for each rate-limit token (request threads)
             
         Returns:
-            True if successful, False otherwise
+            True if successful (or unchanged), False otherwise
+            
+        Raises:
+            SlackThrottledError: If timeout elapsed before the update was sent
         """
         if not self.slack_client.is_configured():
-            print("Slack client not configured, skipping canvas update")
+            logger.debug("Slack client not configured, skipping canvas update")
             return False
         
+        digest = self._blocks_digest(blocks, is_full_sync)
+        if not self._send_lock.acquire(timeout=-1 if timeout is None else timeout):
+            raise SlackThrottledError(f"Canvas update still in progress after {timeout}s")
+        try:
+            if not force and digest == self._last_blocks_digest:
+                self._last_update_time = time.monotonic()
+                return True
+            
+            if timeout is None:
+                success = self._send_blocks(blocks, is_full_sync)
+            else:
+                with self.slack_client.bounded_wait(timeout):
+                    success = self._send_blocks(blocks, is_full_sync)
+            
+            self._last_blocks_digest = digest if success else None
+        finally:
+            self._send_lock.release()
+        return success
+    
+    def _send_blocks(self, blocks: list, is_full_sync: bool) -> bool:
+        """Send blocks as a full replace or section updates (caller holds _send_lock)."""
         # For full sync, use full document replace
         if is_full_sync:
             return self._update_full_canvas(blocks)
-        
         # For partial updates, try section-based update first
         return self._update_section_based(blocks)
     
@@ -89,36 +159,79 @@ class CanvasManager:
                 document_json={'blocks': blocks}
             )
             
-            self._last_update_time = time.time()
+            self._last_update_time = time.monotonic()
             return True
             
+        except SlackThrottledError:
+            raise
         except Exception as e:
-            print(f"Full canvas update failed: {e}")
+            logger.warning("Full canvas update failed: %s", e)
             return False
     
+    def _resolve_section_updates(self) -> Tuple[Optional[Any], Optional[Any]]:
+        """Pick the section update callables once for this Slack client.
+        
+        Which methods exist is fixed when the client (and SDK) is created,
+        so update paths call the chosen functions without probing.
+        
+        Returns:
+            (single-section fn returning bool or None, multi-section fn or None)
+        """
+        single = getattr(self.slack_client, 'update_canvas_section', None)
+        if single is None:
+            raw = getattr(self.slack_client.client, 'canvases_section_update', None)
+            if raw is not None:
+                def single(**kwargs) -> bool:
+                    raw(**kwargs)
+                    return True
+        return single, getattr(self.slack_client, 'update_canvas_sections', None)
+    
     def _update_section_based(self, blocks: list) -> bool:
         """Update specific sections of the canvas using canvases_section_update.
         
-        Falls back to full canvas edit if section update fails or is not available.
+        Every block with a block_id is its own section; several sections
+        are sent concurrently. The blocks only cover part of the canvas, so
+        if a section update fails or is not available the whole document is
+        rebuilt from state and replaced instead.
         
         Args:
-            blocks: Blocks containing section with block_id to update
+            blocks: Blocks containing sections with block_ids to update
             
         Returns:
             True if successful, False otherwise
         """
-        # Find the first block with a block_id (the section we want to update)
-        section_block = None
-        for block in blocks:
-            if block.get('block_id'):
-                section_block = block
-                break
-        
-        if not section_block:
+        section_blocks = [block for block in blocks if block.get('block_id')]
+        
+        if not section_blocks:
             # No block_id found, fall back to full update
-            return self._update_full_canvas(blocks)
+            return self._rebuild_full_canvas()
+        
+        if len(section_blocks) == 1:
+            return self._update_section(self._canvas_id, section_blocks)
+        
+        if self._sections_update_fn is not None:
+            results = self._sections_update_fn(
+                canvas_id=self._canvas_id,
+                sections={block['block_id']: [block] for block in section_blocks}
+            )
+            if all(results.values()):
+                self._last_update_time = time.monotonic()
+                return True
+            failed = [section_id for section_id, ok in results.items() if not ok]
+            logger.warning("Section update failed for %s, falling back to full canvas edit", failed)
         
-        return self._update_section(self._canvas_id, [section_block])
+        return self._rebuild_full_canvas()
+    
+    def _rebuild_full_canvas(self) -> bool:
+        """Replace the canvas with the complete document built from state.
+        
+        canvases_edit replaces the whole canvas, so the section fallbacks
+        must never send only the blocks they were given.
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        return self._update_full_canvas(self._canvas_blocks(self._read_state()))
     
     def _update_section(self, canvas_id: str, section_blocks: list) -> bool:
         """Update a specific canvas section using canvases_section_update.
@@ -136,96 +249,195 @@ class CanvasManager:
         # Get the block_id from the first section block
         block_id = section_blocks[0].get('block_id')
         if not block_id:
-            print("Section update failed: no block_id found in section blocks")
+            logger.warning("Section update failed: no block_id found in section blocks")
             return False
         
+        update_section = self._section_update_fn
+        if update_section is None:
+            logger.warning("canvases_section_update not available in Slack SDK, "
+                           "falling back to full canvas edit")
+            return self._rebuild_full_canvas()
+        
         try:
-            # Try section-based update for rate limit efficiency
-            if hasattr(self.slack_client, 'update_canvas_section'):
-                success = self.slack_client.update_canvas_section(
-                    canvas_id=canvas_id,
-                    section_id=block_id,
-                    blocks=section_blocks
-                )
-                if success:
-                    self._last_update_time = time.time()
-                    return True
-            
-            # Fall back to checking if client has canvases_section_update method
-            if hasattr(self.slack_client.client, 'canvases_section_update'):
-                self.slack_client.client.canvases_section_update(
-                    canvas_id=canvas_id,
-                    section_id=block_id,
-                    blocks=section_blocks
-                )
-                self._last_update_time = time.time()
+            # Section-based update for rate limit efficiency
+            if update_section(canvas_id=canvas_id, section_id=block_id, blocks=section_blocks):
+                self._last_update_time = time.monotonic()
                 return True
-            else:
-                print("Warning: canvases_section_update not available in Slack SDK, "
-                      "falling back to full canvas edit")
-                
-                
         except Exception as e:
             error_msg = str(e)
             # Check if section doesn't exist yet (first-time setup)
             if 'section_not_found' in error_msg.lower() or 'not_found' in error_msg.lower():
-                print(f"Section {block_id} not found, falling back to full canvas edit")
+                logger.info("Section %s not found, falling back to full canvas edit", block_id)
             else:
-                print(f"Section update failed: {e}, falling back to full canvas edit")
+                logger.warning("Section update failed: %s, falling back to full canvas edit", e)
         
         # Fall back to full canvas edit
-        return self._update_full_canvas(section_blocks)
+        return self._rebuild_full_canvas()
     
-    def _process_pending(self):
-        """Process pending updates in a background thread."""
-        while not self._stop_processor.is_set():
-            with self._update_lock:
-                if self._pending_update is not None:
-                    # Check if we should update now
-                    if self._should_update_now():
-                        blocks = self._pending_update
-                        self._pending_update = None
-                        self._update_canvas(blocks)
-                    else:
-                        # Schedule another check
-                        delay = self.PROCESSOR_INTERVAL
-                        self._timer = threading.Timer(delay, self._process_pending)
-                        self._timer.daemon = True
-                        self._timer.start()
-                        break
-                else:
-                    # No pending update, wait a bit before checking again
-                    pass
+    def _claim_or_defer(self, keys: Iterable[Tuple[str, str]]) -> bool:
+        """Claim an immediate send, or mark keys dirty for the trailing flush.
+        
+        Outside the debounce window the caller sends right away. Inside it
+        the (app, domain) keys join the dirty set and the flush deadline is
+        set to the end of the window; every key dirtied meanwhile is covered
+        by the one flush, so a burst costs at most one extra canvas call and
+        no update is dropped. The deadline is not pushed back by later
+        arrivals, so a steady stream still reaches the canvas every window.
+        
+        Args:
+            keys: (app_name, domain_name) pairs being updated
+            
+        Returns:
+            True if the caller should send now, False if deferred
+        """
+        with self._cv:
+            now = time.monotonic()
+            # Inlined _should_update_now(), reusing now for the claim
+            if self._deadline is None and now - self._last_update_time >= self.DEBOUNCE_INTERVAL:
+                # Claim the window before releasing the lock
+                self._last_update_time = now
+                return True
             
-            # Small sleep to prevent tight loop
-            time.sleep(self.PROCESSOR_INTERVAL)
+            self._dirty.update(keys)
+            if self._deadline is None:
+                self._deadline = self._last_update_time + self.DEBOUNCE_INTERVAL
+                if self._flusher is None:
+                    self._flusher = threading.Thread(
+                        target=self._flush_loop,
+                        name="epmpulse-canvas-flusher",
+                        daemon=True
+                    )
+                    self._flusher.start()
+                self._cv.notify()
+            return False
+    
+    def _flush_loop(self):
+        """Flusher thread: wait for each deadline, then flush dirty domains.
+        
+        One long-lived thread serves every debounce cycle; it exits once
+        stop() unregisters it.
+        """
+        me = threading.current_thread()
+        while True:
+            with self._cv:
+                while self._flusher is me:
+                    if self._deadline is None:
+                        self._cv.wait()
+                        continue
+                    remaining = self._deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cv.wait(remaining)
+                if self._flusher is not me:
+                    return
+            self._flush_pending()
     
-    def _start_processor(self):
-        """Start the background processor thread."""
-        self._stop_processor.clear()
-        self._processor_thread = threading.Thread(target=self._process_pending_loop, daemon=True)
-        self._processor_thread.start()
+    def _flush_pending(self):
+        """Rebuild the canvas once for all dirty domains.
+        
+        State is read once and the whole document is replaced in a single
+        canvases_edit. A replace carrying only the dirty domains would erase
+        every other section, so the rebuild covers all apps.
+        """
+        with self._update_lock:
+            dirty = self._dirty
+            self._dirty = set()
+            self._deadline = None
+            if dirty:
+                self._last_update_time = time.monotonic()
+        
+        if not dirty:
+            return
+        
+        try:
+            state = self._read_state()
+        except Exception as e:
+            logger.warning("Deferred canvas update failed reading state: %s", e)
+            return
+        
+        self._update_canvas(self._canvas_blocks(state), is_full_sync=True)
     
-    def _process_pending_loop(self):
-        """Main loop for processing pending updates."""
-        while not self._stop_processor.is_set():
-            with self._update_lock:
-                if self._pending_update is not None:
-                    # Check if we should update now
-                    if self._should_update_now():
-                        blocks = self._pending_update
-                        self._pending_update = None
-                        self._update_canvas(blocks)
+    def _canvas_blocks(self, state) -> list:
+        """Full canvas blocks for a state, built once per state read.
+        
+        _read_state() returns the same State object until the file changes,
+        so identity is a cheap content key. Full-canvas blocks carry no
+        relative timestamps, so reusing them stays accurate.
+        
+        Args:
+            state: State from _read_state()
             
-            # Check periodically
-            self._stop_processor.wait(timeout=self.PROCESSOR_INTERVAL)
+        Returns:
+            Complete canvas blocks (shared; do not mutate)
+        """
+        cached_state, blocks = self._blocks_cache
+        if blocks is None or cached_state is not state:
+            blocks = build_canvas_state(state.to_dict())
+            self._blocks_cache = (state, blocks)
+        return blocks
     
-    def _cancel_pending_timer(self):
-        """Cancel any pending timer."""
-        with self._update_lock:
-            if self._timer is not None:
-                self._timer.cancel()
-                self._timer = None
+    def _read_state(self):
+        """Read current state, reusing the last parse while the file is unchanged.
+        
+        The cache is keyed on StateManager.version() rather than a TTL, so a
+        write made just before a canvas update is never served stale; a burst
+        of events against an unchanged file costs one stat each, not a parse.
+        
+        Returns:
+            Current State
+        """
+        if self._state_mgr is None:
+            self._state_mgr = StateManager()
+        
+        version = self._state_mgr.version()
+        cached_version, state = self._state_cache
+        if state is None or cached_version != version:
+            state = self._state_mgr.read()
+            self._state_cache = (version, state)
+        return state
+    
+    def _cancel_pending_flush(self):
+        """Cancel any pending deferred flush and forget dirty domains."""
+        with self._cv:
+            self._deadline = None
+            self._dirty.clear()
+            self._cv.notify()
+    
+    @staticmethod
+    def _blocks_for_domain(state, app_name: str, domain_name: str, status: str) -> list:
+        """Build section blocks for one domain, with a minimal fallback.
+        
+        Args:
+            state: Current State
+            app_name: Application name
+            domain_name: Domain name
+            status: Status to show when the domain is not in state yet
+            
+        Returns:
+            Header and domain section blocks with proper block_ids
+        """
+        app = state.apps.get(app_name)
+        domain = app.domains.get(domain_name) if app is not None else None
+        if domain:
+            return build_single_domain_blocks(
+                app_name=app_name,
+                display_name=app.display_name,
+                domain_name=domain_name,
+                domain_data=domain.to_dict()
+            )
+        
+        # Fallback: create minimal blocks with proper block_id
+        return [
+            build_header_block(app_name, app_name),
+            {
+                'type': 'section',
+                'block_id': section_block_id(app_name, domain_name),
+                'fields': [
+                    {'type': 'mrkdwn', 'text': f'_{domain_name}_'},
+                    {'type': 'mrkdwn', 'text': status_text(status)}
+                ]
+            }
+        ]
     
     def update_canvas_for_domain(
         self,
@@ -246,111 +458,43 @@ class CanvasManager:
         Returns:
             True if update was triggered immediately, False if queued for debouncing
         """
-        with self._update_lock:
-            # Cancel any pending timer
-            if self._timer is not None:
-                self._timer.cancel()
-                self._timer = None
-            
-            # Fetch state
-            from ..state.manager import StateManager
-            state_mgr = StateManager()
-            state = state_mgr.read()
-            
-            # Build section blocks for this specific domain
-            if app_name in state.apps:
-                app = state.apps[app_name]
-                domain = app.domains.get(domain_name)
-                if domain:
-                    # Use new function that adds proper block_ids
-                    blocks = build_single_domain_blocks(
-                        app_name=app_name,
-                        display_name=app.display_name,
-                        domain_name=domain_name,
-                        domain_data=domain.to_dict()
-                    )
-                else:
-                    # Fallback: create minimal blocks with proper block_id
-                    blocks = [
-                        {
-                            'type': 'section',
-                            'block_id': f"{app_name.lower()}_header",
-                            'text': {'type': 'mrkdwn', 'text': f'*▸ {app_name}*'}
-                        },
-                        {
-                            'type': 'section',
-                            'block_id': f"{app_name.lower()}_{domain_name.lower()}_section",
-                            'fields': [
-                                {'type': 'mrkdwn', 'text': f'_{domain_name}_'},
-                                {'type': 'mrkdwn', 'text': f'{self._get_status_icon(status)} {status}'}
-                            ]
-                        }
-                    ]
-            else:
-                # Fallback: create minimal blocks with proper block_id
-                blocks = [
-                    {
-                        'type': 'section',
-                        'block_id': f"{app_name.lower()}_header",
-                        'text': {'type': 'mrkdwn', 'text': f'*▸ {app_name}*'}
-                    },
-                    {
-                        'type': 'section',
-                        'block_id': f"{app_name.lower()}_{domain_name.lower()}_section",
-                        'fields': [
-                            {'type': 'mrkdwn', 'text': f'_{domain_name}_'},
-                            {'type': 'mrkdwn', 'text': f'{self._get_status_icon(status)} {status}'}
-                        ]
-                    }
-                ]
-            
-            if self._should_update_now():
-                # Use section-based update (not full sync) for single domain updates
-                self._update_canvas(blocks, is_full_sync=False)
-                return True
-            else:
-                # Queue update for later processing
-                self._pending_update = blocks
-                # Schedule a delayed update
-                delay = self.DEBOUNCE_INTERVAL - (time.time() - self._last_update_time)
-                self._timer = threading.Timer(delay, self._process_scheduled_update)
-                self._timer.daemon = True
-                self._timer.start()
-                return False
-    
-    def _process_scheduled_update(self):
-        """Process a scheduled pending update."""
-        with self._update_lock:
-            if self._pending_update is not None:
-                blocks = self._pending_update
-                self._pending_update = None
-                self._update_canvas(blocks)
-            self._timer = None
+        if not self._claim_or_defer(((app_name, domain_name),)):
+            return False
+        
+        blocks = self._blocks_for_domain(self._read_state(), app_name, domain_name, status)
+        
+        # Use section-based update (not full sync); Slack I/O runs unlocked
+        self._update_canvas(blocks, is_full_sync=False)
+        return True
     
-    def sync_canvas(self) -> str:
+    def sync_canvas(self, force: bool = False, timeout: Optional[float] = None) -> str:
         """Force canvas synchronization (full document replace).
         
+        A sync whose document matches the last one sent is skipped; pass
+        force to re-push it anyway (e.g. after the canvas was edited in Slack).
+        
+        Args:
+            force: Send even if the document is unchanged
+            timeout: If set, fail instead of waiting longer than this for an
+                in-flight update or the Slack rate limit
+            
         Returns:
             Canvas ID that was synced
+            
+        Raises:
+            SlackThrottledError: If timeout elapsed first
         """
-        # Cancel any pending timer to do immediate update
-        with self._update_lock:
-            if self._timer is not None:
-                self._timer.cancel()
-                self._timer = None
-            self._pending_update = None
+        # Cancel any pending flush to do immediate update
+        self._cancel_pending_flush()
         
-        from ..state.manager import StateManager
-        state_mgr = StateManager()
-        state = state_mgr.read()
-        
-        blocks = build_canvas_state(state.to_dict())
+        blocks = self._canvas_blocks(self._read_state())
         # Full sync uses canvases_edit (document replace)
-        self._update_canvas(blocks, is_full_sync=True)
+        self._update_canvas(blocks, is_full_sync=True, force=force, timeout=timeout)
         
         return self._canvas_id
     
-    def _get_status_icon(self, status: str) -> str:
+    @staticmethod
+    def _get_status_icon(status: str) -> str:
         """Get status icon.
         
         Args:
@@ -359,13 +503,7 @@ class CanvasManager:
         Returns:
             Icon string
         """
-        icons = {
-            'Blank': '⚪',
-            'Loading': '🟡',
-            'OK': '🟢',
-            'Warning': '🔴'
-        }
-        return icons.get(status, '⚪')
+        return STATUS_ICONS.get(status, '⚪')
     
     def update_canvas_for_app(self, app_name: str) -> bool:
         """Update canvas for an entire app.
@@ -380,46 +518,38 @@ class CanvasManager:
         Returns:
             True if update was triggered immediately, False if queued for debouncing
         """
-        with self._update_lock:
-            # Cancel any pending timer
-            if self._timer is not None:
-                self._timer.cancel()
-                self._timer = None
-            
-            from ..state.manager import StateManager
-            state_mgr = StateManager()
-            state = state_mgr.read()
-            
-            if app_name not in state.apps:
-                return False
-            
-            app = state.apps[app_name]
-            domains = {
-                name: domain.to_dict()
-                for name, domain in app.domains.items()
-            }
-            
-            # build_app_block now includes block_ids for section updates
-            blocks = build_app_block(app_name, app.display_name, domains)
-            
-            if self._should_update_now():
-                # Use section-based update (blocks have block_ids)
-                self._update_canvas(blocks, is_full_sync=False)
-                return True
-            else:
-                self._pending_update = blocks
-                # Schedule a delayed update
-                delay = self.DEBOUNCE_INTERVAL - (time.time() - self._last_update_time)
-                self._timer = threading.Timer(delay, self._process_scheduled_update)
-                self._timer.daemon = True
-                self._timer.start()
-                return False
+        state = self._read_state()
+        
+        if app_name not in state.apps:
+            return False
+        
+        app = state.apps[app_name]
+        if not self._claim_or_defer((app_name, name) for name in app.domains):
+            return False
+        
+        domains = {
+            name: domain.to_dict()
+            for name, domain in app.domains.items()
+        }
+        
+        # build_app_block now includes block_ids for section updates
+        blocks = build_app_block(app_name, app.display_name, domains)
+        
+        self._update_canvas(blocks, is_full_sync=False)
+        return True
     
-    def stop(self):
-        """Stop the background processor thread."""
-        self._stop_processor.set()
-        with self._update_lock:
-            if self._timer is not None:
-                self._timer.cancel()
-                self._timer = None
-            self._pending_update = None
+    def stop(self, timeout: Optional[float] = 1.0):
+        """Cancel any pending debounced update and end the flusher thread.
+        
+        Args:
+            timeout: Seconds to wait for the flusher thread to exit
+        """
+        with self._cv:
+            flusher = self._flusher
+            self._flusher = None
+            self._deadline = None
+            self._dirty.clear()
+            self._cv.notify_all()
+        
+        if flusher is not None and flusher is not threading.current_thread():
+            flusher.join(timeout)
@@ -1,17 +1,60 @@
 """Slack SDK wrapper with retry logic for EPMPulse."""
 
+import logging
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import Optional, List, Dict, Any
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
-# SlackRateLimitError may be named differently in newer slack-sdk versions
-try:
-    from slack_sdk.errors import SlackRateLimitError
-except ImportError:
-    # Fallback: create a simple exception class if not available
-    class SlackRateLimitError(SlackApiError):
-        pass
+from ..utils.decorators import TokenBucket
+
+
+logger = logging.getLogger("epmpulse.slack")
+
+
+class SlackThrottledError(Exception):
+    """Raised when no rate-limit token frees up within the caller's wait limit."""
+    pass
+
+
+class _ThrottledWebClient(WebClient):
+    """WebClient that takes a rate-limit token before every API call.
+    
+    Every SDK method (canvases_edit, conversations_list, ...) goes through
+    api_call, so pacing here also covers callers using ``.client`` directly.
+    Threads inside SlackClient.bounded_wait() give up after their limit
+    instead of waiting out the bucket (or a Retry-After pause).
+    """
+    
+    # Not paced: auth.test is a Tier 4 method used by health checks, which
+    # must not queue behind canvas calls or a Retry-After pause
+    UNPACED_METHODS = frozenset({"auth.test"})
+    
+    def __init__(self, *args, rate_limiter: TokenBucket, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.rate_limiter = rate_limiter
+        self.wait_limit = threading.local()
+    
+    def api_call(self, api_method: str, *args, **kwargs):
+        if api_method not in self.UNPACED_METHODS:
+            timeout = getattr(self.wait_limit, "seconds", None)
+            if not self.rate_limiter.consume(timeout=timeout):
+                raise SlackThrottledError(
+                    f"No Slack rate limit budget for {api_method} within {timeout}s"
+                )
+        return super().api_call(api_method, *args, **kwargs)
+
+
+def _worker_count() -> int:
+    """Worker processes sharing the bot token (gunicorn.conf.py exports it)."""
+    try:
+        return max(1, int(os.environ.get("EPMPULSE_WORKERS", "1")))
+    except ValueError:
+        return 1
 
 
 class SlackClient:
@@ -19,12 +62,18 @@ class SlackClient:
     
     DEFAULT_MAX_RETRIES = 3
     DEFAULT_BACKOFF_SECONDS = [1, 2, 4]
+    SECTION_UPDATE_WORKERS = 4  # concurrent canvas section requests
+    DEFAULT_RATE_PER_SEC = 50 / 60  # Slack Tier 3 (canvases.*): ~50 calls/min per token
+    DEFAULT_BURST = 5
+    CHANNEL_PAGE_LIMIT = 1000  # Slack's maximum conversations.list page size
+    CHANNEL_CACHE_TTL = 300.0  # seconds
     
     def __init__(
         self,
         bot_token: Optional[str] = None,
         max_retries: int = DEFAULT_MAX_RETRIES,
-        backoff_seconds: Optional[List[int]] = None
+        backoff_seconds: Optional[List[int]] = None,
+        rate_limiter: Optional[TokenBucket] = None
     ):
         """Initialize Slack client.
         
@@ -32,18 +81,51 @@ class SlackClient:
             bot_token: Slack bot token (reads from env if not provided)
             max_retries: Maximum retry attempts
             backoff_seconds: List of backoff delays for retries
+            rate_limiter: Token bucket pacing API calls (default: the Tier 3
+                budget split evenly across EPMPULSE_WORKERS processes, with
+                a burst of DEFAULT_BURST)
         """
         self.bot_token = bot_token or self._get_token_from_env()
         self.max_retries = max_retries
         self.backoff_seconds = backoff_seconds or self.DEFAULT_BACKOFF_SECONDS
+        # The Slack limit is per token, the bucket per process
+        self.rate_limiter = rate_limiter or TokenBucket(
+            self.DEFAULT_RATE_PER_SEC / _worker_count(), self.DEFAULT_BURST
+        )
         
         self.client = None
         if self.bot_token:
-            self.client = WebClient(token=self.bot_token)
+            self.client = _ThrottledWebClient(
+                token=self.bot_token, rate_limiter=self.rate_limiter
+            )
+        
+        self._section_pool: Optional[ThreadPoolExecutor] = None
+        self._channels_cache: tuple = (0.0, None)  # (monotonic time, channels)
+        self._section_pool_lock = threading.Lock()
+    
+    @contextmanager
+    def bounded_wait(self, seconds: float):
+        """Limit how long API calls in this thread wait for a rate-limit token.
+        
+        Meant for request threads: a call that would wait longer raises
+        SlackThrottledError instead of holding the request.
+        
+        Args:
+            seconds: Maximum wait per API call
+        """
+        if self.client is None:
+            yield
+            return
+        wait_limit = self.client.wait_limit
+        previous = getattr(wait_limit, "seconds", None)
+        wait_limit.seconds = seconds
+        try:
+            yield
+        finally:
+            wait_limit.seconds = previous
     
     def _get_token_from_env(self) -> Optional[str]:
         """Get Slack bot token from environment."""
-        import os
         return os.environ.get('SLACK_BOT_TOKEN')
     
     def is_configured(self) -> bool:
@@ -61,6 +143,24 @@ class SlackClient:
         except SlackApiError:
             return False
     
+    @staticmethod
+    def _retry_after(error: SlackApiError) -> Optional[float]:
+        """Seconds Slack asked us to wait on a 429, if it said.
+        
+        Args:
+            error: Error raised by the SDK
+            
+        Returns:
+            Retry-After value in seconds, or None if not rate limited
+        """
+        response = getattr(error, 'response', None)
+        if response is None or getattr(response, 'status_code', None) != 429:
+            return None
+        try:
+            return float(response.headers.get('Retry-After'))
+        except (TypeError, ValueError):
+            return None
+    
     def _make_request_with_retry(self, method, *args, **kwargs) -> Optional[Any]:
         """Make API request with retry logic.
         
@@ -78,18 +178,16 @@ class SlackClient:
         for attempt in range(self.max_retries):
             try:
                 return method(*args, **kwargs)
-            except SlackRateLimitError as e:
-                if attempt < self.max_retries - 1:
-                    backoff = self.backoff_seconds[attempt % len(self.backoff_seconds)]
-                    time.sleep(backoff)
-                else:
-                    raise
             except SlackApiError as e:
-                if attempt < self.max_retries - 1:
-                    backoff = self.backoff_seconds[attempt % len(self.backoff_seconds)]
-                    time.sleep(backoff)
-                else:
+                if attempt >= self.max_retries - 1:
                     raise
+                retry_after = self._retry_after(e)
+                if retry_after is not None:
+                    # Every caller waits out the penalty; the retry's own
+                    # api_call blocks on the bucket until it is over
+                    self.rate_limiter.pause(retry_after)
+                else:
+                    time.sleep(self.backoff_seconds[attempt % len(self.backoff_seconds)])
     
     def update_canvas_section(
         self,
@@ -110,7 +208,7 @@ class SlackClient:
             True if successful, False otherwise
         """
         if not content and not blocks:
-            print("Canvas section update failed: must provide content or blocks")
+            logger.warning("Canvas section update failed: must provide content or blocks")
             return False
         
         try:
@@ -127,12 +225,55 @@ class SlackClient:
             return True
         except AttributeError:
             # canvases_section_update not available in this SDK version
-            print("Warning: canvases_section_update not available in Slack SDK version")
+            logger.warning("canvases_section_update not available in this Slack SDK version")
             return False
         except SlackApiError as e:
-            print(f"Canvas section update failed: {e}")
+            logger.warning("Canvas section update failed: %s", e)
             return False
     
+    def _get_section_pool(self) -> ThreadPoolExecutor:
+        """Get or create the pool used for concurrent section updates."""
+        if self._section_pool is None:
+            with self._section_pool_lock:
+                if self._section_pool is None:
+                    self._section_pool = ThreadPoolExecutor(
+                        max_workers=self.SECTION_UPDATE_WORKERS,
+                        thread_name_prefix="epmpulse-slack"
+                    )
+        return self._section_pool
+    
+    def update_canvas_sections(
+        self,
+        canvas_id: str,
+        sections: Dict[str, List[Dict[str, Any]]]
+    ) -> Dict[str, bool]:
+        """Update several canvas sections concurrently.
+        
+        Independent sections are sent in parallel, so a flush costs about
+        one round-trip instead of one per section.
+        
+        Args:
+            canvas_id: Canvas ID to update
+            sections: Mapping of section_id to the blocks for that section
+            
+        Returns:
+            Mapping of section_id to whether its update succeeded
+        """
+        if len(sections) <= 1:
+            return {
+                section_id: self.update_canvas_section(canvas_id, section_id, blocks=blocks)
+                for section_id, blocks in sections.items()
+            }
+        
+        pool = self._get_section_pool()
+        futures = {
+            section_id: pool.submit(
+                self.update_canvas_section, canvas_id, section_id, blocks=blocks
+            )
+            for section_id, blocks in sections.items()
+        }
+        return {section_id: future.result() for section_id, future in futures.items()}
+    
     def get_canvas(self, canvas_id: str) -> Optional[Dict[str, Any]]:
         """Get canvas details.
         
@@ -150,9 +291,17 @@ class SlackClient:
     def list_channels(self) -> List[Dict[str, Any]]:
         """List all channels the bot can see.
         
+        Pages are requested at Slack's maximum page size, and the result is
+        cached for CHANNEL_CACHE_TTL seconds since the channel set rarely
+        changes.
+        
         Returns:
             List of channel data dictionaries
         """
+        cached_at, cached = self._channels_cache
+        if cached is not None and time.monotonic() - cached_at < self.CHANNEL_CACHE_TTL:
+            return cached
+        
         try:
             channels = []
             cursor = None
@@ -160,6 +309,7 @@ class SlackClient:
             while True:
                 result = self.client.conversations_list(
                     cursor=cursor,
+                    limit=self.CHANNEL_PAGE_LIMIT,
                     types=['public_channel', 'private_channel']
                 )
                 
@@ -169,6 +319,7 @@ class SlackClient:
                 if not cursor:
                     break
             
+            self._channels_cache = (time.monotonic(), channels)
             return channels
         except SlackApiError:
             return []
@@ -0,0 +1,192 @@
+"""Debounced coalescing of canvas updates for EPMPulse.
+
+Status updates arrive in bursts (a batch job typically reports several
+domains within a few milliseconds). Rather than issuing one Slack call per
+update inside the request, updates are queued per (app, domain) and flushed
+once the stream goes idle, so rapid successive updates collapse to a single
+Slack write per domain.
+
+Enqueueing is on the request path, so it only updates a dict and a
+deadline under a short lock; one long-lived thread waits for the deadline
+and flushes, instead of a new Timer thread per request.
+
+The pending map is bounded: once it holds ``max_pending`` distinct
+domains, a producer adding another flushes immediately and waits for the
+drain, so a flood of distinct (app, domain) keys cannot grow it without
+limit.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+
+logger = logging.getLogger("epmpulse.slack")
+
+# (app_name, domain_name) -> latest status
+PendingUpdates = Dict[Tuple[str, str], str]
+
+
+class CanvasDebouncer:
+    """Coalesces canvas updates and flushes them after an idle period."""
+
+    DEFAULT_DELAY = 0.25  # seconds of idle time before flushing
+    MAX_PENDING = 256  # distinct (app, domain) keys held before producers wait
+
+    def __init__(
+        self,
+        flush_callback: Callable[[PendingUpdates], None],
+        delay: float = DEFAULT_DELAY,
+        max_pending: int = MAX_PENDING
+    ):
+        """Initialize debouncer.
+
+        Args:
+            flush_callback: Called with the drained {(app, domain): status}
+                mapping whenever the debouncer flushes
+            delay: Idle seconds after the last enqueue before flushing
+            max_pending: Distinct domains held before enqueue blocks on a flush
+        """
+        self.flush_callback = flush_callback
+        self.delay = delay
+        self.max_pending = max_pending
+        self._pending: PendingUpdates = {}
+        self._lock = threading.Lock()
+        self._cv = threading.Condition(self._lock)
+        self._deadline: Optional[float] = None  # time.monotonic() of the next flush
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def enqueue(self, app_name: str, domain_name: str, status: str) -> None:
+        """Queue a single domain update.
+
+        Args:
+            app_name: Application name
+            domain_name: Domain name
+            status: New status value
+        """
+        self.enqueue_many([(app_name, domain_name, status)])
+
+    def enqueue_many(self, updates: Iterable[Tuple[str, str, str]]) -> None:
+        """Queue several domain updates under a single lock acquisition.
+
+        Blocks while the pending map is full of other domains; updates to a
+        domain already pending never wait.
+
+        Args:
+            updates: Iterable of (app_name, domain_name, status) tuples
+        """
+        with self._cv:
+            for app_name, domain_name, status in updates:
+                key = (app_name, domain_name)
+                if key not in self._pending:
+                    self._wait_for_room()
+                self._pending[key] = status
+            self._reset_deadline()
+
+    def _wait_for_room(self) -> None:
+        """Block until another key fits under max_pending. Caller must hold the lock.
+
+        A full map is flushed now rather than at the idle deadline, so a
+        producer waits for one flush, not for the stream to go quiet.
+        """
+        while len(self._pending) >= self.max_pending and not self._stopped:
+            self._deadline = time.monotonic()
+            self._start_flusher()
+            self._cv.notify_all()
+            self._cv.wait()
+
+    def _start_flusher(self) -> bool:
+        """Start the flusher thread if needed. Caller must hold the lock.
+
+        Returns:
+            True if a new thread was started
+        """
+        if self._thread is not None:
+            return False
+        self._thread = threading.Thread(
+            target=self._run,
+            name="epmpulse-canvas-debouncer",
+            daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def _reset_deadline(self) -> None:
+        """Push the flush deadline out by the idle delay. Caller must hold the lock.
+
+        The flusher is only woken when it has no deadline; a later deadline
+        is picked up when its current wait expires.
+        """
+        if self._stopped:
+            self._deadline = None
+            return
+        idle = self._deadline is None
+        self._deadline = time.monotonic() + self.delay
+        if not self._start_flusher() and idle:
+            self._cv.notify()
+
+    def _run(self) -> None:
+        """Flusher loop: sleep until the idle deadline passes, then flush."""
+        me = threading.current_thread()
+        while True:
+            with self._cv:
+                while self._thread is me:
+                    if self._deadline is None:
+                        self._cv.wait()
+                        continue
+                    remaining = self._deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cv.wait(remaining)
+                if self._thread is not me:
+                    return
+            self.flush()
+
+    def flush(self) -> None:
+        """Drain pending updates and hand them to the flush callback."""
+        with self._cv:
+            pending = self._pending
+            self._pending = {}
+            self._deadline = None
+            # Wake producers blocked on a full map
+            self._cv.notify_all()
+
+        if not pending:
+            return
+
+        try:
+            self.flush_callback(pending)
+        except Exception as e:
+            # Canvas updates are best-effort; never let them kill the flusher thread
+            logger.warning("Canvas flush failed for %d updates: %s", len(pending), e)
+
+    @property
+    def pending_count(self) -> int:
+        """Number of (app, domain) updates waiting to be flushed."""
+        with self._lock:
+            return len(self._pending)
+
+    def start(self) -> None:
+        """Allow the debouncer to schedule flushes."""
+        with self._lock:
+            self._stopped = False
+
+    def stop(self, flush: bool = True) -> None:
+        """End the flusher thread and optionally flush what is pending.
+
+        Args:
+            flush: If True, deliver pending updates before returning
+        """
+        with self._cv:
+            self._stopped = True
+            self._deadline = None
+            self._thread = None
+            self._cv.notify_all()
+
+        if flush:
+            self.flush()
+        else:
+            with self._lock:
+                self._pending = {}
@@ -0,0 +1,154 @@
+"""Background worker that performs canvas updates off the request path.
+
+A single daemon thread owns all Slack canvas I/O. Producers (the request
+handlers, via the debouncer) only put (app, domain, status) tuples on a
+queue, so Slack latency and rate limiting never reach API response times
+and canvas calls are serialized instead of racing in parallel threads.
+
+The queue is bounded; when Slack falls behind, ``put`` blocks the producer
+(normally the debouncer's flusher thread) until the worker frees a slot.
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Iterable, Optional, Tuple
+
+from .debouncer import PendingUpdates
+
+
+logger = logging.getLogger("epmpulse.slack")
+
+
+class CanvasWorker:
+    """Daemon thread draining queued canvas updates in small batches."""
+
+    BATCH_WINDOW = 0.1  # seconds to keep collecting after the first item
+    MAX_BATCH = 50  # items consumed per batch before processing
+    MAX_QUEUE = 1024  # queued items before producers block
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        process_callback: Callable[[PendingUpdates], None],
+        batch_window: float = BATCH_WINDOW,
+        max_batch: int = MAX_BATCH,
+        max_queue: int = MAX_QUEUE
+    ):
+        """Initialize worker.
+
+        Args:
+            process_callback: Called on the worker thread with each coalesced
+                {(app, domain): status} batch
+            batch_window: Seconds to wait for more items after the first
+            max_batch: Maximum items consumed before processing a batch
+            max_queue: Queue capacity; enqueue blocks while it is full
+        """
+        self.process_callback = process_callback
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+
+    def enqueue(self, app_name: str, domain_name: str, status: str) -> None:
+        """Queue a single domain update.
+
+        Args:
+            app_name: Application name
+            domain_name: Domain name
+            status: New status value
+        """
+        self._queue.put((app_name, domain_name, status))
+
+    def enqueue_many(self, updates: Iterable[Tuple[str, str, str]]) -> None:
+        """Queue several domain updates.
+
+        Args:
+            updates: Iterable of (app_name, domain_name, status) tuples
+        """
+        for update in updates:
+            self._queue.put(update)
+
+    def submit(self, pending: PendingUpdates) -> None:
+        """Queue a coalesced batch (flush callback for CanvasDebouncer).
+
+        Args:
+            pending: {(app, domain): status} mapping
+        """
+        self.enqueue_many(
+            (app_name, domain_name, status)
+            for (app_name, domain_name), status in pending.items()
+        )
+
+    def is_running(self) -> bool:
+        """Check if the worker thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the worker thread if it is not already running."""
+        with self._thread_lock:
+            if self.is_running():
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                name="epmpulse-canvas-worker",
+                daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Process everything queued so far, then stop the thread.
+
+        Args:
+            timeout: Seconds to wait for the thread to finish
+        """
+        with self._thread_lock:
+            if not self.is_running():
+                return
+            self._queue.put(self._STOP)
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        """Worker loop: block for an item, gather a batch, process it."""
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+
+            pending: PendingUpdates = {}
+            stopping = False
+            consumed = 0
+            deadline = time.monotonic() + self.batch_window
+
+            while True:
+                app_name, domain_name, status = item
+                pending[(app_name, domain_name)] = status
+                consumed += 1
+                if consumed >= self.max_batch:
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stopping = True
+                    break
+
+            self._process(pending)
+            if stopping:
+                return
+
+    def _process(self, pending: PendingUpdates) -> None:
+        """Hand a batch to the callback, keeping the thread alive on errors."""
+        try:
+            self.process_callback(pending)
+        except Exception as e:
+            logger.warning("Canvas worker failed for %d updates: %s", len(pending), e)
@@ -1,19 +1,78 @@
 """State manager for EPMPulse with file locking and atomic writes.
 
 Handles all JSON file operations for persistent state management.
-Uses fcntl for exclusive file locking to handle concurrent updates.
+Threads of one process serialize on an RLock; when several worker
+processes share the file (multi_process, the default), updates and the
+context manager also hold an fcntl lock file from read to rename.
 Implements atomic writes (write to temp, then rename) to prevent corruption.
+The file is parsed and serialized with orjson when it is installed.
+
+In single-process mode concurrent writes are group-committed: a new
+document is published in memory first, and whoever writes the file next
+includes every document published so far, so writers that arrive during
+an fsync share the following one instead of queueing for their own.
+
+Writes can optionally be deferred (write-behind): mutations update the
+in-memory document at once and a background thread writes the latest
+document at most once per interval, so a burst of updates costs one
+fsync. A deferred write is lost if the process dies before it flushes,
+and other processes only see it after the flush, so write-behind is
+meant for single-worker deployments.
 """
 
+import atexit
 import fcntl
 import json
+import logging
+import mmap
 import os
-import tempfile
-from datetime import datetime, timezone
+import threading
+import time
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable
+
+from src.state.models import State, App, Domain, VALID_STATUSES, INVALID_STATUS_MESSAGE, utc_now_iso
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+logger = logging.getLogger("epmpulse.state")
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes (orjson.JSONDecodeError subclasses json's)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
-from src.state.models import State, App, Domain
+
+# Files at least this large are parsed from an mmap instead of a read() copy
+MMAP_THRESHOLD = 1 << 20
+
+
+def _load_file(f) -> Any:
+    """Parse an open state file; large files are parsed straight from the page cache.
+    
+    orjson accepts any buffer, so an mmap view avoids copying the file into
+    a bytes object first. The stdlib fallback needs bytes and reads normally.
+    """
+    if orjson is not None:
+        size = os.fstat(f.fileno()).st_size
+        if size and size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+    return _loads(f.read())
+
+
+def _dumps_indented(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON indented by two spaces, like json.dump(indent=2)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
 
 
 class StateError(Exception):
@@ -21,62 +80,289 @@ class StateError(Exception):
     pass
 
 
+# fdatasync skips flushing timestamps the rename makes irrelevant (Linux)
+_datasync = getattr(os, 'fdatasync', os.fsync)
+
+
 class StateManager:
     """Manages EPMPulse state with file locking and atomic writes."""
+    
+    # Also fsync the data directory after the rename, making the rename
+    # itself survive a power loss (costs one more journal commit per write;
+    # writes inside a with-block share one at the end of the block)
+    FSYNC_DIRECTORY = False
 
-    def __init__(self, state_file: Optional[Path] = None):
+    def __init__(
+        self,
+        state_file: Optional[Path] = None,
+        write_behind: Optional[float] = None,
+        multi_process: bool = True,
+        durable: bool = True
+    ):
         """Initialize state manager.
         
         Args:
             state_file: Path to state JSON file. Defaults to data/apps_status.json
+            write_behind: If set, defer writes and flush the latest document
+                at most once per this many seconds (single worker only)
+            multi_process: Whether other processes may write the file; if
+                True updates take the fcntl lock file around each
+                read-modify-write, if False they only lock in-process and
+                concurrent writes are group-committed
+            durable: Whether to fsync each write before the rename; if
+                False writes stay atomic but may be lost on power failure
+                (meant for tests and throwaway state)
+        
+        Raises:
+            ValueError: If write_behind is combined with multi_process
         """
+        if write_behind and multi_process:
+            # Deferred documents live in this process only; another worker
+            # would derive from the file and overwrite them on flush
+            raise ValueError("write_behind requires multi_process=False")
         self.state_file = state_file or Path(__file__).parent.parent.parent / "data" / "apps_status.json"
+        self.write_behind = write_behind
+        self.multi_process = multi_process
+        self.durable = durable
         self._lock_fd = None
+        self._lock_depth = 0
+        self._lock_owner: Optional[int] = None  # thread running the outermost with-block
+        self._dir_dirty = False  # a rename in that block still needs its directory fsync
+        self._version = 0
+        # (version token, parsed file contents) of the last read or write
+        self._cache: tuple = (None, None)
+        # Serializes read-modify-store and context-manager blocks in this process
+        self._thread_lock = threading.RLock()
+        # Newest document not yet on disk (group commit / write-behind)
+        self._pending: Optional[Dict[str, Any]] = None
+        self._generation = 0  # bumped per published document; part of version()
+        self._committed = 0  # generation of the last document written
+        self._pending_cv = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._flusher: Optional[threading.Thread] = None
+        if write_behind:
+            atexit.register(self.flush)
     
     def _ensure_dir(self):
         """Ensure data directory exists."""
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
     
-    def read(self) -> State:
-        """Read state from JSON file."""
-        self._ensure_dir()
+    def version(self) -> tuple:
+        """Return a token that changes whenever the state changes.
         
-        if not self.state_file.exists():
-            return State()
+        Combines in-process write counters with the state file's inode,
+        mtime and size, so writes made by other processes (e.g. other
+        gunicorn workers) and not-yet-written documents are noticed as well.
         
+        Returns:
+            Hashable version token
+        """
         try:
-            with open(self.state_file, 'r') as f:
-                data = json.load(f)
-            return State.from_dict(data)
+            st = os.stat(self.state_file)
+        except FileNotFoundError:
+            return (self._version, self._generation, None)
+        return (self._version, self._generation, st.st_ino, st.st_mtime_ns, st.st_size)
+    
+    def _load(self, fresh: bool = False) -> Optional[Dict[str, Any]]:
+        """Return the parsed state file, re-reading it only when it changed.
+        
+        The parse is cached under version(), so an unchanged file costs one
+        stat (the data directory is only created on write). The returned
+        dict is shared; do not mutate it.
+        
+        Args:
+            fresh: Parse the file even if version() matches the cache. The
+                stat-based token can miss another process's write (inode
+                reuse, coarse mtime, same size), so read-modify-write under
+                the fcntl lock always re-reads.
+        
+        Returns:
+            File contents, or None if the file does not exist
+        """
+        pending = self._pending
+        if pending is not None:
+            # Published but not yet written: memory is newer than the file
+            return pending
+        
+        key = self.version()
+        cached_key, data = self._cache
+        if not fresh and data is not None and cached_key == key:
+            return data
+        
+        try:
+            with open(self.state_file, 'rb') as f:
+                data = _load_file(f)
+        except FileNotFoundError:
+            return None
         except json.JSONDecodeError as e:
             raise StateError(f"Invalid JSON in state file: {e}")
         except IOError as e:
             raise StateError(f"Failed to read state file: {e}")
+        
+        self._cache = (key, data)
+        return data
+    
+    def read(self) -> State:
+        """Read state from JSON file.
+        
+        Each call returns a new State the caller may modify; the file is
+        only parsed again after it changes.
+        """
+        data = self._load()
+        if data is None:
+            return State()
+        return State.from_dict(data)
     
     def write(self, state: State) -> None:
         """Write state atomically using temp file + rename."""
-        self._ensure_dir()
-        
         # Update timestamp
-        state.last_updated = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+        state.last_updated = utc_now_iso()
+        if self.multi_process:
+            # On disk before the lock is released, like update()
+            with self:
+                self._commit(self._publish(state.to_dict()))
+            return
+        self._commit(self._publish(state.to_dict()))
+    
+    def _publish(self, data: Dict[str, Any]) -> int:
+        """Make a document the current state in memory, before it is written.
         
-        # Atomic write pattern
-        fd, tmp_path = tempfile.mkstemp(
-            dir=self.state_file.parent,
-            suffix='.tmp'
-        )
+        Callers building on the current document hold _thread_lock while
+        publishing, then call _commit() after releasing it.
+        
+        Args:
+            data: Complete state document (must not be mutated afterwards)
+            
+        Returns:
+            Generation number to pass to _commit()
+        """
+        with self._pending_cv:
+            self._pending = data
+            self._generation += 1
+            if self.write_behind and self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_loop,
+                    name="epmpulse-state-flusher",
+                    daemon=True
+                )
+                self._flusher.start()
+            self._pending_cv.notify()
+            return self._generation
+    
+    def _commit(self, generation: int) -> None:
+        """Return once a published document is on disk (group commit).
+        
+        Writers queue on one lock; the one holding it writes the newest
+        published document, which includes every earlier generation, so
+        the writers behind it usually find their document already written.
+        With write-behind, the flusher writes it later instead.
+        
+        Args:
+            generation: Value returned by _publish()
+            
+        Raises:
+            StateError: If the write carrying this document fails
+        """
+        if self.write_behind:
+            return
+        with self._flush_lock:
+            if self._committed >= generation:
+                return
+            if self._pending is None:
+                # Dropped after a failed write that carried this document
+                raise StateError("Failed to write state file: a concurrent write failed")
+            try:
+                self._flush_locked()
+            except StateError:
+                # Readers fall back to the file rather than unwritten state
+                with self._pending_cv:
+                    self._pending = None
+                raise
+    
+    def _flush_loop(self) -> None:
+        """Write-behind thread: write the latest document once per interval."""
+        while True:
+            with self._pending_cv:
+                while self._pending is None:
+                    self._pending_cv.wait()
+            # Let further updates land in the same write
+            time.sleep(self.write_behind)
+            try:
+                self.flush()
+            except StateError as e:
+                logger.warning("Deferred state write failed, will retry: %s", e)
+    
+    def flush(self) -> None:
+        """Write a deferred document to disk now (no-op if none is pending).
         
+        Raises:
+            StateError: If the write fails; the document stays pending
+        """
+        with self._flush_lock:
+            self._flush_locked()
+    
+    def _flush_locked(self) -> None:
+        """Write the newest published document (caller holds _flush_lock)."""
+        with self._pending_cv:
+            data = self._pending
+            generation = self._generation
+        if data is None:
+            return
+        self._write_data(data)
+        with self._pending_cv:
+            self._committed = generation
+            # A newer document may have been published meanwhile
+            if self._pending is data:
+                self._pending = None
+    
+    def _fsync_directory(self) -> None:
+        """fsync the state file's directory so a completed rename is durable."""
+        dir_fd = os.open(str(self.state_file.parent), os.O_RDONLY)
         try:
-            with os.fdopen(fd, 'w') as f:
-                # Acquire exclusive lock on temp file
-                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-                json.dump(state.to_dict(), f, indent=2)
-                f.flush()
-                os.fsync(f.fileno())
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    
+    def _write_data(self, data: Dict[str, Any]) -> None:
+        """Atomically replace the state file with an already-built document.
+        
+        Args:
+            data: Complete state document; kept as the read cache afterwards,
+                so it must not be mutated later
+        """
+        self._ensure_dir()
+        
+        # Atomic write pattern: a scratch file per (process, thread) is
+        # truncated and reused instead of mkstemp generating a new name each
+        # time. No other writer can share the name, so it needs no lock; the
+        # rename is what readers observe.
+        tmp_path = str(self.state_file.with_name(
+            f"{self.state_file.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        ))
+        
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            # Serialized once and written with raw os.write calls
+            try:
+                payload = memoryview(_dumps_indented(data))
+                while payload:
+                    payload = payload[os.write(fd, payload):]
+                if self.durable:
+                    _datasync(fd)
+            finally:
+                os.close(fd)
             
             # Atomic rename
             os.replace(tmp_path, str(self.state_file))
+            if self.durable and self.FSYNC_DIRECTORY:
+                if self._lock_owner == threading.get_ident():
+                    # Deferred to __exit__, once for the whole block
+                    self._dir_dirty = True
+                else:
+                    self._fsync_directory()
+            self._version += 1
+            # Our own next read is served from what was just written
+            self._cache = (self.version(), data)
         except Exception as e:
             # Cleanup on error
             try:
@@ -96,6 +382,10 @@ class StateManager:
     ) -> Domain:
         """Update a domain's status.
         
+        Only the path to the changed domain is copied from the cached
+        document; other apps and domains are shared with it, not rebuilt
+        as dataclasses and converted back.
+        
         Args:
             app_name: Application name
             domain_name: Domain name
@@ -107,56 +397,137 @@ class StateManager:
         Returns:
             Updated Domain object
         """
-        state = self.read()
+        updated = utc_now_iso()
         
-        # Create or update domain
+        # Create or update domain (validates the status)
         domain = Domain(
             status=status,
             job_id=job_id,
             message=message,
-            updated=datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+            updated=updated,
             duration_sec=duration_sec
         )
         
-        state.add_domain(app_name, domain_name, domain)
-        self.write(state)
+        def apply(apps):
+            self._copy_app(apps, app_name)["domains"][domain_name] = domain.to_dict()
+        
+        self._store(updated, apply)
         
         return domain
     
-    def batch_update(self, updates: list) -> Dict[str, Any]:
+    def _store(self, updated: str, apply) -> None:
+        """Derive the next document from the current one and commit it.
+        
+        With multi_process the fcntl lock is held from reading the current
+        document to the rename, so worker processes never build on a file
+        another worker is about to replace; the file is parsed again once
+        the lock is held instead of trusting the cache. Otherwise only the
+        in-process lock is held while deriving, and the write is
+        group-committed with other threads' updates.
+        
+        Args:
+            updated: Timestamp for the document's last_updated
+            apply: Callable putting the changed apps into a copied apps map
+        """
+        if self.multi_process:
+            with self:
+                self._commit(self._derive(updated, apply, fresh=True))
+            return
+        with self._thread_lock:
+            generation = self._derive(updated, apply)
+        self._commit(generation)
+    
+    def _derive(self, updated: str, apply, fresh: bool = False) -> int:
+        """Publish the current document with ``apply`` applied (caller holds _thread_lock)."""
+        data = self._base_document(fresh)
+        apps = dict(data.get("apps", {}))
+        apply(apps)
+        return self._publish({**data, "last_updated": updated, "apps": apps})
+    
+    def _base_document(self, fresh: bool = False) -> Dict[str, Any]:
+        """Current document to derive the next version from (caller holds _thread_lock)."""
+        data = self._load(fresh)
+        if data is None or not data.get("metadata"):
+            # New or pre-metadata file: let State fill in the defaults
+            data = State.from_dict(data or {}).to_dict()
+        return data
+    
+    @staticmethod
+    def _copy_app(apps: Dict[str, Any], app_name: str) -> Dict[str, Any]:
+        """Put a copy of one app, with its own domains map, into ``apps``.
+        
+        Args:
+            apps: Apps map of the document being built (already a copy)
+            app_name: Application name; created if missing
+            
+        Returns:
+            The copied app dict, safe to modify
+        """
+        app = apps.get(app_name)
+        app = dict(app) if app is not None else App(name=app_name, display_name=app_name).to_dict()
+        app["domains"] = dict(app.get("domains", {}))
+        apps[app_name] = app
+        return app
+    
+    def batch_update(self, updates: Iterable[Any]) -> Dict[str, Any]:
         """Update multiple domains.
         
         Args:
-            updates: List of update dicts
+            updates: Iterable of update objects exposing ``app``, ``domain``,
+                ``status``, ``job_id`` and ``message`` attributes (e.g. the
+                validated StatusUpdateRequest models)
             
         Returns:
             Dict with update results
+            
+        Raises:
+            ValueError: If any status is invalid; nothing is written then
         """
-        state = self.read()
+        return self.update_many(
+            (update.app, update.domain, update.status, update.job_id, update.message)
+            for update in updates
+        )
+    
+    def update_many(self, updates: Iterable[tuple]) -> Dict[str, Any]:
+        """Apply several domain updates as one document and one file write.
         
-        results = []
-        for update in updates:
-            app_name = update.get('app')
-            domain_name = update.get('domain')
-            status = update.get('status')
-            job_id = update.get('job_id')
-            message = update.get('message')
+        Args:
+            updates: Iterable of ``(app, domain, status, job_id, message)``
+                tuples; ``job_id`` and ``message`` may be omitted
+            
+        Returns:
+            Dict with update results
             
-            domain = Domain(
-                status=status,
-                job_id=job_id,
-                message=message,
-                updated=datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
-                duration_sec=None
-            )
-            state.add_domain(app_name, domain_name, domain)
-            results.append({
-                'app': app_name,
-                'domain': domain_name,
-                'status': status
-            })
-        
-        self.write(state)
+        Raises:
+            ValueError: If any status is invalid; nothing is written then
+        """
+        rows = [tuple(row) + (None,) * (5 - len(row)) for row in updates]
+        # Validate everything before touching the document
+        if not VALID_STATUSES.issuperset(row[2] for row in rows):
+            raise ValueError(INVALID_STATUS_MESSAGE)
+        
+        updated = utc_now_iso()
+        
+        def apply(apps):
+            copied = {}
+            for app_name, domain_name, status, job_id, message in rows:
+                app = copied.get(app_name)
+                if app is None:
+                    app = copied[app_name] = self._copy_app(apps, app_name)
+                app["domains"][domain_name] = {
+                    "status": status,
+                    "job_id": job_id,
+                    "message": message,
+                    "updated": updated,
+                    "duration_sec": None
+                }
+        
+        self._store(updated, apply)
+        
+        results = [
+            {'app': app_name, 'domain': domain_name, 'status': status}
+            for app_name, domain_name, status, _, _ in rows
+        ]
         
         return {
             'updated_count': len(results),
@@ -164,23 +535,28 @@ class StateManager:
         }
     
     def get_all(self) -> Dict[str, Any]:
-        """Get all statuses formatted for API response."""
-        state = self.read()
+        """Get all statuses formatted for API response.
+        
+        Built straight from the parsed document; read-only responses do not
+        need the validated dataclass tree.
+        """
+        data = self._load() or {}
         
         apps_data = {}
-        for app_name, app in state.apps.items():
-            apps_data[app_name] = {}
-            for domain_name, domain in app.domains.items():
-                apps_data[app_name][domain_name] = {
-                    'status': domain.status,
-                    'job_id': domain.job_id,
-                    'message': domain.message,
-                    'updated': domain.updated,
-                    'duration_sec': domain.duration_sec
+        for app_name, app in data.get('apps', {}).items():
+            apps_data[app_name] = {
+                domain_name: {
+                    'status': domain.get('status', 'Blank'),
+                    'job_id': domain.get('job_id'),
+                    'message': domain.get('message'),
+                    'updated': domain.get('updated'),
+                    'duration_sec': domain.get('duration_sec')
                 }
+                for domain_name, domain in app.get('domains', {}).items()
+            }
         
         return {
-            'last_updated': state.last_updated,
+            'last_updated': data.get('last_updated'),
             'apps': apps_data
         }
     
@@ -193,38 +569,89 @@ class StateManager:
         Returns:
             Dict with app data or None
         """
-        state = self.read()
+        data = self._load() or {}
         
-        if app_name not in state.apps:
+        app = data.get('apps', {}).get(app_name)
+        if app is None:
             return None
         
-        app = state.apps[app_name]
-        domains = {}
-        for domain_name, domain in app.domains.items():
-            domains[domain_name] = {
-                'status': domain.status,
-                'job_id': domain.job_id,
-                'updated': domain.updated
+        domains = {
+            domain_name: {
+                'status': domain.get('status', 'Blank'),
+                'job_id': domain.get('job_id'),
+                'updated': domain.get('updated')
             }
+            for domain_name, domain in app.get('domains', {}).items()
+        }
         
         return {
             'app': app_name,
             'domains': domains,
-            'last_updated': state.last_updated
+            'last_updated': data.get('last_updated')
         }
     
     def __enter__(self) -> "StateManager":
-        """Context manager entry - acquire lock."""
-        self._ensure_dir()
-        lock_path = self.state_file.with_suffix('.lock')
-        self._lock_fd = os.open(str(lock_path), os.O_CREAT | os.O_RDWR, 0o644)
-        fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+        """Context manager entry - acquire lock.
+        
+        The in-process RLock is re-entrant, so nested blocks in one thread
+        are fine; the fcntl lock is taken by the outermost block only, and
+        only when multi_process is set. It is held on a sibling ``.lock``
+        file, which keeps its inode while the state file is replaced, and
+        that file is opened once and kept open until close().
+        """
+        self._thread_lock.acquire()
+        self._lock_depth += 1
+        if self._lock_depth == 1:
+            self._lock_owner = threading.get_ident()
+        if self._lock_depth == 1 and self.multi_process:
+            try:
+                fcntl.flock(self._lock_file_fd(), fcntl.LOCK_EX)
+            except BaseException:
+                self._lock_depth -= 1
+                self._lock_owner = None
+                self._thread_lock.release()
+                raise
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit - release lock."""
-        if self._lock_fd:
-            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
-            os.close(self._lock_fd)
-            self._lock_fd = None
+        """Context manager exit - sync the directory if needed, release lock.
+        
+        Raises:
+            StateError: If the deferred directory fsync fails and the block
+                itself succeeded; otherwise the failure is only logged so
+                the block's exception propagates
+        """
+        try:
+            if self._lock_depth == 1:
+                self._lock_owner = None
+                if self._dir_dirty:
+                    self._dir_dirty = False
+                    try:
+                        self._fsync_directory()
+                    except OSError as e:
+                        if exc_type is None:
+                            raise StateError(f"Failed to sync state directory: {e}")
+                        logger.warning("Failed to sync state directory: %s", e)
+        finally:
+            try:
+                if self._lock_depth == 1 and self._lock_fd is not None:
+                    fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+            finally:
+                self._lock_depth -= 1
+                self._thread_lock.release()
         return False
+    
+    def _lock_file_fd(self) -> int:
+        """Descriptor of the lock file, opened on first use (caller holds _thread_lock)."""
+        if self._lock_fd is None:
+            self._ensure_dir()
+            lock_path = self.state_file.with_suffix('.lock')
+            self._lock_fd = os.open(str(lock_path), os.O_CREAT | os.O_RDWR, 0o644)
+        return self._lock_fd
+    
+    def close(self) -> None:
+        """Close the lock file descriptor; the next locked block reopens it."""
+        with self._thread_lock:
+            if self._lock_fd is not None and self._lock_depth == 0:
+                os.close(self._lock_fd)
+                self._lock_fd = None
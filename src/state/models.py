@@ -1,10 +1,26 @@
 """Data models for EPMPulse state management."""
 
+import sys
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 
 
-@dataclass
+VALID_STATUSES = frozenset({"Blank", "Loading", "OK", "Warning"})
+INVALID_STATUS_MESSAGE = f"Status must be one of: {', '.join(sorted(VALID_STATUSES))}"
+
+
+def utc_now_iso() -> str:
+    """Current UTC time as ISO 8601 with a ``Z`` suffix (the state file format)."""
+    return datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+
+
+def _intern(value: Any) -> Any:
+    """Intern a string read from JSON; other values pass through for validation."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class Domain:
     """Represents a domain within an application."""
     status: str
@@ -13,23 +29,27 @@ class Domain:
     updated: Optional[str] = None
     duration_sec: Optional[int] = None
     
-    VALID_STATUSES = {"Blank", "Loading", "OK", "Warning"}
+    VALID_STATUSES = VALID_STATUSES
     
     def __post_init__(self):
         if self.status not in self.VALID_STATUSES:
-            raise ValueError(
-                f"Status must be one of: {', '.join(self.VALID_STATUSES)}"
-            )
+            raise ValueError(INVALID_STATUS_MESSAGE)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Domain":
-        """Create Domain from dictionary."""
+        """Create Domain from dictionary.
+        
+        The status is interned, so every domain with the same status shares
+        one string object across reads. Fields are passed positionally, in
+        declaration order, since this runs for every domain on every parse.
+        """
+        get = data.get
         return cls(
-            status=data.get("status", "Blank"),
-            job_id=data.get("job_id"),
-            message=data.get("message"),
-            updated=data.get("updated"),
-            duration_sec=data.get("duration_sec")
+            _intern(get("status", "Blank")),
+            get("job_id"),
+            get("message"),
+            get("updated"),
+            get("duration_sec")
         )
     
     def to_dict(self) -> Dict[str, Any]:
@@ -43,7 +63,7 @@ class Domain:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class App:
     """Represents an EPM application with its domains."""
     name: str
@@ -54,15 +74,17 @@ class App:
     @classmethod
     def from_dict(cls, name: str, data: Dict[str, Any]) -> "App":
         """Create App from dictionary."""
+        get = data.get
+        domain_from_dict = Domain.from_dict
         domains = {
-            domain_name: Domain.from_dict(domain_data)
-            for domain_name, domain_data in data.get("domains", {}).items()
+            sys.intern(domain_name): domain_from_dict(domain_data)
+            for domain_name, domain_data in get("domains", {}).items()
         }
         return cls(
-            name=name,
-            display_name=data.get("display_name", name),
-            domains=domains,
-            channels=data.get("channels", [])
+            sys.intern(name),
+            get("display_name", name),
+            domains,
+            get("channels", [])
         )
     
     def to_dict(self) -> Dict[str, Any]:
@@ -77,7 +99,7 @@ class App:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class State:
     """Main state container for EPMPulse."""
     version: str = "1.0"
@@ -88,25 +110,26 @@ class State:
     
     def __post_init__(self):
         if not self.metadata:
-            from datetime import datetime, timezone
             self.metadata = {
-                "created": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+                "created": utc_now_iso(),
                 "schema_version": "1.0"
             }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "State":
         """Create State from dictionary."""
+        get = data.get
+        app_from_dict = App.from_dict
         apps = {
-            app_name: App.from_dict(app_name, app_data)
-            for app_name, app_data in data.get("apps", {}).items()
+            sys.intern(app_name): app_from_dict(app_name, app_data)
+            for app_name, app_data in get("apps", {}).items()
         }
         return cls(
-            version=data.get("version", "1.0"),
-            last_updated=data.get("last_updated"),
-            apps=apps,
-            recent_jobs=data.get("recent_jobs", []),
-            metadata=data.get("metadata", {})
+            get("version", "1.0"),
+            get("last_updated"),
+            apps,
+            get("recent_jobs", []),
+            get("metadata", {})
         )
     
     def to_dict(self) -> Dict[str, Any]:
@@ -1,7 +1,7 @@
 # EPMPulse Utilities
 """Utility functions and decorators for EPMPulse dashboard."""
 
-from .logging_config import setup_logging, get_logger
-from .decorators import require_api_key, retry, debounce
+from .logging_config import setup_logging, get_logger, get_rate_limited_logger
+from .decorators import check_api_key, require_api_key, retry, aretry, debounce, TokenBucket
 
-__all__ = ["setup_logging", "get_logger", "require_api_key", "retry", "debounce"]
+__all__ = ["setup_logging", "get_logger", "get_rate_limited_logger", "check_api_key", "require_api_key", "retry", "aretry", "debounce", "TokenBucket"]
@@ -1,5 +1,7 @@
 """Decorators for EPMPulse utility functions."""
 
+import hmac
+import random
 import time
 import functools
 import threading
@@ -9,6 +11,61 @@ from flask import request, jsonify
 from functools import wraps
 
 
+_BEARER_PREFIX = 'Bearer '
+_BEARER_PREFIX_LEN = len(_BEARER_PREFIX)
+
+
+@functools.lru_cache(maxsize=1)
+def _expected_key_bytes(api_key: str) -> bytes:
+    """Encode the configured API key once per distinct value."""
+    return api_key.encode()
+
+
+def check_api_key() -> Optional[tuple]:
+    """Check the current request's Bearer token against the API key.
+    
+    Reads the raw WSGI header to skip Werkzeug's header mapping.
+    
+    Returns:
+        None if authorized, otherwise a (json response, status code) tuple
+    """
+    from ..config import get_api_key
+    
+    auth_header = request.environ.get('HTTP_AUTHORIZATION', '')
+    
+    if auth_header[:_BEARER_PREFIX_LEN] != _BEARER_PREFIX:
+        return jsonify({
+            'success': False,
+            'error': {
+                'code': 'MISSING_AUTH',
+                'message': 'Missing Authorization header'
+            }
+        }), 401
+    
+    try:
+        expected_key = _expected_key_bytes(get_api_key())
+    except ValueError:
+        return jsonify({
+            'success': False,
+            'error': {
+                'code': 'CONFIG_ERROR',
+                'message': 'API key not configured'
+            }
+        }), 500
+    
+    # Constant-time compare so response timing doesn't leak the key
+    if not hmac.compare_digest(auth_header[_BEARER_PREFIX_LEN:].encode(), expected_key):
+        return jsonify({
+            'success': False,
+            'error': {
+                'code': 'INVALID_KEY',
+                'message': 'Invalid API key'
+            }
+        }), 403
+    
+    return None
+
+
 def require_api_key(f: Callable) -> Callable:
     """Decorator to require API key authentication.
     
@@ -18,82 +75,108 @@ def require_api_key(f: Callable) -> Callable:
     Returns:
         Decorated function
     """
-    from ..config import get_api_key
-    
     @wraps(f)
     def decorated(*args, **kwargs):
-        api_key = request.headers.get('Authorization', '')
-        
-        if not api_key.startswith('Bearer '):
-            return jsonify({
-                'success': False,
-                'error': {
-                    'code': 'MISSING_AUTH',
-                    'message': 'Missing Authorization header'
-                }
-            }), 401
-        
-        key = api_key[7:]
-        try:
-            expected_key = get_api_key()
-        except ValueError:
-            return jsonify({
-                'success': False,
-                'error': {
-                    'code': 'CONFIG_ERROR',
-                    'message': 'API key not configured'
-                }
-            }), 500
-        
-        if key != expected_key:
-            return jsonify({
-                'success': False,
-                'error': {
-                    'code': 'INVALID_KEY',
-                    'message': 'Invalid API key'
-                }
-            }), 403
-        
+        error = check_api_key()
+        if error is not None:
+            return error
         return f(*args, **kwargs)
     
     return decorated
 
 
+def _backoff_delays(backoff_seconds: Optional[List[float]], jitter: float) -> Callable[[int], float]:
+    """Build the delay schedule shared by retry and aretry.
+    
+    Args:
+        backoff_seconds: Base delay per attempt; the last one repeats
+        jitter: Fraction each delay is randomly spread by (0 disables)
+        
+    Returns:
+        Function mapping a 0-based attempt number to seconds to wait
+    """
+    delays = tuple(backoff_seconds or (1, 2, 4))
+    last = len(delays) - 1
+    
+    def delay_for(attempt: int) -> float:
+        delay = delays[min(attempt, last)]
+        if jitter:
+            # Spread retries so clients failing together don't retry together
+            delay *= random.uniform(1 - jitter, 1 + jitter)
+        return delay
+    
+    return delay_for
+
+
 def retry(
     max_attempts: int = 3,
     backoff_seconds: Optional[List[float]] = None,
-    exceptions: tuple = (Exception,)
+    exceptions: tuple = (Exception,),
+    jitter: float = 0.5
 ) -> Callable:
     """Decorator to retry function on specified exceptions.
     
+    Sleeps between attempts, so keep it off request-handling threads;
+    use aretry for coroutines.
+    
     Args:
         max_attempts: Maximum number of attempts
-        backoff_seconds: List of delays between attempts
+        backoff_seconds: List of delays between attempts (last one repeats)
         exceptions: Tuple of exception types to catch
+        jitter: Fraction each delay is randomly spread by (0 disables)
         
     Returns:
         Decorated function
     """
-    backoff_seconds = backoff_seconds or [1, 2, 4]
+    delay_for = _backoff_delays(backoff_seconds, jitter)
     
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
-            last_exception = None
-            
-            for attempt in range(max_attempts):
+            for attempt in range(max_attempts - 1):
                 try:
                     return func(*args, **kwargs)
-                except exceptions as e:
-                    last_exception = e
-                    
-                    if attempt < max_attempts - 1:
-                        delay = backoff_seconds[attempt % len(backoff_seconds)]
-                        time.sleep(delay)
-                    else:
-                        raise
+                except exceptions:
+                    time.sleep(delay_for(attempt))
+            # Final attempt: let the exception propagate
+            return func(*args, **kwargs)
+        
+        return wrapper
+    
+    return decorator
+
+
+def aretry(
+    max_attempts: int = 3,
+    backoff_seconds: Optional[List[float]] = None,
+    exceptions: tuple = (Exception,),
+    jitter: float = 0.5
+) -> Callable:
+    """Decorator to retry a coroutine function, waiting with asyncio.sleep.
+    
+    Args:
+        max_attempts: Maximum number of attempts
+        backoff_seconds: List of delays between attempts (last one repeats)
+        exceptions: Tuple of exception types to catch
+        jitter: Fraction each delay is randomly spread by (0 disables)
+        
+    Returns:
+        Decorated coroutine function
+    """
+    delay_for = _backoff_delays(backoff_seconds, jitter)
+    
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            import asyncio  # only needed once a coroutine is actually retried
             
-            raise last_exception
+            for attempt in range(max_attempts - 1):
+                try:
+                    return await func(*args, **kwargs)
+                except exceptions:
+                    await asyncio.sleep(delay_for(attempt))
+            # Final attempt: let the exception propagate
+            return await func(*args, **kwargs)
         
         return wrapper
     
@@ -110,22 +193,31 @@ class Debouncer:
             min_interval: Minimum seconds between calls
         """
         self.min_interval = min_interval
-        self._last_call = 0.0
+        self._last_call = float('-inf')  # time.monotonic() of the last call
         self._lock = threading.Lock()
     
-    def should_call(self) -> bool:
+    def should_call(self, now: Optional[float] = None) -> bool:
         """Check if function should be called.
         
+        Lock-free: reading one float is atomic, and a stale answer is
+        re-checked under the lock by call().
+        
+        Args:
+            now: time.monotonic() reading to check against (default: now)
+        
         Returns:
             True if should call, False if should defer
         """
-        with self._lock:
-            current_time = time.time()
-            return (current_time - self._last_call) >= self.min_interval
+        if now is None:
+            now = time.monotonic()
+        return (now - self._last_call) >= self.min_interval
     
     def call(self, func: Callable, *args, **kwargs) -> Any:
         """Call function if debouncer allows.
         
+        The call slot is claimed under the lock before ``func`` runs, so
+        concurrent callers cannot both get through the same interval.
+        
         Args:
             func: Function to call
             *args: Positional arguments
@@ -134,24 +226,88 @@ class Debouncer:
         Returns:
             Function result or None if not called
         """
-        if self.should_call():
-            result = func(*args, **kwargs)
-            self._last_call = time.time()
-            return result
-        return None
+        # One clock read serves the check, the re-check and the claim
+        now = time.monotonic()
+        if not self.should_call(now):
+            return None
+        with self._lock:
+            if now - self._last_call < self.min_interval:
+                return None
+            self._last_call = now
+        return func(*args, **kwargs)
+
+
+class TokenBucket:
+    """Token bucket for pacing calls to a rate-limited API.
+    
+    Holds up to ``capacity`` tokens, refilled at ``rate`` tokens per second.
+    Callers block until a token is available, so bursts are smoothed into
+    the upstream budget instead of being rejected by it.
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        """Initialize token bucket.
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def consume(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """Take tokens, waiting for the bucket to refill if needed.
+        
+        Args:
+            tokens: Tokens to take
+            timeout: Maximum seconds to wait (None waits indefinitely)
+            
+        Returns:
+            True if tokens were taken, False if the timeout would be exceeded
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return True
+                wait = (tokens - self._tokens) / self.rate
+            
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+    
+    def pause(self, seconds: float) -> None:
+        """Hold off every caller for ``seconds`` (e.g. an upstream Retry-After).
+        
+        Args:
+            seconds: Seconds before the next token becomes available
+        """
+        with self._lock:
+            self._tokens = min(self._tokens, 1.0)
+            self._updated = max(self._updated, time.monotonic() + seconds)
 
 
 # Decorator version for functions
-def debounce(min_interval: float = 2.0) -> Callable:
+def debounce(min_interval: float = 2.0, debouncer: Optional[Debouncer] = None) -> Callable:
     """Decorator to debounce function calls.
     
     Args:
         min_interval: Minimum seconds between calls
+        debouncer: Debouncer to use; pass the same one to several call
+            sites so they share one interval (min_interval is then ignored)
         
     Returns:
         Decorated function
     """
-    debouncer = Debouncer(min_interval)
+    if debouncer is None:
+        debouncer = Debouncer(min_interval)
     
     def decorator(func: Callable) -> Callable:
         @wraps(func)
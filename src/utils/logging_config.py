@@ -1,15 +1,46 @@
 """Logging configuration for EPMPulse with structured JSON output."""
 
+import atexit
 import logging
 import json
+import queue
 import sys
 import os
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Listener thread draining the log queue (set by setup_logging(use_queue=True))
+_queue_listener: Optional[QueueListener] = None
+
 
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging."""
     
+    # (whole second, formatted date/time) of the last record
+    _time_cache: tuple = (None, '')
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Format the record time, rendering the date part once per second.
+        
+        Output matches logging.Formatter's default format exactly.
+        """
+        if datefmt is not None:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, text = self._time_cache
+        if cached_second != second:
+            text = time.strftime(self.default_time_format, self.converter(record.created))
+            self._time_cache = (second, text)
+        return self.default_msec_format % (text, record.msecs)
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON.
         
@@ -27,25 +58,91 @@ class JSONFormatter(logging.Formatter):
         }
         
         # Add extra fields if present
-        if hasattr(record, 'extra_fields'):
-            log_data.update(record.extra_fields)
+        extra_fields = getattr(record, 'extra_fields', None)
+        if extra_fields:
+            log_data.update(extra_fields)
         
         # Add exception info if present
         if record.exc_info:
             log_data['exception'] = self.formatException(record.exc_info)
         
+        if orjson is not None:
+            return orjson.dumps(log_data, option=orjson.OPT_NON_STR_KEYS).decode()
         return json.dumps(log_data)
 
 
+class RateLimitFilter(logging.Filter):
+    """Drop repeats of an identical message within an interval.
+    
+    Keeps incident storms (e.g. Slack being down) from flooding the log with
+    the same line once per request.
+    """
+    
+    MAX_TRACKED = 1024
+    
+    def __init__(self, interval: float = 1.0):
+        """Initialize filter.
+        
+        Args:
+            interval: Minimum seconds between two identical messages
+        """
+        super().__init__()
+        self.interval = interval
+        self._last_emit = {}
+        self._lock = threading.Lock()
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return False for a repeat seen less than interval seconds ago."""
+        key = (record.name, record.levelno, record.getMessage())
+        now = time.monotonic()
+        with self._lock:
+            last = self._last_emit.get(key)
+            if last is not None and now - last < self.interval:
+                return False
+            if len(self._last_emit) >= self.MAX_TRACKED:
+                self._last_emit.clear()
+            self._last_emit[key] = now
+        return True
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """QueueHandler that keeps records intact for the in-process listener.
+    
+    The stock handler pre-formats records and drops exc_info so they can be
+    pickled; our queue never leaves the process, so JSONFormatter on the
+    listener side still gets exception info and extra fields.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _stop_queue_listener() -> None:
+    """Flush and stop the log queue listener, if running."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
 def setup_logging(
     level: Optional[str] = None,
-    handler: Optional[logging.Handler] = None
+    handler: Optional[logging.Handler] = None,
+    use_queue: bool = False
 ) -> logging.Logger:
     """Setup EPMPulse logging configuration.
     
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         handler: Custom handler (uses JSONFormatter by default)
+        use_queue: If True, log calls only enqueue records and the handler
+            runs on a background listener thread, so a slow stdout/pipe
+            never blocks request threads
         
     Returns:
         Configured logger instance
@@ -59,7 +156,8 @@ def setup_logging(
     logger = logging.getLogger('epmpulse')
     logger.setLevel(log_level)
     
-    # Remove existing handlers
+    # Remove existing handlers (and the listener feeding a previous one)
+    _stop_queue_listener()
     logger.handlers = []
     
     # Create formatter
@@ -72,6 +170,13 @@ def setup_logging(
     handler.setLevel(log_level)
     handler.setFormatter(formatter)
     
+    if use_queue:
+        global _queue_listener
+        log_queue = queue.SimpleQueue()
+        _queue_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        _queue_listener.start()
+        handler = _InProcessQueueHandler(log_queue)
+    
     # Add handler to logger
     logger.addHandler(handler)
     
@@ -90,6 +195,22 @@ def get_logger(name: str = 'epmpulse') -> logging.Logger:
     return logging.getLogger(name)
 
 
+def get_rate_limited_logger(name: str, interval: float = 1.0) -> logging.Logger:
+    """Get a logger that emits each identical message at most once per interval.
+    
+    Args:
+        name: Logger name
+        interval: Minimum seconds between identical messages
+        
+    Returns:
+        Logger instance with a RateLimitFilter attached
+    """
+    logger = logging.getLogger(name)
+    if not any(isinstance(f, RateLimitFilter) for f in logger.filters):
+        logger.addFilter(RateLimitFilter(interval))
+    return logger
+
+
 # Convenience function for adding extra fields
 def log_with_fields(
     logger: logging.Logger,
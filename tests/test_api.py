@@ -3,11 +3,6 @@
 import pytest
 import os
 import json
-from pathlib import Path
-
-# Add src to path
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from src.app import create_app
 from src.config import get_api_key
@@ -145,6 +140,19 @@ class TestStatusEndpoints:
         data = json.loads(response.data)
         assert data['error']['code'] == 'INVALID_STATUS'
     
+    def test_post_status_malformed_json(self, client):
+        """Test POST with a malformed body returns INVALID_REQUEST."""
+        response = client.post(
+            '/api/v1/status',
+            data='{not json',
+            content_type='application/json',
+            headers={'Authorization': 'Bearer test_key_12345'}
+        )
+        
+        assert response.status_code == 400
+        data = json.loads(response.data)
+        assert data['error']['code'] == 'INVALID_REQUEST'
+    
     def test_get_all_statuses(self, client):
         """Test GET /api/v1/status returns all statuses."""
         # First create a status
@@ -196,6 +204,34 @@ class TestStatusEndpoints:
         assert data['data']['app'] == 'Planning'
         assert 'domains' in data['data']
     
+    def test_get_unknown_app_status(self, client):
+        """Test GET /api/v1/status/{app} for an app without state returns 404."""
+        response = client.get(
+            '/api/v1/status/NoSuchApp',
+            headers={'Authorization': 'Bearer test_key_12345'}
+        )
+        
+        assert response.status_code == 404
+        data = json.loads(response.data)
+        assert data['success'] is False
+        assert data['error']['code'] == 'NOT_FOUND'
+    
+    def test_get_all_statuses_not_modified(self, client):
+        """Test GET /api/v1/status honors If-None-Match with 304."""
+        headers = {'Authorization': 'Bearer test_key_12345'}
+        
+        first = client.get('/api/v1/status', headers=headers)
+        etag = first.headers['ETag']
+        
+        second = client.get(
+            '/api/v1/status',
+            headers={**headers, 'If-None-Match': etag}
+        )
+        
+        assert second.status_code == 304
+        assert second.data == b''
+        assert second.headers['ETag'] == etag
+    
     def test_batch_update(self, client):
         """Test POST /api/v1/status/batch updates multiple."""
         payload = {
@@ -228,5 +264,151 @@ class TestStatusEndpoints:
         assert data['data']['updated_count'] == 2
 
 
+class TestRateLimiting:
+    """Test per-route rate limits."""
+    
+    def test_route_limit_enforced(self):
+        """Test a route's own limit applies, not just the default."""
+        os.environ['EPMPULSE_API_KEY'] = 'test_key_12345'
+        app = create_app({'TESTING': True})
+        client = app.test_client()
+        headers = {'Authorization': 'Bearer test_key_12345'}
+        
+        codes = [client.post('/api/v1/canvas/sync', headers=headers).status_code
+                 for _ in range(11)]
+        
+        assert 429 not in codes[:10]
+        assert codes[10] == 429
+    
+    def test_unreachable_storage_falls_back_to_memory(self):
+        """Test an unusable storage URI degrades to in-memory limits."""
+        from src.api.rate_limit import resolve_storage_uri, MEMORY_STORAGE_URI
+        
+        assert resolve_storage_uri('bogus://nowhere') == MEMORY_STORAGE_URI
+        assert resolve_storage_uri(MEMORY_STORAGE_URI) == MEMORY_STORAGE_URI
+    
+    def test_storage_error_after_startup_falls_back(self, monkeypatch):
+        """Test a failing limiter storage does not turn requests into 500s."""
+        from src.api import routes
+        
+        os.environ['EPMPULSE_API_KEY'] = 'test_key_12345'
+        app = create_app({'TESTING': True})
+        client = app.test_client()
+        headers = {'Authorization': 'Bearer test_key_12345'}
+        
+        def hit(*args, **kwargs):
+            raise ConnectionError('Redis went away')
+        
+        # Only the primary strategy fails; the in-memory fallback still works
+        monkeypatch.setattr(routes._limiter._limiter, 'hit', hit)
+        
+        codes = [client.post('/api/v1/canvas/sync', headers=headers).status_code
+                 for _ in range(11)]
+        
+        assert 500 not in codes
+        assert codes[10] == 429
+    
+    def test_gcra_allows_burst_then_throttles(self):
+        """Test GCRA admits the full burst, then blocks until replenished."""
+        from limits import parse
+        from limits.storage import MemoryStorage
+        from src.api.rate_limit import GCRARateLimiter
+        
+        limiter = GCRARateLimiter(MemoryStorage())
+        item = parse('5 per minute')
+        
+        assert all(limiter.hit(item, 'client') for _ in range(5))
+        assert limiter.hit(item, 'client') is False
+        assert limiter.get_window_stats(item, 'client').remaining == 0
+        assert limiter.hit(item, 'other') is True
+        
+        limiter.clear(item, 'client')
+        assert limiter.test(item, 'client') is True
+    
+    def test_gcra_redis_stats_reuse_hit_result(self):
+        """Test headers after a Redis hit need no extra GET."""
+        import time
+        from unittest import mock
+        from limits import parse
+        from limits.storage import RedisStorage
+        from src.api.rate_limit import GCRARateLimiter
+        
+        storage = mock.MagicMock(spec=RedisStorage)
+        storage.prefixed_key = lambda key: 'LIMITS:' + key
+        conn = storage.get_connection.return_value
+        conn.register_script.return_value = (
+            lambda keys, args: [1, str(time.time() + 12)]
+        )
+        limiter = GCRARateLimiter(storage)
+        item = parse('10 per minute')
+        
+        assert limiter.hit(item, 'client') is True
+        assert limiter.get_window_stats(item, 'client').remaining == 8
+        conn.get.assert_not_called()
+
+
+class TestJsonProvider:
+    """Test orjson-backed response serialization."""
+    
+    def test_dict_return_uses_orjson(self):
+        """Test views returning dicts are serialized by orjson."""
+        orjson = pytest.importorskip('orjson')
+        os.environ['EPMPULSE_API_KEY'] = 'test_key_12345'
+        app = create_app({'TESTING': True})
+        
+        @app.route('/_dict')
+        def dict_view():
+            return {'status': 'healthy', 'count': 2}
+        
+        response = app.test_client().get('/_dict')
+        
+        assert response.mimetype == 'application/json'
+        assert response.data == orjson.dumps(
+            {'status': 'healthy', 'count': 2},
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+        )
+
+
+class TestValidators:
+    """Test request validation helpers."""
+    
+    def test_fast_path_matches_full_validation(self):
+        """Test fast path yields the same fields as Pydantic validation."""
+        from src.api.validators import parse_status_update, StatusUpdateRequest
+        
+        payload = {'app': 'Planning', 'domain': 'Actual', 'status': 'OK', 'job_id': 'JOB_001'}
+        
+        fast = parse_status_update(payload)
+        full = StatusUpdateRequest(**payload)
+        
+        assert fast.model_dump() == full.model_dump()
+    
+    def test_invalid_payload_falls_back_to_pydantic(self):
+        """Test invalid payloads still raise ValidationError."""
+        from pydantic import ValidationError
+        from src.api.validators import parse_status_update
+        
+        with pytest.raises(ValidationError):
+            parse_status_update({'app': 'Planning', 'status': 'OK', 'timestamp': 'yesterday'})
+    
+    def test_batch_schema_path_matches_full_validation(self):
+        """Test schema-validated batches match Pydantic output."""
+        from src.api.validators import parse_batch_update, BatchStatusUpdateRequest
+        
+        payload = {
+            'updates': [
+                {'app': 'Planning', 'domain': 'Actual', 'status': 'OK',
+                 'timestamp': '2026-02-16T12:00:00Z'},
+                {'app': 'FCCS', 'status': 'Loading', 'message': 'Running'}
+            ],
+            'job_id': 'BATCH_001'
+        }
+        
+        fast = parse_batch_update(payload)
+        full = BatchStatusUpdateRequest(**payload)
+        
+        assert fast.model_dump() == full.model_dump()
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -3,11 +3,6 @@
 import pytest
 import time
 import os
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 
 class TestCanvasDebouncing:
@@ -26,51 +21,528 @@ class TestCanvasDebouncing:
         yield cm
         cm.stop()
     
-    def test_process_pending_loop_exists(self, canvas_manager):
-        """Test that _process_pending_loop method exists."""
-        assert hasattr(canvas_manager, '_process_pending_loop')
-        assert callable(getattr(canvas_manager, '_process_pending_loop'))
-    
-    def test_cancel_pending_timer_method_exists(self, canvas_manager):
-        """Test that _cancel_pending_timer method exists."""
-        assert hasattr(canvas_manager, '_cancel_pending_timer')
-        assert callable(getattr(canvas_manager, '_cancel_pending_timer'))
+    def test_cancel_pending_flush(self, canvas_manager):
+        """Test that cancelling drops dirty domains and the deadline."""
+        canvas_manager._claim_or_defer([('Planning', 'Actual')])
+        canvas_manager._claim_or_defer([('Planning', 'Budget')])
+        assert canvas_manager._deadline is not None
+        
+        canvas_manager._cancel_pending_flush()
+        
+        assert canvas_manager._deadline is None
+        assert canvas_manager._dirty == set()
     
     def test_stop_method_exits_cleanly(self, canvas_manager):
-        """Test that stop method properly shuts down the processor."""
-        # Stop should not raise
+        """Test that stop cancels a pending trailing-edge update."""
+        sent = []
+        canvas_manager._update_canvas = lambda blocks, is_full_sync=False: sent.append(blocks)
+        canvas_manager.DEBOUNCE_INTERVAL = 0.05
+        
+        assert canvas_manager._claim_or_defer([('Planning', 'Actual')]) is True
+        assert canvas_manager._claim_or_defer([('Planning', 'Budget')]) is False
+        flusher = canvas_manager._flusher
         canvas_manager.stop()
+        time.sleep(0.1)
         
-        # Processor should be stopped
-        assert canvas_manager._stop_processor.is_set()
+        assert canvas_manager._deadline is None
+        assert not flusher.is_alive()
+        assert sent == []
     
-    def test_pending_update_cleared_on_stop(self, canvas_manager):
-        """Test that pending update is cleared on stop."""
-        canvas_manager._pending_update = {'test': 'data'}
+    def test_dirty_cleared_on_stop(self, canvas_manager):
+        """Test that dirty domains are cleared on stop."""
+        canvas_manager._dirty.add(('Planning', 'Actual'))
         canvas_manager.stop()
         
-        # Pending update should be cleared
-        assert canvas_manager._pending_update is None
+        assert canvas_manager._dirty == set()
     
     def test_debounce_interval_constant(self, canvas_manager):
         """Test that DEBOUNCE_INTERVAL is set correctly."""
         assert canvas_manager.DEBOUNCE_INTERVAL == 2.0
     
-    def test_processor_interval_constant(self, canvas_manager):
-        """Test that PROCESSOR_INTERVAL is set correctly."""
-        assert canvas_manager.PROCESSOR_INTERVAL == 0.5
+    def test_burst_coalesced_into_one_rebuild(self, canvas_manager):
+        """Test every domain dirtied in a burst lands in one full rebuild."""
+        from src.state.models import Domain, State
+        
+        state = State()
+        state.add_domain('Planning', 'Actual', Domain(status='OK'))
+        state.add_domain('Planning', 'Budget', Domain(status='Warning'))
+        state.add_domain('FCCS', 'Consolidation', Domain(status='Loading'))
+        reads = []
+        canvas_manager._read_state = lambda: reads.append(1) or state
+        sent = []
+        canvas_manager._update_canvas = (
+            lambda blocks, is_full_sync=False: sent.append((blocks, is_full_sync))
+        )
+        canvas_manager.DEBOUNCE_INTERVAL = 0.05
+        
+        assert canvas_manager.update_canvas_for_domain('Planning', 'Actual', 'OK') is True
+        assert canvas_manager.update_canvas_for_domain('Planning', 'Budget', 'Warning') is False
+        assert canvas_manager.update_canvas_for_domain('FCCS', 'Consolidation', 'Loading') is False
+        time.sleep(0.15)
+        
+        assert len(reads) == 2
+        assert [full for _, full in sent] == [False, True]
+        rebuilt_ids = {block.get('block_id') for block in sent[1][0]}
+        assert 'planning_actual_budget_section' in rebuilt_ids
+        assert 'fccs_consolidation_section' in rebuilt_ids
+        assert canvas_manager._deadline is None
+        assert canvas_manager._dirty == set()
+    
+    def test_sync_skips_unchanged_document(self, canvas_manager):
+        """Test a repeat sync is skipped unless forced."""
+        from unittest.mock import MagicMock
+        from src.state.models import State
+        
+        slack = MagicMock()
+        slack.is_configured.return_value = True
+        canvas_manager.slack_client = slack
+        state = State()
+        canvas_manager._read_state = lambda: state
+        
+        canvas_manager.sync_canvas()
+        canvas_manager.sync_canvas()
+        assert slack.client.canvases_edit.call_count == 1
+        
+        canvas_manager.sync_canvas(force=True)
+        assert slack.client.canvases_edit.call_count == 2
+    
+    def test_flusher_thread_reused_across_cycles(self, canvas_manager):
+        """Test one flusher thread serves consecutive debounce windows."""
+        from src.state.models import State
+        
+        canvas_manager._read_state = State
+        sent = []
+        canvas_manager._update_canvas = (
+            lambda blocks, is_full_sync=False: sent.append(is_full_sync)
+        )
+        canvas_manager.DEBOUNCE_INTERVAL = 0.2
+        
+        canvas_manager._claim_or_defer([('Planning', 'Actual')])
+        canvas_manager._claim_or_defer([('Planning', 'Budget')])
+        flusher = canvas_manager._flusher
+        time.sleep(0.25)
+        assert canvas_manager._claim_or_defer([('Planning', 'Actual')]) is False
+        time.sleep(0.3)
+        
+        assert sent == [True, True]
+        assert canvas_manager._flusher is flusher
+        assert flusher.is_alive()
+    
+    def test_read_state_reuses_parse_until_file_changes(self, canvas_manager, tmp_path):
+        """Test state is re-read only when the state file version changes."""
+        from src.state.manager import StateManager
+        
+        mgr = StateManager(state_file=tmp_path / 'state.json')
+        mgr.update('Planning', 'Actual', 'OK')
+        canvas_manager._state_mgr = mgr
+        
+        first = canvas_manager._read_state()
+        assert canvas_manager._read_state() is first
+        
+        mgr.update('Planning', 'Actual', 'Warning')
+        second = canvas_manager._read_state()
+        assert second is not first
+        assert second.apps['Planning'].domains['Actual'].status == 'Warning'
+    
+    def test_unchanged_payload_skips_slack_call(self, canvas_manager):
+        """Test an identical payload is sent once unless forced."""
+        from unittest.mock import MagicMock
+        
+        slack = MagicMock()
+        slack.is_configured.return_value = True
+        canvas_manager.slack_client = slack
+        blocks = [{'type': 'divider'}]
+        
+        assert canvas_manager._update_canvas(blocks, is_full_sync=True) is True
+        assert canvas_manager._update_canvas(blocks, is_full_sync=True) is True
+        assert slack.client.canvases_edit.call_count == 1
+        
+        canvas_manager._update_canvas(blocks, is_full_sync=True, force=True)
+        assert slack.client.canvases_edit.call_count == 2
+    
+    def test_canvas_blocks_reused_for_same_state(self, canvas_manager):
+        """Test full canvas blocks are rebuilt only for a new state read."""
+        from src.state.models import Domain, State
+        
+        state = State()
+        state.add_domain('Planning', 'Actual', Domain(status='OK'))
+        
+        blocks = canvas_manager._canvas_blocks(state)
+        assert canvas_manager._canvas_blocks(state) is blocks
+        assert canvas_manager._canvas_blocks(State()) is not blocks
     
     def test_lock_created(self, canvas_manager):
         """Test that update lock is created."""
         assert hasattr(canvas_manager, '_update_lock')
     
-    def test_timer_initially_none(self, canvas_manager):
-        """Test that timer is initially None."""
-        assert canvas_manager._timer is None
+    def test_deadline_initially_none(self, canvas_manager):
+        """Test that no flush is scheduled initially."""
+        assert canvas_manager._deadline is None
     
-    def test_pending_update_initially_none(self, canvas_manager):
-        """Test that pending_update is initially None."""
-        assert canvas_manager._pending_update is None
+    def test_dirty_initially_empty(self, canvas_manager):
+        """Test that no domains are dirty initially."""
+        assert canvas_manager._dirty == set()
+
+
+class TestCanvasSectionUpdates:
+    """Test section-based canvas updates."""
+    
+    def test_sections_sent_concurrently(self):
+        """Test several sections are updated in parallel, one call each."""
+        import threading
+        from unittest.mock import MagicMock
+        from src.slack.client import SlackClient
+        
+        barrier = threading.Barrier(3, timeout=2)
+        client = SlackClient(bot_token=None)
+        client.client = MagicMock()
+        client.client.canvases_section_update.side_effect = lambda **kwargs: barrier.wait()
+        
+        results = client.update_canvas_sections('F1', {
+            'planning_header': [{'block_id': 'planning_header'}],
+            'planning_actual_section': [{'block_id': 'planning_actual_section'}],
+            'planning_budget_section': [{'block_id': 'planning_budget_section'}],
+        })
+        
+        assert results == {
+            'planning_header': True,
+            'planning_actual_section': True,
+            'planning_budget_section': True,
+        }
+        assert client.client.canvases_section_update.call_count == 3
+    
+    def test_domain_update_sends_every_section(self):
+        """Test a domain update reaches both its header and domain section."""
+        from unittest.mock import MagicMock
+        from src.slack.canvas import CanvasManager
+        from src.state.models import State
+        
+        slack = MagicMock()
+        slack.is_configured.return_value = True
+        slack.update_canvas_sections.side_effect = (
+            lambda canvas_id, sections: {section_id: True for section_id in sections}
+        )
+        cm = CanvasManager(slack)
+        cm._read_state = State
+        
+        assert cm.update_canvas_for_domain('Planning', 'Actual', 'OK') is True
+        
+        sections = slack.update_canvas_sections.call_args.kwargs['sections']
+        assert list(sections) == ['planning_header', 'planning_actual_section']
+        slack.client.canvases_edit.assert_not_called()
+        cm.stop()
+
+    
+    def test_failed_section_update_rebuilds_whole_canvas(self):
+        """Test the full-edit fallback sends the complete document, not one app."""
+        from unittest.mock import MagicMock
+        from src.slack.canvas import CanvasManager
+        from src.state.models import Domain, State
+        
+        state = State()
+        state.add_domain('Planning', 'Actual', Domain(status='OK'))
+        state.add_domain('FCCS', 'Consolidation', Domain(status='Loading'))
+        
+        slack = MagicMock()
+        slack.is_configured.return_value = True
+        slack.update_canvas_sections.side_effect = (
+            lambda canvas_id, sections: {section_id: False for section_id in sections}
+        )
+        slack.update_canvas_section.side_effect = Exception('section_not_found')
+        cm = CanvasManager(slack)
+        cm._read_state = lambda: state
+        full_document = {'blocks': cm._canvas_blocks(state)}
+        
+        # Multi-section app update
+        assert cm.update_canvas_for_app('Planning') is True
+        assert slack.client.canvases_edit.call_args.kwargs['document_json'] == full_document
+        
+        # Single-section update
+        assert cm._update_section_based([{'type': 'section', 'block_id': 'planning_actual_section'}])
+        assert slack.client.canvases_edit.call_count == 2
+        assert slack.client.canvases_edit.call_args.kwargs['document_json'] == full_document
+        cm.stop()
+
+class TestSlackThrottling:
+    """Test client-side pacing of Slack API calls."""
+    
+    def test_token_bucket_waits_after_burst(self):
+        """Test the bucket admits a burst, then paces at its rate."""
+        from src.utils.decorators import TokenBucket
+        
+        bucket = TokenBucket(rate=20.0, capacity=2)
+        assert bucket.consume()
+        assert bucket.consume()
+        assert bucket.consume(timeout=0.01) is False
+        
+        start = time.monotonic()
+        assert bucket.consume()
+        assert time.monotonic() - start >= 0.03
+    
+    def test_retry_after_honored_on_429(self):
+        """Test a 429 pauses the limiter for Retry-After instead of backoff."""
+        from unittest.mock import MagicMock, patch
+        from slack_sdk.errors import SlackApiError
+        from src.slack.client import SlackClient
+        
+        limiter = MagicMock()
+        client = SlackClient(bot_token='xoxb-test', rate_limiter=limiter)
+        rate_limited = MagicMock(status_code=429, headers={'Retry-After': '7'})
+        method = MagicMock(side_effect=[SlackApiError('ratelimited', rate_limited), 'ok'])
+        
+        with patch('src.slack.client.time.sleep') as sleep:
+            assert client._make_request_with_retry(method) == 'ok'
+        
+        limiter.pause.assert_called_once_with(7.0)
+        sleep.assert_not_called()
+    
+    def test_bucket_pause_delays_next_token(self):
+        """Test pause holds the next token for the given seconds."""
+        from src.utils.decorators import TokenBucket
+        
+        bucket = TokenBucket(rate=100.0, capacity=5)
+        bucket.pause(0.05)
+        
+        start = time.monotonic()
+        assert bucket.consume()
+        assert time.monotonic() - start >= 0.04
+    
+    def test_every_api_call_takes_a_token(self):
+        """Test SDK methods called on .client go through the limiter."""
+        from unittest.mock import MagicMock, patch
+        from slack_sdk import WebClient
+        from src.slack.client import SlackClient
+        
+        limiter = MagicMock()
+        client = SlackClient(bot_token='xoxb-test', rate_limiter=limiter)
+        with patch.object(WebClient, 'api_call') as api_call:
+            client.client.conversations_list()
+            client.client.canvases_edit(canvas_id='F1', changes=[])
+        
+        assert limiter.consume.call_count == 2
+        assert api_call.call_count == 2
+    
+    def test_auth_test_not_paced(self):
+        """Test health-check auth.test calls skip a paused bucket."""
+        from unittest.mock import patch
+        from slack_sdk import WebClient
+        from src.slack.client import SlackClient
+        from src.utils.decorators import TokenBucket
+        
+        limiter = TokenBucket(rate=1.0, capacity=1)
+        limiter.pause(60)
+        client = SlackClient(bot_token='xoxb-test', rate_limiter=limiter)
+        
+        start = time.monotonic()
+        with patch.object(WebClient, 'api_call'):
+            assert client.test_connection() is True
+        assert time.monotonic() - start < 1
+    
+    def test_bounded_wait_fails_fast(self):
+        """Test calls inside bounded_wait raise instead of waiting out a pause."""
+        from unittest.mock import patch
+        from slack_sdk import WebClient
+        from src.slack.client import SlackClient, SlackThrottledError
+        from src.utils.decorators import TokenBucket
+        
+        limiter = TokenBucket(rate=1.0, capacity=1)
+        limiter.pause(60)
+        client = SlackClient(bot_token='xoxb-test', rate_limiter=limiter)
+        
+        start = time.monotonic()
+        with patch.object(WebClient, 'api_call') as api_call:
+            with client.bounded_wait(0.05):
+                with pytest.raises(SlackThrottledError):
+                    client.client.canvases_edit(canvas_id='F1', changes=[])
+        assert time.monotonic() - start < 1
+        api_call.assert_not_called()
+        assert getattr(client.client.wait_limit, 'seconds', None) is None
+    
+    def test_sync_with_timeout_raises_when_throttled(self):
+        """Test a request-path sync gives up on a paused bucket."""
+        from unittest.mock import patch
+        from slack_sdk import WebClient
+        from src.slack.canvas import CanvasManager
+        from src.slack.client import SlackClient, SlackThrottledError
+        from src.state.models import State
+        from src.utils.decorators import TokenBucket
+        
+        limiter = TokenBucket(rate=1.0, capacity=1)
+        limiter.pause(60)
+        slack = SlackClient(bot_token='xoxb-test', rate_limiter=limiter)
+        slack.client.canvases_edit = lambda **kwargs: slack.client.api_call('canvases.edit', json=kwargs)
+        cm = CanvasManager(slack)
+        cm._read_state = State
+        
+        with patch.object(WebClient, 'api_call'):
+            with pytest.raises(SlackThrottledError):
+                cm.sync_canvas(timeout=0.05)
+        cm.stop()
+    
+    def test_default_rate_split_across_workers(self, monkeypatch):
+        """Test each worker process paces at its share of the token budget."""
+        from src.slack.client import SlackClient
+        
+        monkeypatch.setenv('EPMPULSE_WORKERS', '4')
+        client = SlackClient(bot_token='xoxb-test')
+        
+        assert client.rate_limiter.rate == pytest.approx(SlackClient.DEFAULT_RATE_PER_SEC / 4)
+
+
+class TestCanvasDebouncer:
+    """Test CanvasDebouncer coalescing behavior."""
+    
+    @pytest.fixture
+    def flushed(self):
+        """Collect flushed batches."""
+        return []
+    
+    @pytest.fixture
+    def debouncer(self, flushed):
+        """Create CanvasDebouncer with a recording callback."""
+        from src.slack.debouncer import CanvasDebouncer
+        
+        d = CanvasDebouncer(flushed.append, delay=0.05)
+        yield d
+        d.stop(flush=False)
+    
+    def test_rapid_updates_coalesce(self, debouncer, flushed):
+        """Test successive updates to one domain collapse to the latest."""
+        debouncer.enqueue('Planning', 'Actual', 'Loading')
+        debouncer.enqueue('Planning', 'Actual', 'OK')
+        debouncer.enqueue('FCCS', 'Consolidation', 'Loading')
+        
+        time.sleep(0.2)
+        
+        assert flushed == [{
+            ('Planning', 'Actual'): 'OK',
+            ('FCCS', 'Consolidation'): 'Loading'
+        }]
+    
+    def test_single_flusher_thread(self, debouncer, flushed):
+        """Test repeated enqueues reuse one flusher thread across flushes."""
+        debouncer.enqueue('Planning', 'Actual', 'Loading')
+        thread = debouncer._thread
+        debouncer.enqueue('Planning', 'Actual', 'OK')
+        time.sleep(0.2)
+        debouncer.enqueue('FCCS', 'Consolidation', 'OK')
+        time.sleep(0.2)
+        
+        assert debouncer._thread is thread
+        assert flushed == [
+            {('Planning', 'Actual'): 'OK'},
+            {('FCCS', 'Consolidation'): 'OK'}
+        ]
+    
+    def test_full_pending_flushes_early(self, flushed):
+        """Test a new key beyond max_pending waits for an immediate flush."""
+        from src.slack.debouncer import CanvasDebouncer
+        
+        d = CanvasDebouncer(flushed.append, delay=10.0, max_pending=2)
+        try:
+            d.enqueue('Planning', 'Actual', 'OK')
+            d.enqueue('Planning', 'Budget', 'OK')
+            d.enqueue('Planning', 'Actual', 'Warning')  # existing key, no wait
+            assert flushed == []
+            
+            d.enqueue('FCCS', 'Consolidation', 'OK')
+            # The callback runs just after the drain that released enqueue
+            for _ in range(50):
+                if flushed:
+                    break
+                time.sleep(0.01)
+            
+            assert flushed == [{
+                ('Planning', 'Actual'): 'Warning',
+                ('Planning', 'Budget'): 'OK'
+            }]
+            assert d.pending_count == 1
+        finally:
+            d.stop(flush=False)
+    
+    def test_enqueue_many(self, debouncer, flushed):
+        """Test batch enqueue delivers all updates in one flush."""
+        debouncer.enqueue_many([
+            ('Planning', 'Actual', 'OK'),
+            ('Planning', 'Budget', 'Warning'),
+        ])
+        assert debouncer.pending_count == 2
+        
+        debouncer.flush()
+        
+        assert len(flushed) == 1
+        assert debouncer.pending_count == 0
+    
+    def test_stop_flushes_pending(self, debouncer, flushed):
+        """Test stop delivers pending updates by default."""
+        debouncer.enqueue('ARCS', 'Reconciliation', 'OK')
+        debouncer.stop()
+        
+        assert flushed == [{('ARCS', 'Reconciliation'): 'OK'}]
+    
+    def test_flush_callback_error_is_swallowed(self):
+        """Test a failing callback does not propagate."""
+        from src.slack.debouncer import CanvasDebouncer
+        
+        def failing(updates):
+            raise RuntimeError('slack down')
+        
+        d = CanvasDebouncer(failing, delay=0.05)
+        d.enqueue('Planning', 'Actual', 'OK')
+        d.stop()
+        
+        assert d.pending_count == 0
+
+
+class TestCanvasWorker:
+    """Test CanvasWorker background processing."""
+    
+    @pytest.fixture
+    def processed(self):
+        """Collect processed batches."""
+        return []
+    
+    @pytest.fixture
+    def worker(self, processed):
+        """Create and start a CanvasWorker with a recording callback."""
+        from src.slack.worker import CanvasWorker
+        
+        w = CanvasWorker(processed.append, batch_window=0.05)
+        w.start()
+        yield w
+        w.stop(timeout=1)
+    
+    def test_updates_processed_on_worker_thread(self, worker, processed):
+        """Test queued updates are coalesced into one batch."""
+        worker.enqueue('Planning', 'Actual', 'Loading')
+        worker.enqueue('Planning', 'Actual', 'OK')
+        
+        time.sleep(0.2)
+        
+        assert processed == [{('Planning', 'Actual'): 'OK'}]
+    
+    def test_stop_drains_queue(self, worker, processed):
+        """Test stop processes items queued before it."""
+        worker.submit({('FCCS', 'Consolidation'): 'OK'})
+        worker.stop(timeout=1)
+        
+        assert not worker.is_running()
+        assert processed == [{('FCCS', 'Consolidation'): 'OK'}]
+    
+    def test_max_batch_splits_batches(self, processed):
+        """Test batches are capped at max_batch items."""
+        from src.slack.worker import CanvasWorker
+        
+        w = CanvasWorker(processed.append, batch_window=0.5, max_batch=2)
+        w.enqueue_many([
+            ('Planning', 'Actual', 'OK'),
+            ('Planning', 'Budget', 'OK'),
+            ('Planning', 'Forecast', 'OK'),
+        ])
+        w.start()
+        w.stop(timeout=2)
+        
+        assert [len(batch) for batch in processed] == [2, 1]
 
 
 if __name__ == '__main__':
@@ -0,0 +1,83 @@
+"""Tests for EPMPulse configuration loading."""
+
+import pytest
+import os
+import json
+
+from src.config import StateConfig, load_json_config, validate_canvas_ids
+
+
+class TestLoadJsonConfig:
+    """Test cached JSON config loading."""
+    
+    def test_reuses_parsed_config(self, tmp_path):
+        """Test unchanged files are parsed once."""
+        config_file = tmp_path / 'apps.json'
+        config_file.write_text(json.dumps({'apps': {'Planning': {'server': 'planning'}}}))
+        
+        first = load_json_config(config_file)
+        second = load_json_config(config_file)
+        
+        assert first is second
+        assert first['apps']['Planning']['server'] == 'planning'
+    
+    def test_reloads_after_file_changes(self, tmp_path):
+        """Test a modified file is parsed again."""
+        config_file = tmp_path / 'apps.json'
+        config_file.write_text(json.dumps({'apps': {}}))
+        load_json_config(config_file)
+        
+        config_file.write_text(json.dumps({'apps': {'FCCS': {'server': 'fccs'}}}))
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        
+        assert 'FCCS' in load_json_config(config_file)['apps']
+    
+    def test_missing_file_raises(self, tmp_path):
+        """Test a missing file raises instead of caching a result."""
+        with pytest.raises(OSError):
+            load_json_config(tmp_path / 'missing.json')
+
+
+class TestValidateCanvasIds:
+    """Test canvas ID placeholder detection."""
+    
+    def test_real_canvas_id_passes(self):
+        """Test a concrete canvas ID is accepted."""
+        validate_canvas_ids({'channels': {'C1': {'canvas_id': 'F0123456789'}}})
+    
+    @pytest.mark.parametrize('canvas_id, fragment', [
+        ('F_PLACEHOLDER_1', 'contains placeholder'),
+        ('${SLACK_MAIN_CANVAS_ID}', 'unsubstituted template'),
+        # The placeholder check wins, so the message names the env var to set
+        ('${PLACEHOLDER_CANVAS}', 'contains placeholder. Set SLACK_MAIN_CANVAS_ID'),
+    ])
+    def test_placeholders_rejected(self, canvas_id, fragment):
+        """Test placeholder and template IDs raise with the right message."""
+        with pytest.raises(ValueError, match=fragment):
+            validate_canvas_ids({'channels': {'C1': {'canvas_id': canvas_id}}})
+
+
+class TestStateConfig:
+    """Test state configuration from the environment."""
+    
+    def test_data_dir_reaches_state_manager(self, tmp_path, monkeypatch):
+        """Test EPMPULSE_DATA_DIR selects the file the API's manager uses."""
+        from src.api import routes
+        
+        monkeypatch.setenv('EPMPULSE_DATA_DIR', str(tmp_path))
+        monkeypatch.setattr(routes, '_state_manager', None)
+        
+        assert StateConfig.from_env().state_file == tmp_path / 'apps_status.json'
+        assert routes._get_state_manager().state_file == tmp_path / 'apps_status.json'
+    
+    def test_write_behind_requires_single_process(self, monkeypatch):
+        """Test write-behind is rejected unless multi-process mode is off."""
+        monkeypatch.setenv('EPMPULSE_STATE_WRITE_BEHIND_MS', '500')
+        with pytest.raises(ValueError, match='EPMPULSE_STATE_MULTI_PROCESS=false'):
+            StateConfig.from_env()
+        
+        monkeypatch.setenv('EPMPULSE_STATE_MULTI_PROCESS', 'false')
+        config = StateConfig.from_env()
+        assert config.write_behind_ms == 500
+        assert not config.multi_process
@@ -0,0 +1,265 @@
+"""Tests for the EPM REST API client."""
+
+import pytest
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+from src.epm.client import EPMJobStatus, EPMOAuthClient
+
+
+SERVERS = {
+    'planning': {'name': 'Planning', 'base_url': 'https://planning.example.com'},
+    'fccs': {'name': 'FCCS', 'base_url': 'https://fccs.example.com'},
+}
+
+
+def _response(payload):
+    """Mock requests.Response carrying a JSON body."""
+    response = MagicMock()
+    response.content = json.dumps(payload).encode()
+    return response
+
+
+def _serve_statuses(client, statuses):
+    """Answer job queries with per-server status code sequences.
+    
+    Args:
+        client: Client whose session is mocked
+        statuses: Dict of server_id -> status codes; the last one repeats
+    
+    Returns:
+        Dict of server_id -> number of job queries received
+    """
+    calls = {server_id: 0 for server_id in statuses}
+    
+    def request(method, url, **kwargs):
+        server_id = url.split('//', 1)[1].split('.', 1)[0]
+        codes = statuses[server_id]
+        code = codes[min(calls[server_id], len(codes) - 1)]
+        calls[server_id] += 1
+        return _response({'jobId': 1, 'jobName': 'Load', 'status': code})
+    
+    client._session.request.side_effect = request
+    return calls
+
+
+class TestEPMJobStatus:
+    """Test mapping of EPM status codes to job states."""
+    
+    @pytest.mark.parametrize('code, is_complete, is_error, is_running', [
+        (-1, False, False, True),   # in progress
+        (0, True, False, False),    # success
+        (1, False, True, False),    # error
+        (2, False, False, True),    # cancel pending: still running until it stops
+        (3, False, True, False),    # cancelled
+        (4, False, True, False),    # invalid parameter
+    ])
+    def test_status_code_mapping(self, code, is_complete, is_error, is_running):
+        """Test each documented code maps to exactly one job state."""
+        status = EPMJobStatus.from_response({'jobId': 1, 'jobName': 'Load', 'status': code})
+        
+        assert status.is_complete is is_complete
+        assert status.is_error is is_error
+        assert status.is_running is is_running
+
+
+@pytest.fixture
+def client():
+    """Create EPMOAuthClient with a mocked requests.Session."""
+    client = EPMOAuthClient(
+        token_url='https://login.example.com/oauth2/token',
+        client_id='client',
+        client_secret='secret',
+        servers=SERVERS
+    )
+    client._session = MagicMock()
+    client._session.post.return_value = _response({'access_token': 'token', 'expires_in': 3600})
+    yield client
+    client.close()
+
+
+class TestMultiServerPoll:
+    """Test polling a job across several EPM servers."""
+    
+    def test_running_server_polled_until_complete(self, client):
+        """Test a running server stays in the poll set; finished ones leave it."""
+        calls = _serve_statuses(client, {'planning': [-1, -1, 0], 'fccs': [0]})
+        
+        results = client.poll_multi_server_job(
+            {'planning': 'J1', 'fccs': 'J2'}, poll_interval_seconds=0
+        )
+        
+        assert results['planning'].is_complete
+        assert results['fccs'].is_complete
+        assert calls == {'planning': 3, 'fccs': 1}
+    
+    @pytest.mark.parametrize('code', [1, 3, 4])
+    def test_failed_or_cancelled_job_ends_poll(self, client, code):
+        """Test error, cancelled and invalid-parameter codes are final."""
+        calls = _serve_statuses(client, {'planning': [code]})
+        
+        results = client.poll_multi_server_job({'planning': 'J1'}, poll_interval_seconds=0)
+        
+        assert results['planning'].is_error
+        assert calls == {'planning': 1}
+    
+    def test_timeout_returns_last_status(self, client):
+        """Test a job still running at the timeout is returned as running."""
+        calls = _serve_statuses(client, {'planning': [-1]})
+        
+        results = client.poll_multi_server_job(
+            {'planning': 'J1'}, timeout_minutes=0.001, poll_interval_seconds=0.01
+        )
+        
+        assert results['planning'].is_running
+        assert calls['planning'] > 1
+    
+    def test_shutdown_interrupts_wait(self, client):
+        """Test shutdown() ends a poll waiting between rounds."""
+        _serve_statuses(client, {'planning': [-1]})
+        threading.Timer(0.1, client.shutdown).start()
+        
+        start = time.monotonic()
+        results = client.poll_multi_server_job({'planning': 'J1'}, poll_interval_seconds=30)
+        
+        assert time.monotonic() - start < 5
+        assert results['planning'].is_running
+    
+    def test_shutdown_interrupts_async_wait(self, client):
+        """Test shutdown() also ends the async poll's wait between rounds."""
+        async def aget_job_status(server_id, job_id):
+            return EPMJobStatus.from_response({'jobId': job_id, 'status': -1})
+        
+        client.aget_job_status = aget_job_status
+        threading.Timer(0.1, client.shutdown).start()
+        
+        start = time.monotonic()
+        results = asyncio.run(
+            client.apoll_multi_server_job({'planning': 'J1'}, poll_interval_seconds=30)
+        )
+        
+        assert time.monotonic() - start < 5
+        assert results['planning'].is_running
+    
+    def test_failed_query_is_retried(self, client):
+        """Test a query that raised is repeated on the next round."""
+        calls = _serve_statuses(client, {'planning': [0]})
+        request = client._session.request.side_effect
+        failures = [ConnectionError('reset')]
+        
+        def flaky(method, url, **kwargs):
+            if failures:
+                raise failures.pop()
+            return request(method, url, **kwargs)
+        
+        client._session.request.side_effect = flaky
+        
+        results = client.poll_multi_server_job({'planning': 'J1'}, poll_interval_seconds=0)
+        
+        assert results['planning'].is_complete
+        assert calls == {'planning': 1}
+
+
+class TestTokenCache:
+    """Test OAuth token caching and refresh-ahead."""
+    
+    def test_token_cached_until_refresh_window(self, client):
+        """Test the token is requested once while outside the refresh window."""
+        assert client._get_token() == 'token'
+        assert client._get_token() == 'token'
+        assert client._session.post.call_count == 1
+        # Long-lived tokens refresh TOKEN_REFRESH_AHEAD seconds before expiry
+        assert client._token_refresh_at == pytest.approx(
+            client._token_deadline - client.TOKEN_REFRESH_AHEAD
+        )
+    
+    def test_short_token_refreshes_at_half_lifetime(self, client):
+        """Test tokens shorter than twice the refresh-ahead refresh halfway."""
+        client._session.post.return_value = _response({'access_token': 'token', 'expires_in': 100})
+        
+        client._get_token()
+        
+        assert client._token_refresh_at == pytest.approx(client._token_deadline - 50)
+    
+    def test_refresh_ahead_returns_cached_token(self, client):
+        """Test a token in the refresh window is returned while a new one is fetched."""
+        client._get_token()
+        client._token_refresh_at = time.monotonic() - 1
+        client._session.post.return_value = _response({'access_token': 'fresh', 'expires_in': 3600})
+        
+        assert client._get_token() == 'token'
+        client._refresh_future.result(timeout=2)
+        
+        assert client._session.post.call_count == 2
+        assert client._get_token() == 'fresh'
+    
+    def test_concurrent_callers_fetch_once(self, client):
+        """Test threads without a usable token share one token request."""
+        barrier = threading.Barrier(4)
+        post = client._session.post
+        response = post.return_value
+        
+        def slow_post(*args, **kwargs):
+            time.sleep(0.05)
+            return response
+        
+        post.side_effect = slow_post
+        
+        def get_token():
+            barrier.wait()
+            return client._get_token()
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            tokens = list(executor.map(lambda _: get_token(), range(4)))
+        
+        assert tokens == ['token'] * 4
+        assert post.call_count == 1
+    
+    def test_cached_token_usable_after_close(self, client):
+        """Test a refresh-window lookup after close() returns the cached token."""
+        client._get_token()
+        client.close()
+        client._token_refresh_at = time.monotonic() - 1
+        
+        assert client._get_token() == 'token'
+        assert client._session.post.call_count == 1
+
+
+class TestAsyncMultiServerPoll:
+    """Test the asyncio multi-server poll."""
+    
+    def test_concurrency_bounded_per_host(self):
+        """Test at most ASYNC_MAX_PER_HOST queries run at once on each host."""
+        pytest.importorskip('httpx')
+        servers = {
+            f'{host}{number}': {'name': host, 'base_url': f'https://{host}.example.com/pod{number}'}
+            for host in ('planning', 'fccs')
+            for number in range(6)
+        }
+        client = EPMOAuthClient('https://login.example.com/oauth2/token', 'client', 'secret', servers=servers)
+        client.ASYNC_MAX_PER_HOST = 2
+        in_flight = {'planning': 0, 'fccs': 0}
+        peak = dict(in_flight)
+        
+        async def aget_job_status(server_id, job_id):
+            host = servers[server_id]['name']
+            in_flight[host] += 1
+            peak[host] = max(peak[host], in_flight[host])
+            await asyncio.sleep(0.01)
+            in_flight[host] -= 1
+            return EPMJobStatus.from_response({'jobId': job_id, 'status': 0})
+        
+        client.aget_job_status = aget_job_status
+        try:
+            results = asyncio.run(client.apoll_multi_server_job(
+                {server_id: 'J1' for server_id in servers}, poll_interval_seconds=0
+            ))
+        finally:
+            client.close()
+        
+        assert len(results) == 12
+        assert peak == {'planning': 2, 'fccs': 2}
@@ -2,21 +2,25 @@
 
 import pytest
 import os
-import tempfile
 import json
 import fcntl
 import threading
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import get_context
+import time
 from datetime import datetime
 
-# Add src to path
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
-
 from src.state.manager import StateManager, StateError
 from src.state.models import State, App, Domain
 
 
+def _update_worker(args):
+    """Write ten domains from a separate process, one update at a time like the API."""
+    state_file, number = args
+    manager = StateManager(state_file, durable=False)
+    for i in range(10):
+        manager.update_many([('TestApp', f'Domain_{number}_{i}', 'OK', f'JOB_{number}_{i}')])
+
 class TestDomain:
     """Test Domain data class."""
     
@@ -50,6 +54,14 @@ class TestDomain:
         assert domain.job_id == 'LOAD_001'
         assert domain.duration_sec == 45
 
+    
+    def test_domain_from_partial_dict(self):
+        """Test missing fields fall back to the dataclass defaults."""
+        domain = Domain.from_dict({'job_id': 'JOB_001'})
+        
+        assert domain.status == 'Blank'
+        assert domain.job_id == 'JOB_001'
+        assert domain.updated is None
 
 class TestApp:
     """Test App data class."""
@@ -113,20 +125,14 @@ class TestStateManager:
     """Test StateManager class."""
     
     @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory for state file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
-    
-    @pytest.fixture
-    def manager(self, temp_dir):
+    def manager(self, tmp_path):
         """Create StateManager with temp file."""
-        state_file = temp_dir / 'test_state.json'
-        return StateManager(state_file)
+        state_file = tmp_path / 'test_state.json'
+        return StateManager(state_file, durable=False)
     
-    def test_init_creates_file_if_missing(self, temp_dir):
+    def test_init_creates_file_if_missing(self, tmp_path):
         """Test StateManager creates file if it doesn't exist."""
-        state_file = temp_dir / 'new_state.json'
+        state_file = tmp_path / 'new_state.json'
         manager = StateManager(state_file)
         
         state = manager.read()
@@ -147,6 +153,23 @@ class TestStateManager:
         assert domain.job_id == 'LOAD_001'
         assert domain.updated is not None
     
+    def test_update_keeps_other_domains(self, manager):
+        """Test a single-domain update leaves the rest of the document intact."""
+        manager.update('Planning', 'Actual', 'OK', 'JOB_001')
+        manager.update('FCCS', 'Consolidation', 'Loading', 'JOB_002')
+        before = manager._load()
+        
+        manager.update('Planning', 'Budget', 'Warning', message='Late')
+        
+        with open(manager.state_file, 'r') as f:
+            data = json.load(f)
+        assert data['apps']['Planning']['domains']['Actual']['job_id'] == 'JOB_001'
+        assert data['apps']['Planning']['domains']['Budget']['message'] == 'Late'
+        assert data['apps']['FCCS']['domains']['Consolidation']['status'] == 'Loading'
+        assert data['metadata']['schema_version'] == '1.0'
+        # The previously cached document is not modified in place
+        assert 'Budget' not in before['apps']['Planning']['domains']
+    
     def test_get_all(self, manager):
         """Test getting all statuses."""
         manager.update('Planning', 'Actual', 'OK', 'JOB_001')
@@ -170,10 +193,225 @@ class TestStateManager:
         assert 'Actual' in result['domains']
         assert 'Budget' in result['domains']
     
-    def test_atomic_write(self, manager):
-        """Test atomic write creates temp file then renames."""
+    def test_batch_update(self, manager):
+        """Test batch update accepts objects with update attributes."""
+        from types import SimpleNamespace
+        
+        updates = [
+            SimpleNamespace(app='Planning', domain='Actual', status='OK', job_id='JOB_001', message=None),
+            SimpleNamespace(app='FCCS', domain='Consolidation', status='Loading', job_id=None, message='Running'),
+        ]
+        
+        result = manager.batch_update(updates)
+        
+        assert result['updated_count'] == 2
+        assert manager.read().apps['FCCS'].domains['Consolidation'].message == 'Running'
+    
+    def test_update_many_writes_once(self, manager, monkeypatch):
+        """Test update_many applies all tuples in a single file write."""
+        writes = []
+        original = manager._write_data
+        monkeypatch.setattr(manager, '_write_data', lambda data: (writes.append(1), original(data)))
+        
+        result = manager.update_many([
+            ('Planning', 'Actual', 'OK', 'JOB_001'),
+            ('Planning', 'Budget', 'Loading'),
+            ('FCCS', 'Consolidation', 'Warning', None, 'Late'),
+        ])
+        
+        assert result['updated_count'] == 3
+        assert len(writes) == 1
+        state = manager.read()
+        assert state.apps['Planning'].domains['Actual'].job_id == 'JOB_001'
+        assert state.apps['Planning'].domains['Budget'].job_id is None
+        assert state.apps['FCCS'].domains['Consolidation'].message == 'Late'
+    
+    def test_batch_update_rejects_invalid_status(self, manager):
+        """Test one invalid status rejects the whole batch without writing."""
+        from types import SimpleNamespace
+        
+        manager.update('Planning', 'Actual', 'OK', 'JOB_001')
+        before = manager.version()
+        updates = [
+            SimpleNamespace(app='Planning', domain='Actual', status='Loading', job_id=None, message=None),
+            SimpleNamespace(app='FCCS', domain='Consolidation', status='Done', job_id=None, message=None),
+        ]
+        
+        with pytest.raises(ValueError):
+            manager.batch_update(updates)
+        
+        assert manager.version() == before
+        assert manager.read().apps['Planning'].domains['Actual'].status == 'OK'
+    
+    def test_version_changes_on_write(self, manager):
+        """Test version token changes after every write."""
+        before = manager.version()
+        manager.update('Planning', 'Actual', 'OK', 'JOB_001')
+        after = manager.version()
+        
+        assert before != after
+        assert manager.version() == after
+    
+    def test_read_reuses_parse_until_file_changes(self, manager, monkeypatch):
+        """Test an unchanged file is parsed once, an external write again."""
+        import src.state.manager as manager_module
+        
+        manager.update('Planning', 'Actual', 'OK', 'JOB_001')
+        parses = []
+        real_loads = manager_module._loads
+        monkeypatch.setattr(manager_module, '_loads', lambda data: parses.append(1) or real_loads(data))
+        
+        first = manager.read()
+        first.add_domain('Planning', 'Budget', Domain(status='Loading'))
+        second = manager.read()
+        assert parses == []
+        assert 'Budget' not in second.apps['Planning'].domains
+        
+        StateManager(manager.state_file, durable=False).update('FCCS', 'Consolidation', 'OK')
+        parses.clear()
+        assert 'FCCS' in manager.read().apps
+        assert parses == [1]
+    
+    def test_update_rereads_file_under_lock(self, manager, monkeypatch):
+        """Test an update keeps another process's write the stat token missed."""
+        manager.update('Planning', 'Actual', 'OK', 'JOB_001')
+        StateManager(manager.state_file, durable=False).update('FCCS', 'Consolidation', 'OK')
+        # Same inode, mtime and size as the cached parse: invisible to version()
+        monkeypatch.setattr(manager, 'version', lambda: manager._cache[0])
+        
+        manager.update('Planning', 'Budget', 'Loading')
+        
+        with open(manager.state_file, 'r') as f:
+            data = json.load(f)
+        assert data['apps']['FCCS']['domains']['Consolidation']['status'] == 'OK'
+        assert data['apps']['Planning']['domains']['Budget']['status'] == 'Loading'
+        
+    def test_concurrent_updates_share_writes(self, tmp_path, monkeypatch):
+        """Test updates arriving during a write are committed together."""
+        manager = StateManager(tmp_path / 'test_state.json', multi_process=False, durable=False)
+        writes = []
+        real_write = manager._write_data
+        
+        def slow_write(data):
+            writes.append(1)
+            time.sleep(0.05)
+            real_write(data)
+        
+        monkeypatch.setattr(manager, '_write_data', slow_write)
+        barrier = threading.Barrier(8)
+        
+        def update_domain(number):
+            barrier.wait()
+            manager.update('TestApp', f'Domain_{number}', 'OK')
+        
+        threads = [threading.Thread(target=update_domain, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        assert len(writes) <= 3
+        with open(manager.state_file, 'r') as f:
+            data = json.load(f)
+        assert len(data['apps']['TestApp']['domains']) == 8
+    
+    def test_update_waits_for_lock_file(self, manager):
+        """Test updates hold the fcntl lock file while they read and write."""
+        manager.update('Planning', 'Actual', 'OK')
+        other = os.open(str(manager.state_file.with_suffix('.lock')), os.O_RDWR)
+        fcntl.flock(other, fcntl.LOCK_EX)
+        try:
+            worker = threading.Thread(target=manager.update, args=('Planning', 'Budget', 'OK'))
+            worker.start()
+            worker.join(0.2)
+            assert worker.is_alive()
+            # Simulate another worker process writing while holding the lock
+            StateManager(manager.state_file, multi_process=False, durable=False).update(
+                'FCCS', 'Consolidation', 'OK'
+            )
+        finally:
+            fcntl.flock(other, fcntl.LOCK_UN)
+            os.close(other)
+        worker.join()
+        
+        # The waiting update built on the file written meanwhile
+        state = StateManager(manager.state_file).read()
+        assert 'Budget' in state.apps['Planning'].domains
+        assert 'Consolidation' in state.apps['FCCS'].domains
+    
+    def test_failed_write_is_not_visible(self, manager, monkeypatch):
+        """Test a document whose write failed is not served to readers."""
         manager.update('Planning', 'Actual', 'OK', 'JOB_001')
         
+        def failing_write(data):
+            raise StateError("disk full")
+        
+        monkeypatch.setattr(manager, '_write_data', failing_write)
+        with pytest.raises(StateError):
+            manager.update('Planning', 'Actual', 'Warning')
+        
+        assert manager.read().apps['Planning'].domains['Actual'].status == 'OK'
+    
+    def test_write_behind_coalesces_writes(self, tmp_path, monkeypatch):
+        """Test deferred updates are visible at once and written together."""
+        manager = StateManager(
+            tmp_path / 'deferred_state.json', write_behind=0.05, multi_process=False, durable=False
+        )
+        writes = []
+        real_write = manager._write_data
+        monkeypatch.setattr(manager, '_write_data', lambda data: writes.append(1) or real_write(data))
+        
+        before = manager.version()
+        for i in range(5):
+            manager.update('Planning', f'Domain_{i}', 'OK')
+        
+        assert manager.version() != before
+        assert len(manager.read().apps['Planning'].domains) == 5
+        
+        time.sleep(0.2)
+        
+        assert writes == [1]
+        with open(manager.state_file, 'r') as f:
+            data = json.load(f)
+        assert len(data['apps']['Planning']['domains']) == 5
+    
+    def test_write_behind_rejects_multi_process(self, tmp_path):
+        """Test deferred writes cannot be combined with cross-process locking."""
+        with pytest.raises(ValueError, match='multi_process'):
+            StateManager(tmp_path / 'deferred_state.json', write_behind=0.05)
+    
+    def test_flush_writes_pending_state(self, tmp_path):
+        """Test flush() writes a deferred document immediately."""
+        manager = StateManager(
+            tmp_path / 'deferred_state.json', write_behind=60, multi_process=False, durable=False
+        )
+        manager.update('FCCS', 'Consolidation', 'Loading')
+        assert not manager.state_file.exists()
+        
+        manager.flush()
+        
+        assert 'FCCS' in StateManager(manager.state_file).read().apps
+    
+    def test_large_file_read_via_mmap(self, manager, monkeypatch):
+        """Test files over the mmap threshold parse the same as small ones."""
+        import src.state.manager as manager_module
+        
+        manager.update('Planning', 'Actual', 'OK', 'JOB_001')
+        monkeypatch.setattr(manager_module, 'MMAP_THRESHOLD', 1)
+        
+        state = StateManager(manager.state_file).read()
+        
+        assert state.apps['Planning'].domains['Actual'].job_id == 'JOB_001'
+    
+    def test_atomic_write(self, tmp_path, monkeypatch):
+        """Test atomic write creates temp file, syncs it, then renames."""
+        import src.state.manager as manager_module
+        synced = []
+        monkeypatch.setattr(manager_module, '_datasync', synced.append)
+        manager = StateManager(tmp_path / 'test_state.json')
+        manager.update('Planning', 'Actual', 'OK', 'JOB_001')
+        assert len(synced) == 1
+        
         state_file = manager.state_file
         assert state_file.exists()
         
@@ -185,23 +423,20 @@ class TestStateManager:
         assert 'apps' in data
         assert 'Planning' in data['apps']
     
-    def test_concurrent_access(self, temp_dir):
+    def test_concurrent_access(self, tmp_path):
         """Test file locking prevents corruption during concurrent updates."""
-        state_file = temp_dir / 'concurrent_state.json'
-        manager = StateManager(state_file)
+        state_file = tmp_path / 'concurrent_state.json'
+        manager = StateManager(state_file, durable=False)
         
-        # Run multiple updates in parallel
+        # Run multiple updates in parallel against one shared manager
         def update_domain(number):
-            m = StateManager(state_file)
-            for i in range(10):
-                m.update('TestApp', f'Domain_{number}_{i}', 'OK', f'JOB_{number}_{i}')
+            manager.update_many(
+                ('TestApp', f'Domain_{number}_{i}', 'OK', f'JOB_{number}_{i}')
+                for i in range(10)
+            )
         
-        threads = [threading.Thread(target=update_domain, args=(i,)) for i in range(3)]
-        
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(update_domain, range(3)))
         
         # Verify state file is still valid JSON
         with open(state_file, 'r') as f:
@@ -209,7 +444,21 @@ class TestStateManager:
         
         assert 'apps' in data
         assert 'TestApp' in data['apps']
+        assert len(data['apps']['TestApp']['domains']) == 30
 
+    
+    def test_concurrent_processes(self, tmp_path):
+        """Test updates lock the file across processes without a with-block."""
+        state_file = tmp_path / 'concurrent_state.json'
+        
+        with get_context('spawn').Pool(3) as pool:
+            pool.map(_update_worker, [(state_file, i) for i in range(3)])
+        
+        with open(state_file, 'r') as f:
+            data = json.load(f)
+        
+        # No process overwrote another's domains
+        assert len(data['apps']['TestApp']['domains']) == 30
 
 class TestStateContextManager:
     """Test StateManager context manager."""
@@ -218,7 +467,7 @@ class TestStateContextManager:
     def manager(self, tmp_path):
         """Create StateManager with temp file."""
         state_file = tmp_path / 'context_state.json'
-        return StateManager(state_file)
+        return StateManager(state_file, durable=False)
     
     def test_context_manager_enter_exit(self, manager):
         """Test context manager enters and exits correctly."""
@@ -226,6 +475,72 @@ class TestStateContextManager:
             state = m.read()
             assert state is not None
     
+    def test_lock_file_opened_once(self, manager):
+        """Test the lock file stays open between blocks but is unlocked."""
+        with manager:
+            fd = manager._lock_fd
+        with manager:
+            assert manager._lock_fd == fd
+        
+        # Another open file description can take the lock once released
+        other = os.open(str(manager.state_file.with_suffix('.lock')), os.O_RDWR)
+        try:
+            fcntl.flock(other, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        finally:
+            os.close(other)
+        
+        manager.close()
+        assert manager._lock_fd is None
+    
+    def test_single_process_skips_lock_file(self, tmp_path):
+        """Test single-process managers lock in memory only, re-entrantly."""
+        manager = StateManager(tmp_path / 'context_state.json', multi_process=False, durable=False)
+        
+        with manager:
+            with manager as m:
+                m.update('Planning', 'Actual', 'OK')
+        
+        assert not (tmp_path / 'context_state.lock').exists()
+        assert manager.read().apps['Planning'].domains['Actual'].status == 'OK'
+    
+    def test_directory_fsync_once_per_block(self, tmp_path, monkeypatch):
+        """Test writes in a with-block share one directory fsync at exit."""
+        manager = StateManager(tmp_path / 'context_state.json')
+        monkeypatch.setattr(manager, 'FSYNC_DIRECTORY', True)
+        synced = []
+        monkeypatch.setattr(manager, '_fsync_directory', lambda: synced.append(1))
+        
+        with manager as m:
+            m.update('Planning', 'Actual', 'OK')
+            m.update('Planning', 'Budget', 'OK')
+            assert synced == []
+        assert len(synced) == 1
+        
+        manager.update('FCCS', 'Consolidation', 'OK')
+        assert len(synced) == 2
+    
+    def test_directory_fsync_error_keeps_block_exception(self, tmp_path, monkeypatch):
+        """Test a failing deferred fsync does not replace the block's exception."""
+        manager = StateManager(tmp_path / 'context_state.json')
+        monkeypatch.setattr(manager, 'FSYNC_DIRECTORY', True)
+        
+        def fail():
+            raise OSError('disk gone')
+        
+        monkeypatch.setattr(manager, '_fsync_directory', fail)
+        
+        with pytest.raises(KeyError):
+            with manager as m:
+                m.update('Planning', 'Actual', 'OK')
+                raise KeyError('caller bug')
+        
+        with pytest.raises(StateError, match='sync state directory'):
+            with manager as m:
+                m.update('Planning', 'Budget', 'OK')
+        
+        # Both blocks released the lock
+        assert manager._lock_depth == 0
+    
     def test_context_manager_write(self, manager):
         """Test writing state in context manager."""
         with manager as m: